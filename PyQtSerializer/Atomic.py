@@ -0,0 +1,150 @@
+from contextlib import contextmanager
+from threading import Lock
+import tempfile
+import atexit
+import shutil
+import os
+
+# fsync policies of saved files:
+# "ALWAYS" syncs every save before it replaces the old file and the directory after it,
+# "ON_CLOSE" syncs every save before it replaces the old file and the directory (and journal
+# appends) once in `syncFiles` (called at exit), a power loss can undo the saves since but
+# leaves a whole file. "NEVER" leaves it to the OS, the rename can reach the disk before the
+# data so a power loss can leave an empty or partly written file.
+FSYNC_ALWAYS = "ALWAYS"
+FSYNC_ON_CLOSE = "ON_CLOSE"
+FSYNC_NEVER = "NEVER"
+fsyncPolicies = (FSYNC_ALWAYS, FSYNC_ON_CLOSE, FSYNC_NEVER)
+
+# Files saved with "ON_CLOSE" since the last `syncFiles`
+_unsynced = set()
+_unsyncedLock = Lock()
+_umaskLock = Lock()
+
+
+def checkFsyncPolicy(fsync: str) -> str:
+    if fsync not in fsyncPolicies:
+        raise ValueError(f"Unsupported Fsync Policy <{fsync}>")
+    return fsync
+
+
+def _currentUmask() -> int:
+    """The umask of the process, read from /proc where there is one so it is never changed"""
+    try:
+        with open("/proc/self/status", "r") as status:
+            for line in status:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    # Elsewhere it can only be read by setting it, a file another thread creates meanwhile
+    # gets the most private permissions instead of world writable ones
+    with _umaskLock:
+        umask = os.umask(0o077)
+        os.umask(umask)
+    return umask
+
+
+def _fsyncDirectory(directory: str):
+    """Makes a rename or a new file in `directory` durable"""
+    if os.name == "nt":
+        # Directories can't be opened on Windows, NTFS journals the rename itself
+        return
+    directoryFd = os.open(directory or ".", os.O_RDONLY)
+    try:
+        os.fsync(directoryFd)
+    finally:
+        os.close(directoryFd)
+
+
+@contextmanager
+def atomicWrite(
+    filePath: str,
+    mode: str = "wb",
+    fsync: str = FSYNC_ALWAYS,
+    encoding: str = None,
+    errors: str = None,
+):
+    """
+    Opens a new temp file next to `filePath` for writing and moves it over `filePath` once
+    the block completes, so a crash while writing leaves the previous file whole. Unless the
+    policy is "NEVER" the temp file is synced before the move. The temp file is removed when
+    the block raises.
+    Args:
+        filePath (str): File path
+        mode (str, optional): "wb" or "w". Defaults to "wb".
+        fsync (str, optional): fsync policy, "ALWAYS", "ON_CLOSE" or "NEVER". Defaults to "ALWAYS".
+        encoding (str, optional): Encoding of text mode. Defaults to None.
+        errors (str, optional): Encoding errors of text mode. Defaults to None.
+    """
+    # A unique name so concurrent writers of the same file don't share a temp file
+    tempFd, tempPath = tempfile.mkstemp(
+        prefix=os.path.basename(filePath) + ".",
+        suffix=".tmp",
+        dir=os.path.dirname(filePath) or None,
+    )
+    try:
+        with open(tempFd, mode, encoding=encoding, errors=errors) as tempFile:
+            yield tempFile
+            if fsync != FSYNC_NEVER:
+                tempFile.flush()
+                os.fsync(tempFile.fileno())
+        if os.path.exists(filePath):
+            # A file made private by its user stays private
+            shutil.copymode(filePath, tempPath)
+        else:
+            # mkstemp creates it readable by its owner only
+            os.chmod(tempPath, 0o666 & ~_currentUmask())
+        os.replace(tempPath, filePath)
+    except BaseException:
+        if os.path.exists(tempPath):
+            os.remove(tempPath)
+        raise
+    synced(filePath, fsync, fileSynced=True, created=True)
+
+
+def synced(filePath: str, fsync: str, fileSynced: bool = False, created: bool = False):
+    """
+    Applies the fsync policy to a file that was just written, E.g. appended to.
+    Args:
+        filePath (str): File path
+        fsync (str): fsync policy, "ALWAYS", "ON_CLOSE" or "NEVER"
+        fileSynced (bool, optional): Whether the file's data was already synced. Defaults to False.
+        created (bool, optional): Whether the directory entry of the file is new. Defaults to False.
+    """
+    if fsync == FSYNC_ALWAYS:
+        if not fileSynced:
+            _fsyncFile(filePath)
+        if created:
+            _fsyncDirectory(os.path.dirname(filePath))
+    elif fsync == FSYNC_ON_CLOSE:
+        with _unsyncedLock:
+            _unsynced.add(os.path.abspath(filePath))
+
+
+def _fsyncFile(filePath: str):
+    fileFd = os.open(filePath, os.O_RDWR)
+    try:
+        os.fsync(fileFd)
+    finally:
+        os.close(fileFd)
+
+
+def syncFiles():
+    """
+    Syncs the files saved with the "ON_CLOSE" fsync policy (and their directories) to disk,
+    E.g. when the window closes, it runs at exit anyway. Files removed since are skipped.
+    """
+    with _unsyncedLock:
+        filePaths = list(_unsynced)
+        _unsynced.clear()
+    directories = set()
+    for filePath in filePaths:
+        if os.path.exists(filePath):
+            _fsyncFile(filePath)
+            directories.add(os.path.dirname(filePath))
+    for directory in directories:
+        _fsyncDirectory(directory)
+
+
+atexit.register(syncFiles)
@@ -0,0 +1,733 @@
+from PyQtSerializer.utils import Bytes16, BLOWFISH, getCipher, cipherById
+from PyQtSerializer.Serialize import (
+    initObj,
+    _PendingObject,
+    _initParams,
+    _isArray,
+    _arrayRecord,
+    _arrayFromBuffer,
+)
+from PyQtSerializer.Stats import Stats, stageOf
+from marshal import loads as marshalLoads, dumps as marshalDumps
+from pickle import dumps, loads
+from types import FunctionType
+from functools import partial
+from itertools import chain
+from struct import Struct
+from sys import byteorder
+
+MAGIC = b"PQSB"
+# MAGIC, VERSION and the cipher id come before the value
+VERSION = 1
+
+NONE = 0x00
+BOOL = 0x01
+INT = 0x02
+FLOAT = 0x03
+STR = 0x04
+BYTES = 0x05
+LIST = 0x06
+TUPLE = 0x07
+SET = 0x08
+DICT = 0x09
+FUNCTION = 0x0A
+OBJECT_PICKLE = 0x0B
+OBJECT_NATIVE = 0x0C
+OBJECT_INIT = 0x0D
+PICKLE = 0x0E
+# Varint index of an object already written, objects are numbered in the order they start
+OBJECT_REF = 0x0F
+# Varint index of a string already written, strings are numbered in the order they are first written
+STRING_REF = 0x10
+# Numeric array.array, memoryview or NumPy array: the kind, the byte order, the format,
+# the shape and the raw bytes in C order
+ARRAY = 0x11
+# Set on the tag of a value whose payload is stored as ciphertext
+ENCRYPTED = 0x80
+
+_double = Struct("<d")
+# Returned by `next` when a container has no items left
+_end = object()
+_arrayKinds = ("array", "memoryview", "numpy")
+_byteorders = ("little", "big")
+
+
+def _writeVarint(out: bytearray, value: int):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class BinaryEncoder:
+    """
+    Writes values as a typed tag followed by their payload, values `serialize` would encrypt
+    get the `ENCRYPTED` bit on their tag and a length prefixed raw ciphertext of the payload.
+    The ciphertext size only depends on the payload size, so its room is left in the output and
+    the payloads are encrypted together every `chunkSize` bytes or before the output is written.
+    The flags have the same meaning as in `serialize`, `stats` counts the encrypted values into a `Stats`.
+    """
+
+    flushSize = 1 << 16
+    chunkSize = 1 << 22
+
+    def __init__(
+        self,
+        key: Bytes16,
+        usePickleForClasses: bool = True,
+        encryptCodeObjects: bool = True,
+        encryptStdDataTypes: bool = True,
+        encryptDictNames: bool = True,
+        initObjects: bool = True,
+        encryptStrings: bool = True,
+        encryptNumbers: bool = True,
+        encryptionDepth: int = -1,
+        encryptedObjectTypes: list[object] = [],
+        cipher: str = BLOWFISH,
+        internStrings: bool = False,
+        stats: Stats = None,
+    ) -> None:
+        self.cipher = getCipher(cipher, key)
+        self.usePickleForClasses = usePickleForClasses
+        self.encryptCodeObjects = encryptCodeObjects
+        self.encryptStdDataTypes = encryptStdDataTypes
+        self.encryptDictNames = encryptDictNames
+        self.initObjects = initObjects
+        self.encryptStrings = encryptStrings
+        self.encryptNumbers = encryptNumbers
+        self.encryptionDepth = encryptionDepth
+        self.encryptedObjectTypes = tuple(encryptedObjectTypes)
+        self.internStrings = internStrings
+        self.stats = stats
+        self._fileObj = None
+        self._fileBuffer = None
+        self._memo = {}
+        self._schemas = {}
+        self._strings = {}
+        # (buffer, offset, payload) of the values waiting for their ciphertext
+        self._pending = []
+        self._pendingSize = 0
+
+    def encode(self, data: object) -> bytes:
+        out = bytearray(MAGIC)
+        out.append(VERSION)
+        out.append(self.cipher.id)
+        self._memo = {}
+        self._schemas = {}
+        self._strings = {}
+        self._pending = []
+        self._pendingSize = 0
+        self.encodeValue(data, self.encryptionDepth, out)
+        self._encryptPending()
+        return bytes(out)
+
+    def encodeTo(self, data: object, fileObj):
+        """
+        Writes the same bytes as `encode` to a binary file object, the output is handed over
+        every `flushSize` bytes between container items instead of being built whole.
+        """
+        out = bytearray(MAGIC)
+        out.append(VERSION)
+        out.append(self.cipher.id)
+        self._fileObj = fileObj
+        self._fileBuffer = out
+        self._memo = {}
+        self._schemas = {}
+        self._strings = {}
+        self._pending = []
+        self._pendingSize = 0
+        try:
+            self.encodeValue(data, self.encryptionDepth, out)
+            self._encryptPending()
+            fileObj.write(out)
+        finally:
+            self._fileObj = None
+            self._fileBuffer = None
+            self._pending = []
+            self._pendingSize = 0
+
+    def _flush(self, out: bytearray):
+        # Only the file buffer, encrypted objects are encoded into their own buffer first
+        if (out is self._fileBuffer) and (len(out) >= self.flushSize):
+            self._encryptPending()
+            self._fileObj.write(out)
+            out.clear()
+
+    def encodeValue(self, data, depth: int, out: bytearray):
+        """Writes `data` with an explicit stack so nesting depth is only limited by memory"""
+        # [items, depth of the items, output, whether they are dict items, items written, id()]
+        # of every container being written, or (attributes buffer, output) of an encrypted object
+        stack = []
+        # id() of the containers being written, objects in a cycle are written as references
+        path = set()
+        while True:
+            childDepth = depth - 1 if depth != -1 else -1
+            canEncrypt = (depth > 0) or (depth == -1)
+            if isinstance(data, (list, tuple, set)):
+                if isinstance(data, list):
+                    out.append(LIST)
+                else:
+                    out.append(TUPLE if isinstance(data, tuple) else SET)
+                _writeVarint(out, len(data))
+                if id(data) in path:
+                    raise ValueError("Circular reference")
+                path.add(id(data))
+                stack.append([iter(data), childDepth, out, False, 0, id(data)])
+            elif isinstance(data, dict):
+                out.append(DICT)
+                _writeVarint(out, len(data))
+                if id(data) in path:
+                    raise ValueError("Circular reference")
+                path.add(id(data))
+                # Keys and values alternate
+                stack.append(
+                    [chain.from_iterable(data.items()), childDepth, out, True, 0, id(data)]
+                )
+            elif _isArray(data):
+                self._writeArray(
+                    data,
+                    out,
+                    canEncrypt
+                    and (
+                        self.encryptStdDataTypes
+                        or self.encryptNumbers
+                        or (type(data) in self.encryptedObjectTypes)
+                    ),
+                )
+            elif callable(data):
+                out.append(FUNCTION)
+                self._writeName(data.__name__, depth, out)
+                self._writeLeaf(
+                    marshalDumps(data.__code__), out, canEncrypt and self.encryptCodeObjects
+                )
+            elif hasattr(data, "__dict__"):
+                attrs = self._writeObject(data, depth, childDepth, canEncrypt, out)
+                if attrs is not None:
+                    if attrs is not out:
+                        # Encrypted as one value once all of its attributes are written
+                        stack.append((attrs, out))
+                    data, depth, out = data.__dict__, childDepth, attrs
+                    continue
+            else:
+                encrypt = canEncrypt and (
+                    self.encryptStdDataTypes
+                    or (type(data) in self.encryptedObjectTypes)
+                    or (self.encryptStrings and isinstance(data, str))
+                    or (self.encryptNumbers and isinstance(data, (int, float)))
+                )
+                self._writeLeaf(data, out, encrypt)
+            # The next item, finishing the containers and objects that have none left
+            while stack:
+                frame = stack[-1]
+                if frame.__class__ is tuple:
+                    attrs, out = stack.pop()
+                    # Values encrypted inside it are part of its payload
+                    self._encryptPending()
+                    self._writeEncrypted(attrs[0], memoryview(attrs)[1:], out)
+                    continue
+                items, depth, out, isDict, written, dataId = frame
+                if written and not (isDict and (written % 2)):
+                    self._flush(out)
+                data = next(items, _end)
+                if data is _end:
+                    path.discard(dataId)
+                    stack.pop()
+                    continue
+                frame[4] = written + 1
+                if isDict and not (written % 2) and not self.encryptDictNames:
+                    self._writeLeaf(data, out, False)
+                    continue
+                break
+            else:
+                return
+
+    def _writeObject(
+        self, data, depth: int, childDepth: int, canEncrypt: bool, out: bytearray
+    ) -> bytearray | None:
+        """
+        Writes an object up to its attributes, returns the buffer its attributes are written
+        to (its own one when it is encrypted) or None when nothing follows
+        """
+        refId = self._memo.get(id(data))
+        if refId is not None:
+            out.append(OBJECT_REF)
+            _writeVarint(out, refId)
+            return None
+        refId = self._memo[id(data)] = len(self._memo)
+        encryptObject = canEncrypt and self.encryptCodeObjects
+        if self.usePickleForClasses:
+            out.append(OBJECT_PICKLE)
+            self._writeName(data.__class__.__name__, depth, out)
+            self._writeLeaf(dumps(data), out, encryptObject)
+            return None
+        if self.initObjects:
+            out.append(OBJECT_INIT)
+            self._writeName(data.__class__.__name__, depth, out)
+            schemaId = self._schemas.setdefault(data.__class__, refId)
+            if schemaId != refId:
+                # The parameter names are only written with the first object of a class
+                self._writeLeaf(schemaId, out, False)
+            else:
+                self._writeParams(_initParams(data), childDepth, out)
+        else:
+            out.append(OBJECT_NATIVE)
+            self._writeName(data.__class__.__name__, depth, out)
+        return bytearray() if encryptObject else out
+
+    def _writeParams(self, params: tuple, childDepth: int, out: bytearray):
+        paramDepth = childDepth - 1 if childDepth != -1 else -1
+        encryptParams = ((paramDepth > 0) or (paramDepth == -1)) and (
+            self.encryptStdDataTypes
+            or self.encryptStrings
+            or self.encryptCodeObjects
+            or (str in self.encryptedObjectTypes)
+        )
+        out.append(LIST)
+        _writeVarint(out, len(params))
+        for param in params:
+            self._writeLeaf(param, out, encryptParams)
+
+    def _writeName(self, name: str, depth: int, out: bytearray):
+        self._writeLeaf(
+            name, out, self.encryptDictNames and ((depth > 0) or (depth == -1))
+        )
+
+    def _writeLeaf(self, data, out: bytearray, encrypt: bool):
+        if data is None:
+            out.append(NONE)
+            return
+        payload = bytearray()
+        if isinstance(data, bool):
+            tag = BOOL
+            payload.append(data)
+        elif isinstance(data, int):
+            tag = INT
+            encoded = data.to_bytes((data.bit_length() + 8) // 8, "little", signed=True)
+            _writeVarint(payload, len(encoded))
+            payload += encoded
+        elif isinstance(data, float):
+            tag = FLOAT
+            payload += _double.pack(data)
+        elif isinstance(data, str):
+            if self.internStrings:
+                # Encrypted and plain occurrences are numbered apart so a reference never
+                # points from an encrypted value to a plain one
+                index = self._strings.get((data, encrypt))
+                if index is not None:
+                    out.append(STRING_REF)
+                    _writeVarint(out, index)
+                    return
+                self._strings[data, encrypt] = len(self._strings)
+            tag = STR
+            encoded = data.encode("utf-8")
+            _writeVarint(payload, len(encoded))
+            payload += encoded
+        elif isinstance(data, (bytes, bytearray)):
+            tag = BYTES
+            _writeVarint(payload, len(data))
+            payload += data
+        else:
+            tag = PICKLE
+            encoded = dumps(data)
+            _writeVarint(payload, len(encoded))
+            payload += encoded
+        if encrypt:
+            self._writeEncrypted(tag, payload, out)
+        else:
+            out.append(tag)
+            out += payload
+
+    def _writeArray(self, data, out: bytearray, encrypt: bool):
+        """Writes the raw buffer of an array as one value, encrypted like a number would be"""
+        kind, arrayFormat, shape, buffer = _arrayRecord(data)
+        body = bytearray()
+        body.append(_arrayKinds.index(kind))
+        body.append(_byteorders.index(byteorder))
+        encoded = arrayFormat.encode("ascii")
+        _writeVarint(body, len(encoded))
+        body += encoded
+        _writeVarint(body, len(shape))
+        for size in shape:
+            _writeVarint(body, size)
+        body += buffer
+        payload = bytearray()
+        _writeVarint(payload, len(body))
+        payload += body
+        if encrypt:
+            self._writeEncrypted(ARRAY, payload, out)
+        else:
+            out.append(ARRAY)
+            out += payload
+
+    def _writeEncrypted(self, tag: int, payload, out: bytearray):
+        # Payloads carry their own length so the Blowfish null padding is never read back
+        size = self.cipher.encryptedSize(len(payload))
+        out.append(tag | ENCRYPTED)
+        _writeVarint(out, size)
+        self._pending.append((out, len(out), bytes(payload)))
+        out += bytes(size)
+        self._pendingSize += size
+        if self._pendingSize >= self.chunkSize:
+            self._encryptPending()
+
+    def _encryptPending(self):
+        if not self._pending:
+            return
+        with stageOf(self.stats, "encrypt"):
+            encryptedValues = self.cipher.encryptMany(
+                [payload for _, _, payload in self._pending]
+            )
+        if self.stats is not None:
+            self.stats.leavesEncrypted += len(self._pending)
+        for (out, offset, _), encryptedData in zip(self._pending, encryptedValues):
+            out[offset : offset + len(encryptedData)] = encryptedData
+        self._pending = []
+        self._pendingSize = 0
+
+
+class _Reader:
+    __slots__ = ("buffer", "position")
+
+    def __init__(self, buffer, position: int = 0) -> None:
+        self.buffer = memoryview(buffer)
+        self.position = position
+
+
+def _readVarint(buffer, position: int) -> tuple[int, int]:
+    value = shift = 0
+    end = len(buffer)
+    while True:
+        if position >= end:
+            raise ValueError("Truncated Binary Data")
+        byte = buffer[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+# Tags followed by a length prefixed payload, by a count (of the values that follow or of a
+# reference) or by a payload of a fixed size
+_sizedTags = frozenset((INT, STR, BYTES, PICKLE, ARRAY))
+_countedTags = frozenset((LIST, TUPLE, SET, DICT, OBJECT_REF, STRING_REF))
+_fixedSizes = {
+    NONE: 0,
+    BOOL: 1,
+    FLOAT: 8,
+    FUNCTION: 0,
+    OBJECT_PICKLE: 0,
+    OBJECT_NATIVE: 0,
+    OBJECT_INIT: 0,
+}
+
+
+def _encryptedValues(buffer, position: int) -> tuple[list[int], list]:
+    """
+    Offsets and ciphertext of the encrypted values from `position` on. Values are written
+    with their children right after them so one pass over the tags finds them, values
+    encrypted inside an encrypted object are part of its ciphertext.
+    """
+    buffer = memoryview(buffer)
+    offsets = []
+    encryptedValues = []
+    bufferEnd = len(buffer)
+    while position < bufferEnd:
+        tag = buffer[position]
+        position += 1
+        if tag & ENCRYPTED:
+            size, position = _readVarint(buffer, position)
+            offsets.append(position)
+            encryptedValues.append(buffer[position : position + size])
+            position += size
+        elif tag in _sizedTags:
+            size, position = _readVarint(buffer, position)
+            position += size
+        elif tag in _countedTags:
+            _, position = _readVarint(buffer, position)
+        elif tag in _fixedSizes:
+            position += _fixedSizes[tag]
+        else:
+            raise ValueError(f"Unknown Binary Tag <{tag}>")
+    if position > bufferEnd:
+        raise ValueError("Truncated Binary Data")
+    return offsets, encryptedValues
+
+
+def _decodeArray(body: memoryview):
+    kind, arrayByteorder = _arrayKinds[body[0]], _byteorders[body[1]]
+    size, position = _readVarint(body, 2)
+    arrayFormat = str(body[position : position + size], "ascii")
+    dimensions, position = _readVarint(body, position + size)
+    shape = []
+    for _ in range(dimensions):
+        size, position = _readVarint(body, position)
+        shape.append(size)
+    # Copied so the array is writable like one the other formats load
+    return _arrayFromBuffer(
+        kind, arrayFormat, shape, arrayByteorder, memoryview(bytearray(body[position:]))
+    )
+
+
+class _Frame:
+    """A value being decoded whose `count` children follow, `build` makes it from their values"""
+
+    __slots__ = ("count", "start", "build", "reader")
+
+    def __init__(self, count: int, build) -> None:
+        self.count = count
+        self.start = 0
+        self.build = build
+        # (buffer, position, decrypted) to go back to once it is built when it was read
+        # from its decrypted payload
+        self.reader = None
+
+
+def _buildDict(values: list) -> dict:
+    items = iter(values)
+    return dict(zip(items, items))
+
+
+_containerBuilds = {LIST: None, TUPLE: tuple, SET: set}
+
+
+class BinaryDecoder:
+    """
+    Reads data written by `BinaryEncoder`, the options have the same meaning as in `deserialize`.
+    The encrypted values are decrypted together before the data is decoded, the data is decoded
+    with an explicit stack so nesting depth is only limited by memory.
+    """
+
+    def __init__(
+        self,
+        key: Bytes16,
+        classDict: dict = dict(),
+        setAttrsAfterInit: bool = False,
+        initObjects: bool = False,
+        returnGlobalsForPickle: bool = False,
+        stats: Stats = None,
+    ) -> None:
+        self.key = key
+        self.cipher = None
+        self.classDict = classDict
+        self.setAttrsAfterInit = setAttrsAfterInit
+        self.initObjects = initObjects
+        self.returnGlobalsForPickle = returnGlobalsForPickle
+        self.stats = stats
+        self._objects = []
+        self._schemas = {}
+        self._strings = []
+
+    def decode(self, data: bytes) -> object:
+        if bytes(data[: len(MAGIC)]) != MAGIC:
+            raise ValueError("Not A PyQtSerializer Binary File")
+        if len(data) < len(MAGIC) + 2:
+            raise ValueError("Truncated Binary Data")
+        version = data[len(MAGIC)]
+        if version != VERSION:
+            raise ValueError(f"Unsupported Binary Format Version <{version}>")
+        position = len(MAGIC) + 2
+        self.cipher = getCipher(cipherById(data[position - 1]), self.key)
+        self._objects = []
+        self._schemas = {}
+        self._strings = []
+        offsets, encryptedValues = _encryptedValues(data, position)
+        with stageOf(self.stats, "decrypt"):
+            decrypted = dict(zip(offsets, self.cipher.decryptMany(encryptedValues)))
+        try:
+            return self.decodeValue(_Reader(data, position), decrypted)
+        finally:
+            self._objects = []
+            self._schemas = {}
+            self._strings = []
+
+    def _decodeParams(self, refId: int, params) -> tuple[list, frozenset]:
+        if isinstance(params, int):
+            if params not in self._schemas:
+                raise ValueError(f"Unknown Object Parameters Reference <{params}>")
+            return self._schemas[params]
+        schema = self._schemas[refId] = (params, frozenset(params))
+        return schema
+
+    def decodeValue(self, reader: _Reader, decrypted: dict = None):
+        """
+        Decodes the value at the reader's position, `decrypted` holds the payloads of its
+        encrypted values by the offset of their ciphertext, the others are decrypted when read.
+        """
+        frames = []
+        values = []
+        strings = self._strings
+        buffer, position = reader.buffer, reader.position
+        bufferEnd = len(buffer)
+        while True:
+            if position >= bufferEnd:
+                raise ValueError("Truncated Binary Data")
+            tag = buffer[position]
+            position += 1
+            outer = None
+            if tag & ENCRYPTED:
+                size, position = _readVarint(buffer, position)
+                end = position + size
+                if end > bufferEnd:
+                    raise ValueError("Truncated Binary Data")
+                payload = decrypted.pop(position, None) if decrypted is not None else None
+                if payload is None:
+                    payload = self.cipher.decrypt(buffer[position:end])
+                # The value is read from its payload, then reading goes on after its ciphertext
+                outer = (buffer, end, decrypted)
+                buffer, position, decrypted = memoryview(payload), 0, None
+                bufferEnd = len(buffer)
+                tag &= ~ENCRYPTED
+            if tag in _sizedTags:
+                if position >= bufferEnd:
+                    raise ValueError("Truncated Binary Data")
+                size = buffer[position]
+                if size < 0x80:
+                    position += 1
+                else:
+                    size, position = _readVarint(buffer, position)
+                end = position + size
+                if end > bufferEnd:
+                    raise ValueError("Truncated Binary Data")
+                if tag == STR:
+                    value = str(buffer[position:end], "utf-8")
+                    strings.append(value)
+                elif tag == INT:
+                    value = int.from_bytes(buffer[position:end], "little", signed=True)
+                elif tag == BYTES:
+                    value = bytes(buffer[position:end])
+                elif tag == ARRAY:
+                    value = _decodeArray(buffer[position:end])
+                else:
+                    value = loads(buffer[position:end])
+                position = end
+            elif tag == FLOAT:
+                end = position + 8
+                if end > bufferEnd:
+                    raise ValueError("Truncated Binary Data")
+                value = _double.unpack(buffer[position:end])[0]
+                position = end
+            elif tag == BOOL:
+                if position >= bufferEnd:
+                    raise ValueError("Truncated Binary Data")
+                value = bool(buffer[position])
+                position += 1
+            elif tag == NONE:
+                value = None
+            elif tag in _countedTags:
+                count, position = _readVarint(buffer, position)
+                if tag == STRING_REF:
+                    if count >= len(strings):
+                        raise ValueError(f"Unknown String Reference <{count}>")
+                    value = strings[count]
+                elif tag == OBJECT_REF:
+                    if count >= len(self._objects):
+                        raise ValueError(f"Unknown Object Reference <{count}>")
+                    value = self._objects[count]
+                    if isinstance(value, _PendingObject):
+                        value = value.allocate()
+                elif tag == DICT:
+                    value = _Frame(count * 2, _buildDict)
+                else:
+                    value = _Frame(count, _containerBuilds[tag])
+            else:
+                value = self._startObject(tag)
+            if value.__class__ is _Frame:
+                value.start = len(values)
+                value.reader = outer
+                frames.append(value)
+            else:
+                if outer is not None:
+                    buffer, position, decrypted = outer
+                    bufferEnd = len(buffer)
+                values.append(value)
+            # Builds the values whose children are all decoded
+            while frames and (len(values) - frames[-1].start == frames[-1].count):
+                frame = frames.pop()
+                children = values[frame.start :]
+                del values[frame.start :]
+                value = children if frame.build is None else frame.build(children)
+                if value.__class__ is _Frame:
+                    # Read in more than one step, E.g. an object's attributes after its parameters
+                    value.start = frame.start
+                    value.reader = frame.reader
+                    frames.append(value)
+                    continue
+                if frame.reader is not None:
+                    buffer, position, decrypted = frame.reader
+                    bufferEnd = len(buffer)
+                values.append(value)
+            if not frames:
+                reader.position = position
+                return values[0]
+
+    def _startObject(self, tag: int) -> _Frame:
+        if tag == FUNCTION:
+            return _Frame(
+                2, lambda values: FunctionType(marshalLoads(values[1]), self.classDict, values[0])
+            )
+        elif tag == OBJECT_PICKLE:
+            refId = len(self._objects)
+            self._objects.append(None)
+
+            def buildPickle(values: list):
+                name, obj = values[0], loads(values[1])
+                self._objects[refId] = obj = (
+                    (obj, self.classDict, name) if self.returnGlobalsForPickle else obj
+                )
+                return obj
+
+            return _Frame(2, buildPickle)
+        elif tag == OBJECT_NATIVE:
+            # Registered before its attributes are read so references from inside them resolve
+            obj = {}
+            self._objects.append(obj)
+
+            def buildNative(values: list):
+                obj.update(values[1])
+                return obj
+
+            return _Frame(2, buildNative)
+        elif tag == OBJECT_INIT:
+            refId = len(self._objects)
+            self._objects.append(None)
+            return _Frame(2, partial(self._buildInit, refId))
+        raise ValueError(f"Unknown Binary Tag <{tag}>")
+
+    def _buildInit(self, refId: int, values: list) -> _Frame:
+        """Reads the attributes of an init object once its name and parameters are read"""
+        name = values[0]
+        params, paramSet = self._decodeParams(refId, values[1])
+        if not self.initObjects:
+            record = {}
+            self._objects[refId] = obj = {name: record}
+
+            def buildRecord(values: list):
+                record["data"], record["params"] = values[0], list(params)
+                return obj
+
+            return _Frame(1, buildRecord)
+        pending = self._objects[refId] = _PendingObject(self.classDict.get(name))
+
+        def buildObject(values: list):
+            self._objects[refId] = obj = initObj(
+                name, self.classDict, values[0], paramSet, self.setAttrsAfterInit, pending.obj
+            )
+            return obj
+
+        return _Frame(1, buildObject)
+
+
+def encodeBinary(data: object, key: Bytes16, *args, **kwargs) -> bytes:
+    """
+    Encodes data into the binary format, the arguments after `key` are the `serialize` flags.
+    """
+    return BinaryEncoder(key, *args, **kwargs).encode(data)
+
+
+def decodeBinary(data: bytes, key: Bytes16, *args, **kwargs) -> object:
+    """
+    Decodes data written by `encodeBinary`, the arguments after `key` are the `deserialize` options
+    from `classDict` on.
+    """
+    return BinaryDecoder(key, *args, **kwargs).decode(data)
@@ -0,0 +1,107 @@
+from PyQtSerializer.utils import Bytes16, BLOWFISH, IntegrityError, getCipher, cipherById
+from PyQtSerializer.Stats import Stats, stageOf
+from struct import Struct
+
+try:
+    from Crypto import Random
+except:
+    from Cryptodome import Random
+
+# Encrypted document: MAGIC, VERSION, the save format and the cipher id, the nonce, the
+# document encrypted as one stream and the tag of the authenticated ciphers (none for Blowfish).
+# The document is the file the save format would write without encryption.
+MAGIC = b"PQSD"
+VERSION = 1
+_formats = {"JSON": 1, "PICKLE": 2, "YAML": 3, "BINARY": 4}
+_header = Struct("<4sBBB")
+
+
+class DocumentWriter:
+    """
+    Binary file object wrapper that encrypts everything written to it as one document,
+    text is written as UTF-8. The writes are encrypted every `flushSize` bytes so the
+    document is never held whole, `close` writes the tag. `stats` gets the encryption time.
+    """
+
+    flushSize = 1 << 16
+
+    def __init__(
+        self,
+        fileObj,
+        saveFormat: str,
+        key: Bytes16,
+        cipher: str = BLOWFISH,
+        stats: Stats = None,
+    ) -> None:
+        if saveFormat not in _formats:
+            raise ValueError(f"Unsupported Encrypted Document Format <{saveFormat}>")
+        self.fileObj = fileObj
+        self.cipher = getCipher(cipher, key)
+        self.stats = stats
+        nonce = Random.get_random_bytes(self.cipher.nonceSize)
+        self._stream = self.cipher.newStream(nonce)
+        self._buffer = bytearray()
+        fileObj.write(_header.pack(MAGIC, VERSION, _formats[saveFormat], self.cipher.id))
+        fileObj.write(nonce)
+
+    def write(self, data) -> int:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self._buffer += data
+        if len(self._buffer) >= self.flushSize:
+            self._flush()
+        return len(data)
+
+    def _flush(self):
+        with stageOf(self.stats, "encrypt"):
+            encryptedData = self._stream.encrypt(self._buffer)
+        self.fileObj.write(encryptedData)
+        self._buffer.clear()
+
+    def close(self):
+        self._flush()
+        if self.cipher.tagSize:
+            self.fileObj.write(self._stream.digest())
+
+    def __enter__(self) -> "DocumentWriter":
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        if excType is None:
+            self.close()
+
+
+def decryptDocument(data: bytes, saveFormat: str, key: Bytes16) -> bytes:
+    """
+    Decrypts a document written by `DocumentWriter` in one call, the cipher is read from its header.
+    Args:
+        data (bytes): Encrypted document
+        saveFormat (str): "JSON", "PICKLE", "YAML" or "BINARY", the format it was saved as
+        key (Bytes16): Encryption key
+    Returns:
+        bytes: The document
+    """
+    if len(data) < _header.size:
+        raise ValueError("Not A PyQtSerializer Encrypted Document")
+    magic, version, fileFormat, cipherId = _header.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not A PyQtSerializer Encrypted Document")
+    if version != VERSION:
+        raise ValueError(f"Unsupported Encrypted Document Version <{version}>")
+    if fileFormat != _formats.get(saveFormat):
+        raise ValueError(f"Encrypted Document Was Not Saved As <{saveFormat}>")
+    cipher = getCipher(cipherById(cipherId), key)
+    data = memoryview(data)
+    start = _header.size + cipher.nonceSize
+    end = len(data) - cipher.tagSize
+    if end < start:
+        raise IntegrityError(f"Truncated {cipher.name} Document")
+    stream = cipher.newStream(bytes(data[_header.size : start]))
+    if not cipher.tagSize:
+        return stream.decrypt(data[start:end])
+    try:
+        return stream.decrypt_and_verify(data[start:end], data[end:])
+    except ValueError as e:
+        raise IntegrityError(
+            f"{cipher.name} Document Was Modified Or Encrypted With Another Key"
+        ) from e
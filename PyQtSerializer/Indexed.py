@@ -0,0 +1,185 @@
+from PyQtSerializer.utils import Bytes16
+from PyQtSerializer.Serialize import _Deferred, _isMarkerRecord
+from PyQtSerializer.Yaml import dumpYaml, loadYaml
+from PyQtSerializer.Atomic import atomicWrite, FSYNC_ALWAYS
+from pickle import dumps, loads
+from struct import Struct
+import json
+import mmap
+import os
+
+# Indexed file: MAGIC, VERSION and the save format, the records back to back, the index and
+# the trailer (index offset, index size, MAGIC) so the index is found from the end of the file.
+# The index is the serialized data down to `indexDepth` levels of dicts and lists with
+# [RECORD_NODE, offset, size] in place of the values below, each record is one serialized
+# value encoded like a whole file of its save format.
+MAGIC = b"PQSI"
+VERSION = 1
+_formats = {"JSON": 1, "PICKLE": 2, "YAML": 3}
+_header = Struct("<4sBB")
+_trailer = Struct("<QQ4s")
+
+DICT_NODE = "d"
+LIST_NODE = "l"
+TUPLE_NODE = "t"
+RECORD_NODE = "r"
+
+indexDepth = 3
+
+
+def _encode(data: object, saveFormat: str) -> bytes:
+    if saveFormat == "JSON":
+        return json.dumps(data).encode("utf-8")
+    elif saveFormat == "YAML":
+        return dumpYaml(data).encode("utf-8")
+    return dumps(data)
+
+
+def _decode(data: bytes, saveFormat: str) -> object:
+    if saveFormat == "JSON":
+        return json.loads(data)
+    elif saveFormat == "YAML":
+        return loadYaml(data.decode("utf-8"))
+    return loads(data)
+
+
+class _IndexWriter:
+    __slots__ = ("fileObj", "offset", "saveFormat", "key", "tagged")
+
+    def __init__(self, fileObj, saveFormat: str, key: Bytes16, tagged: bool) -> None:
+        self.fileObj = fileObj
+        self.offset = _header.size
+        self.saveFormat = saveFormat
+        self.key = key
+        self.tagged = tagged
+
+    def node(self, data, level: int) -> list:
+        if level < indexDepth:
+            if data.__class__ is dict and not _isMarkerRecord(data, self.key, self.tagged):
+                return [
+                    DICT_NODE,
+                    [[k, self.node(v, level + 1)] for k, v in data.items()],
+                ]
+            elif data.__class__ in (list, tuple):
+                return [
+                    LIST_NODE if data.__class__ is list else TUPLE_NODE,
+                    [self.node(item, level + 1) for item in data],
+                ]
+        record = _encode(data, self.saveFormat)
+        self.fileObj.write(record)
+        self.offset += len(record)
+        return [RECORD_NODE, self.offset - len(record), len(record)]
+
+
+def writeIndexed(
+    data: object,
+    filePath: str,
+    saveFormat: str,
+    key: Bytes16 = None,
+    tagged: bool = False,
+    fsync: str = FSYNC_ALWAYS,
+) -> str:
+    """
+    Writes serialized data as an indexed file, written next to `filePath` and moved over it
+    so an `IndexedFile` still mapping the old file keeps reading it.
+    Args:
+        data (object): Serialized data
+        filePath (str): File path
+        saveFormat (str): "JSON", "PICKLE" or "YAML", the encoding of each record and the index
+        key (Bytes16, optional): Key the data was serialized with, to tell object records from dicts. Defaults to None.
+        tagged (bool, optional): Whether the data was serialized with `tagged=True`. Defaults to False.
+        fsync (str, optional): fsync policy (see `atomicWrite`). Defaults to "ALWAYS".
+    Returns:
+        str: File path
+    """
+    if saveFormat not in _formats:
+        raise ValueError(f"Unsupported Indexed File Format <{saveFormat}>")
+    with atomicWrite(filePath, "wb", fsync) as indexedFile:
+        indexedFile.write(_header.pack(MAGIC, VERSION, _formats[saveFormat]))
+        writer = _IndexWriter(indexedFile, saveFormat, key, tagged)
+        index = _encode(writer.node(data, 0), saveFormat)
+        indexedFile.write(index)
+        indexedFile.write(_trailer.pack(writer.offset, len(index), MAGIC))
+    return filePath
+
+
+class _Record(_Deferred):
+    __slots__ = ("indexedFile", "offset", "size")
+
+    def __init__(self, indexedFile: "IndexedFile", offset: int, size: int) -> None:
+        self.indexedFile = indexedFile
+        self.offset = offset
+        self.size = size
+
+    def load(self):
+        return self.indexedFile.read(self.offset, self.size)
+
+
+class IndexedFile(_Deferred):
+    """
+    File written by `writeIndexed` opened with `mmap`, only the index is read when it is opened.
+    Given to `deserialize(..., lazy=True)` a record is read and parsed the first time a lazy
+    container reaches it, `load` reads the whole serialized data. The map stays open until
+    `close` (or the end of a `with` block), `detach` before the file is replaced.
+    """
+
+    def __init__(self, filePath: str, saveFormat: str) -> None:
+        with open(filePath, "rb") as indexedFile:
+            size = os.fstat(indexedFile.fileno()).st_size
+            if size < _header.size + _trailer.size:
+                raise ValueError("Not A PyQtSerializer Indexed File")
+            self._map = mmap.mmap(indexedFile.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, fileFormat = _header.unpack_from(self._map)
+        indexOffset, indexSize, endMagic = _trailer.unpack_from(
+            self._map, size - _trailer.size
+        )
+        if (magic != MAGIC) or (endMagic != MAGIC):
+            self._map.close()
+            raise ValueError("Not A PyQtSerializer Indexed File")
+        if version != VERSION:
+            self._map.close()
+            raise ValueError(f"Unsupported Indexed File Version <{version}>")
+        if fileFormat != _formats.get(saveFormat):
+            self._map.close()
+            raise ValueError(f"Indexed File Was Not Saved As <{saveFormat}>")
+        self.saveFormat = saveFormat
+        self._index = self.read(indexOffset, indexSize)
+
+    def read(self, offset: int, size: int) -> object:
+        """Returns the record at `offset`, only its bytes are read from the file"""
+        return _decode(self._map[offset : offset + size], self.saveFormat)
+
+    def _build(self, node: list, load: bool):
+        kind = node[0]
+        if kind == RECORD_NODE:
+            return self.read(node[1], node[2]) if load else _Record(self, node[1], node[2])
+        elif kind == DICT_NODE:
+            return {k: self._build(v, load) for k, v in node[1]}
+        items = [self._build(item, load) for item in node[1]]
+        return tuple(items) if kind == TUPLE_NODE else items
+
+    def load(self):
+        return self._build(self._index, True)
+
+    def lazy(self):
+        return self._build(self._index, False)
+
+    def detach(self):
+        """
+        Copies the file into memory and closes the map, records are then read from the copy.
+        A mapped file can't be replaced on Windows, so it is detached before it is saved over.
+        """
+        if isinstance(self._map, mmap.mmap):
+            data = self._map[:]
+            self._map.close()
+            self._map = data
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+
+    def __enter__(self) -> "IndexedFile":
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
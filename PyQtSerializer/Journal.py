@@ -0,0 +1,216 @@
+from PyQtSerializer.Yaml import dumpYaml, loadYamlAll
+from PyQtSerializer.Atomic import synced, FSYNC_ALWAYS
+from copy import deepcopy
+from pickle import dumps, load, loads, UnpicklingError
+from io import BytesIO
+from struct import Struct
+import json
+import os
+
+_recordSize = Struct("<I")
+
+
+def appendRecord(
+    record: object,
+    filePath: str,
+    saveFormat: str,
+    hex: bool = False,
+    fsync: str = FSYNC_ALWAYS,
+) -> int:
+    """
+    Appends one record to a journal file in the append friendly form of `saveFormat`,
+    JSON lines, YAML documents, consecutive pickles or size prefixed binary records.
+    Args:
+        record (object): Record to append
+        filePath (str): Journal file path
+        saveFormat (str): "JSON", "YAML", "PICKLE" or "BINARY" (`record` is then already encoded bytes)
+        hex (bool, optional): Whether pickles are written as hex lines. Defaults to False.
+        fsync (str, optional): fsync policy of the append (see `atomicWrite`). Defaults to "ALWAYS".
+    Returns:
+        int: Size of the journal file after the append
+    """
+    if saveFormat == "JSON":
+        data = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+    elif saveFormat == "YAML":
+        # The document end marks the record as whole, see `_parseRecords`
+        data = dumpYaml(record, explicit_start=True, explicit_end=True).encode("utf-8")
+    elif saveFormat == "BINARY":
+        data = _recordSize.pack(len(record)) + record
+    elif hex:
+        data = (dumps(record).hex() + "\n").encode("utf-8")
+    else:
+        data = dumps(record)
+    created = not os.path.exists(filePath)
+    with open(filePath, "ab") as journalFile:
+        journalFile.write(data)
+        size = journalFile.tell()
+        if fsync == FSYNC_ALWAYS:
+            journalFile.flush()
+            os.fsync(journalFile.fileno())
+    synced(filePath, fsync, fileSynced=True, created=created)
+    return size
+
+
+def readRecords(filePath: str, saveFormat: str, hex: bool = False) -> list:
+    """
+    Reads every record of a journal file written by `appendRecord`, a missing file has no records.
+    A torn last record (the process died while appending it) is dropped and cut off the file,
+    so the next record is appended after the last whole one.
+    Args:
+        filePath (str): Journal file path
+        saveFormat (str): "JSON", "YAML", "PICKLE" or "BINARY" (records are then returned still encoded)
+        hex (bool, optional): Whether pickles were written as hex lines. Defaults to False.
+    Returns:
+        list: Records in the order they were appended
+    """
+    if not os.path.exists(filePath):
+        return []
+    with open(filePath, "rb") as journalFile:
+        data = journalFile.read()
+    records, end = _parseRecords(data, saveFormat, hex)
+    if end < len(data):
+        with open(filePath, "r+b") as journalFile:
+            journalFile.truncate(end)
+    return records
+
+
+def _parseRecords(data: bytes, saveFormat: str, hex: bool) -> tuple[list, int]:
+    """Returns the whole records of a journal and the offset where the last one ends"""
+    if (saveFormat == "JSON") or ((saveFormat != "YAML") and (saveFormat != "BINARY") and hex):
+        # A line is whole once its newline is written
+        end = data.rfind(b"\n") + 1
+        lines = [line for line in data[:end].splitlines() if line.strip()]
+        if saveFormat == "JSON":
+            return [json.loads(line) for line in lines], end
+        return [loads(bytes.fromhex(line.decode())) for line in lines], end
+    elif saveFormat == "YAML":
+        end = data.rfind(b"\n...\n")
+        if end == -1:
+            return [], 0
+        end += 5
+        return loadYamlAll(data[:end].decode("utf-8")), end
+    elif saveFormat == "BINARY":
+        records = []
+        position = 0
+        while position + _recordSize.size <= len(data):
+            (size,) = _recordSize.unpack_from(data, position)
+            if position + _recordSize.size + size > len(data):
+                break
+            position += _recordSize.size
+            records.append(data[position : position + size])
+            position += size
+        return records, position
+    records = []
+    end = 0
+    stream = BytesIO(data)
+    while end < len(data):
+        try:
+            records.append(load(stream))
+        except (EOFError, UnpicklingError):
+            break
+        end = stream.tell()
+    return records, end
+
+
+def removeJournal(filePath: str):
+    if os.path.exists(filePath):
+        os.remove(filePath)
+
+
+class JournalState:
+    """
+    Last saved widget properties and settings, used to work out the delta record of a dump.
+    """
+
+    def __init__(self, data: list) -> None:
+        self.widgets: dict[str, dict] = {}
+        self.settings: dict = {}
+        for info in data:
+            if not isinstance(info, dict):
+                continue
+            if info.get("widgetType"):
+                self.widgets[info.get("objectName")] = dict(info["serializedData"])
+            else:
+                self.settings = deepcopy(info.get("_settings", {}))
+
+    def delta(self, widgInfos: list[dict], settings: dict) -> list | None:
+        """
+        Returns the record of what changed since the last dump and takes the new values as saved,
+        None when nothing changed.
+        Args:
+            widgInfos (list[dict]): Widget records of the widgets that may have changed
+            settings (dict): Current `_settings` dict
+        """
+        record = []
+        for widgInfo in widgInfos:
+            objectName = widgInfo["objectName"]
+            savedData = self.widgets.get(objectName)
+            if savedData is None:
+                self.widgets[objectName] = dict(widgInfo["serializedData"])
+                record.append(widgInfo)
+                continue
+            changedData = {
+                key: value
+                for key, value in widgInfo["serializedData"].items()
+                if key not in savedData or savedData[key] != value
+            }
+            if changedData:
+                savedData.update(changedData)
+                record.append(
+                    {
+                        "objectName": objectName,
+                        "serializedData": changedData,
+                        "widgetType": widgInfo["widgetType"],
+                    }
+                )
+        settings = settings["_settings"]
+        changedSettings = {
+            name: value
+            for name, value in settings.items()
+            if name not in self.settings or self.settings[name] != value
+        }
+        deletedSettings = [name for name in self.settings if name not in settings]
+        if not (record or changedSettings or deletedSettings):
+            return None
+        for name in deletedSettings:
+            del self.settings[name]
+        self.settings.update(deepcopy(changedSettings))
+        record.append({"_settings": changedSettings, "_deletedSettings": deletedSettings})
+        return record
+
+
+def applyRecord(data: list, record: list) -> list:
+    """
+    Replays a journal record over deserialized dump data.
+    Args:
+        data (list): Widget records followed by the settings dict
+        record (list): Record written by a journal dump
+    Returns:
+        list: `data` with the record applied
+    """
+    widgInfos = {
+        info.get("objectName"): info
+        for info in data
+        if isinstance(info, dict) and info.get("widgetType")
+    }
+    if data and isinstance(data[-1], dict) and not data[-1].get("widgetType"):
+        settings = data.pop()
+    else:
+        settings = {"_settings": {}}
+    for entry in record:
+        if entry.get("widgetType"):
+            widgInfo = widgInfos.get(entry["objectName"])
+            if widgInfo is None:
+                widgInfo = widgInfos[entry["objectName"]] = {
+                    "objectName": entry["objectName"],
+                    "serializedData": {},
+                    "widgetType": entry["widgetType"],
+                }
+                data.append(widgInfo)
+            widgInfo["serializedData"].update(entry["serializedData"])
+        else:
+            settings["_settings"].update(entry.get("_settings", {}))
+            for name in entry.get("_deletedSettings", []):
+                settings["_settings"].pop(name, None)
+    data.append(settings)
+    return data
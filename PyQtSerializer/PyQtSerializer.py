@@ -1,26 +1,28 @@
-from qtpy.QtCore import QObject, QDate, QModelIndex
+from qtpy.QtCore import QObject
 from PyQtSerializer.Serializer import *
-from qtpy.QtGui import QKeySequence
-from qtpy.QtWidgets import (
-    QTableWidgetItem,
-    QAbstractSpinBox,
-    QKeySequenceEdit,
-    QAbstractSlider,
-    QTableWidget,
-    QColorDialog,
-    QTextBrowser,
-    QProgressBar,
-    QMainWindow,
-    QListWidget,
-    QLCDNumber,
-    QTableView,
-    QListView,
-    QComboBox,
-    QDateEdit,
-    QLineEdit,
-    QWidget,
-    QDialog
+from PyQtSerializer.Serialize import LazyDict, materialize, parseLiteral, externStrings
+from PyQtSerializer.Stats import Stats, stageOf, instrumented
+from PyQtSerializer.Widgets import (
+    connectChangeSignals,
+    connectModelSignals,
+    modelOf,
+    indexWidgets,
+    restoreWidget,
+    extractWidget,
 )
+from PyQtSerializer.Journal import (
+    JournalState,
+    appendRecord,
+    applyRecord,
+    readRecords,
+    removeJournal,
+)
+from qtpy.QtWidgets import QWidget
+from concurrent.futures import Future, ThreadPoolExecutor
+from copy import deepcopy
+from functools import partial
+from threading import Lock
+import os
 
 
 class PyQtSerializer(Serializer):
@@ -31,7 +33,7 @@ class PyQtSerializer(Serializer):
         target: QObject = None,
         savePath: str = default,
         defaultObjectNamesByQt: bool = False,
-        saveFormat: Literal["JSON", "PICKLE", "YAML"] = "YAML",
+        saveFormat: Literal["JSON", "PICKLE", "YAML", "BINARY"] = "YAML",
         serializeData: bool = False,
         usePickleForClasses: bool = False,
         encryptCodeObjects: bool = False,
@@ -49,6 +51,19 @@ class PyQtSerializer(Serializer):
         setAttrsAfterInit: bool = False,
         parseDigits: bool = False,
         returnGlobalsForPickle: bool = False,
+        incrementalDump: bool = False,
+        journal: bool = False,
+        journalMaxRecords: int = 200,
+        journalMaxBytes: int = 1 << 20,
+        lazyLoad: bool = False,
+        tagged: bool = False,
+        columnar: bool = False,
+        indexed: bool = False,
+        cipher: str = BLOWFISH,
+        encryptDocument: bool = False,
+        internStrings: bool = False,
+        instrument: Callable[[Stats], None] = None,
+        fsync: Literal["ALWAYS", "ON_CLOSE", "NEVER"] = "ALWAYS",
     ) -> None:
         """
         ### Serialize input data into a format suitable for secure-storage/transmission or supporting non-default supported objects.
@@ -56,7 +71,7 @@ class PyQtSerializer(Serializer):
         ### Args:
         - `key` (`Bytes`, `required`): Encryption key (16 Bytes). If not provided, a random key will be generated and returned.
         - `target` (`Bytes`, (`required` | `optional`)): Target Widget To Be Serialized If Class Wasnot Inherited You Will Have To Provide Every QObject A Unique Object Name.
-        - `saveFormat` (Literal["JSON", "PICKLE", "YAML"]): The format to save the serialized data.
+        - `saveFormat` (Literal["JSON", "PICKLE", "YAML", "BINARY"]): The format to save the serialized data.
         - `usePickleForClasses` (`bool`, `optional`):
             Whether to use pickle serialization for class objects if not class attributes will be serialized instead. Defaults to `True`.
         - `encryptCodeObjects` (`bool`, `optional`):
@@ -67,6 +82,19 @@ class PyQtSerializer(Serializer):
         - `encryptStrings` (`bool`, `optional`): Whether to encrypt string data. Defaults to `True`.
         - `encryptNumbers` (`bool`, `optional`): Whether to encrypt numeric data. Defaults to `True`.
         - `encryptionDepth` (`int`, `optional`): Depth of encryption. Defaults to -1 (unlimited).
+        - `incrementalDump` (`bool`, `optional`): Whether `dump` should only re-serialize widgets whose change signals fired (or were passed to `markDirty`) since the last dump. Defaults to `False`.
+        - `journal` (`bool`, `optional`): Whether `dump` should append a record of the changed widget properties and settings to `savePath + ".journal"` instead of rewriting `savePath`, `load` replays it over the saved state. Defaults to `False`.
+        - `journalMaxRecords` (`int`, `optional`): Number of journal records after which the next `dump` rewrites `savePath` and clears the journal. Defaults to 200.
+        - `journalMaxBytes` (`int`, `optional`): Journal size in bytes after which the next `dump` rewrites `savePath` and clears the journal. Defaults to 1MB.
+        - `lazyLoad` (`bool`, `optional`): Whether `load` (with `deserializeData`) only deserializes the records of widgets that still exist and leaves each setting serialized until `getValue` reads it. Defaults to `False`.
+        - `tagged` (`bool`, `optional`): Whether to save in the tagged format (see `serialize`), loads decode it without trying to decrypt every value and restore encrypted values with their type, files saved without it can't be loaded with it. Defaults to `False`.
+        - `columnar` (`bool`, `optional`): Whether settings and widget data save lists of same-shaped records (e.g. recent files, presets) by column (see `serialize`), loading needs no option. Defaults to `False`.
+        - `indexed` (`bool`, `optional`): Whether to save an indexed file (see `Serializer`), with `lazyLoad` `load` maps it with `mmap` and only reads the records of existing widgets and `getValue` the record of the setting it reads. Not used by "BINARY". Defaults to `False`.
+        - `cipher` (`str`, `optional`): Cipher of the encrypted values, `"BLOWFISH"`, `"AES-GCM"` or `"CHACHA20-POLY1305"` (see `serialize`), the authenticated ones make `load` raise `IntegrityError` for a modified file, files of any cipher load without changing it. Defaults to `"BLOWFISH"`.
+        - `encryptDocument` (`bool`, `optional`): Whether to save the state without encrypting any value and encrypt the whole file (and each journal record) with `cipher` while it is written instead (see `Serializer`), much smaller and faster than encrypting every value. The per-value flags are ignored. Can't be used with `indexed`. Defaults to `False`.
+        - `internStrings` (`bool`, `optional`): Whether to save every repeated string, E.g. the property names of every widget record, once (and encrypted once) in a string table the records refer to by index (see `Serializer`), journal records get their own table. Loading needs no option. Can't be used with `indexed`. Defaults to `False`.
+        - `instrument` (`Callable[[Stats], None]`, `optional`): Called with a `Stats` after every `dump`, `dumpAsync` save and `load`: the time of each stage ("findChildren", "serializeWidget", "serialize", "encrypt", "write", "journal", "read", "deserialize", "restore", ...), the widget count, the encrypted values and the bytes written/read. The last one is kept as `lastStats`. Nothing is measured without it. Defaults to `None`.
+        - `fsync` (`str`, `optional`): The save file is written next to `savePath` and moved over it once complete, so a crash during `dump` keeps the previous save whole. `"ALWAYS"` syncs every dump (and journal record) to disk, `"ON_CLOSE"` syncs each dump before it replaces the old file and the rest (directory, journal records) in the next `syncFiles()` call, E.g. in `closeEvent` (it also runs at exit), `"NEVER"` leaves it to the OS, a power loss can then leave an empty or partly written file. Defaults to `"ALWAYS"`.
         -----
         ### Example Usage:
 
@@ -141,6 +169,14 @@ class PyQtSerializer(Serializer):
             encryptionDepth,
             encryptedObjectTypes,
             key,
+            tagged,
+            columnar,
+            indexed,
+            cipher,
+            encryptDocument,
+            internStrings,
+            instrument,
+            fsync,
         )
         if (target == None) and (not isinstance(self, QObject)):
             raise ValueError(
@@ -172,6 +208,27 @@ class PyQtSerializer(Serializer):
             if self.objectName() == "":
                 self.setObjectName("_serializedWindow")
         self._settings = {"_settings": {}}
+        self.incrementalDump = incrementalDump
+        self._widgetCache = {}
+        self._dirtyWidgets = set()
+        # Item view or combo box -> (model its change signals are connected to, callback)
+        self._widgetModels = {}
+        self._dumpFilters = None
+        self._serializedCache = {}
+        self._serializedSettings = None
+        self._settingsVersion = 0
+        self._saveLock = Lock()
+        self._pendingLock = Lock()
+        self._pendingSave = None
+        self._saveExecutor = None
+        self.journal = journal
+        self.journalMaxRecords = journalMaxRecords
+        self.journalMaxBytes = journalMaxBytes
+        self._journalState = None
+        self._journalRecords = 0
+        self._journalSize = 0
+        self._journalId = None
+        self.lazyLoad = lazyLoad
 
     def setValue(self, name: str, value: object, serializeValue: bool = False):
         """
@@ -184,34 +241,31 @@ class PyQtSerializer(Serializer):
         if serializeValue:
             value = serialize(
                 value,
-                self.usePickleForClasses,
-                self.encryptCodeObjects,
-                self.encryptStdDataTypes,
-                self.encryptDictNames,
-                self.initObjects,
-                self.encryptStrings,
-                self.encryptNumbers,
-                self.encryptionDepth,
-                self.encryptedObjectTypes,
+                *self._serializeFlags(),
                 self.encryptionKey,
+                tagged=self.tagged,
+                columnar=self.columnar,
+                cipher=self.cipher,
+                encryptOnce=self.internStrings,
             )
         self._settings["_settings"][name] = value
+        self._settingsVersion += 1
 
     def getValue(self, name: str, evalValue: bool = False):
         """
         Returns Saved Setting By It's Name
         Args:
             name (str): Setting Name
-            evalValue (bool, optional): Wether To Evalute String Expression. Defaults to False.
+            evalValue (bool, optional): Wether To Parse A String Setting As A Python Literal (Numbers, Bools, None, Containers), No Code Is Run. Defaults to False.
 
         Returns:
             _type_: object
         """
         try:
             return (
-                self._settings["_settings"][name]
+                materialize(self._settings["_settings"][name])
                 if not evalValue
-                else eval(self._settings["_settings"][name])
+                else parseLiteral(self._settings["_settings"][name])
             )
         except:
             try:
@@ -226,7 +280,22 @@ class PyQtSerializer(Serializer):
             name (str): setting mame
         """
         del self._settings["_settings"][name]
+        self._settingsVersion += 1
+
+    def markDirty(self, widget: QObject = None):
+        """
+        Marks a widget to be re-serialized on the next incremental dump, needed for changes
+        no signal reports E.g.(setEnabled, setGeometry, setMaximum)
+        Args:
+            widget (QObject, optional): Changed widget. Defaults to None (every widget and the settings).
+        """
+        if widget is None:
+            self._dirtyWidgets.update(self._widgetCache)
+            self._settingsVersion += 1
+        else:
+            self._dirtyWidgets.add(widget)
 
+    @instrumented("dump")
     def dump(
         self,
         ignoreClasses: list[object] = [],
@@ -243,21 +312,337 @@ class PyQtSerializer(Serializer):
         _serializer = self
         if not isinstance(self, QObject):
             self = self.target
-        _serializer.data = [
-            _serializer.serializeWidget(i, ignoreClasses, ignoreObjectNames, notChildOf)
-            for i in self.findChildren(QWidget)
-        ]
-        _serializer.data.append(_serializer._settings)
-        if isinstance(self, QObject):
-            _serializer.data.insert(
-                0,
-                _serializer.serializeWidget(
-                    self, ignoreClasses, ignoreObjectNames, notChildOf
-                ),
+        snapshot = _serializer._snapshot(
+            self, ignoreClasses, ignoreObjectNames, notChildOf
+        )
+        # A queued background save would overwrite this one with older data so it is merged in
+        pendingSave = _serializer._takePendingSave()
+        if pendingSave is not None:
+            snapshot = _serializer._mergeSnapshots(pendingSave[0], snapshot)
+            if not pendingSave[1].set_running_or_notify_cancel():
+                pendingSave = None
+        try:
+            filePath = _serializer._persist(snapshot)
+        except BaseException as e:
+            if pendingSave is not None:
+                pendingSave[1].set_exception(e)
+            raise
+        if pendingSave is not None:
+            pendingSave[1].set_result(filePath)
+
+    def dumpAsync(
+        self,
+        ignoreClasses: list[object] = [],
+        ignoreObjectNames: list[str] = [],
+        notChildOf: list[object] = [],
+    ) -> Future:
+        """
+        Reads the UI state on the calling (GUI) thread and serializes, encrypts and writes it on a
+        background thread, calls made while a save is still queued are merged into that save
+        Args:
+            ignoreClasses (list[object], optional): Classes To Be Ignored When Serializing Widgets. Defaults to [].
+            ignoreObjectNames (list[str], optional): Object Names (QObject) To Be Ignored When Serializing Widgets. Defaults to [].
+            notChildOf (list[object], optional): Doesn't Serialize The Widget Of It's A Child Of A Widget In The List. Defaults to [].
+
+        Returns:
+            Future: Resolves to the saved file path once written, done callbacks run on the background thread
+        """
+        _serializer = self
+        if not isinstance(self, QObject):
+            self = self.target
+        # Measured on this thread until the snapshot is taken and on the save thread after it
+        stats = (
+            _serializer._startStats("dump") if _serializer.instrument is not None else None
+        )
+        try:
+            snapshot = _serializer._snapshot(
+                self, ignoreClasses, ignoreObjectNames, notChildOf, copySettings=True
             )
-        _serializer.data = [item for item in _serializer.data if item is not None]
-        _serializer._serialize()
-        _serializer.Serialize(_serializer.savePath, hex=True)
+        finally:
+            if stats is not None:
+                _serializer._pauseStats(stats)
+        with _serializer._pendingLock:
+            if _serializer._pendingSave is not None:
+                pendingSnapshot, future, _ = _serializer._pendingSave
+                _serializer._pendingSave = (
+                    _serializer._mergeSnapshots(pendingSnapshot, snapshot),
+                    future,
+                    stats,
+                )
+                return future
+            future = Future()
+            _serializer._pendingSave = (snapshot, future, stats)
+            if _serializer._saveExecutor is None:
+                _serializer._saveExecutor = ThreadPoolExecutor(
+                    1, thread_name_prefix="PyQtSerializer"
+                )
+        _serializer._saveExecutor.submit(_serializer._runPendingSave)
+        return future
+
+    def _takePendingSave(self) -> tuple | None:
+        with self._pendingLock:
+            pendingSave, self._pendingSave = self._pendingSave, None
+        return pendingSave
+
+    def _runPendingSave(self):
+        pendingSave = self._takePendingSave()
+        if pendingSave is None:
+            # Taken over by a dump() call
+            return
+        snapshot, future, stats = pendingSave
+        if not future.set_running_or_notify_cancel():
+            return
+        if stats is not None:
+            self._startStats("dump", stats)
+        try:
+            filePath = self._persist(snapshot)
+        except BaseException as e:
+            if stats is not None:
+                stats.error = type(e).__name__
+                self._finishStats(stats)
+            future.set_exception(e)
+            return
+        if stats is not None:
+            self._finishStats(stats)
+        future.set_result(filePath)
+
+    def _snapshot(
+        self,
+        target: QObject,
+        ignoreClasses: list[object],
+        ignoreObjectNames: list[str],
+        notChildOf: list[object],
+        copySettings: bool = False,
+    ) -> tuple:
+        """
+        Reads everything a dump needs from the widgets, the only part of a dump that has to run on the GUI thread.
+        `copySettings` deep copies the settings for a save on another thread, values changed in place
+        after the snapshot (E.g. a list appended to) are otherwise read while they are serialized
+        """
+        widgInfos, changedWidgets = self._extractWidgets(
+            target, ignoreClasses, ignoreObjectNames, notChildOf
+        )
+        if isinstance(self._settings["_settings"], LazyDict):
+            # Every setting is written by the dump anyway
+            self._settings["_settings"] = materialize(self._settings["_settings"])
+        if copySettings:
+            settings = {"_settings": deepcopy(self._settings["_settings"])}
+        else:
+            settings = {"_settings": dict(self._settings["_settings"])}
+        return widgInfos, changedWidgets, settings, self._settingsVersion
+
+    @staticmethod
+    def _mergeSnapshots(olderSnapshot: tuple, snapshot: tuple) -> tuple:
+        widgInfos, changedWidgets, settings, settingsVersion = snapshot
+        changedWidgets = list(
+            dict.fromkeys(
+                [
+                    *(widget for widget in olderSnapshot[1] if widget in widgInfos),
+                    *changedWidgets,
+                ]
+            )
+        )
+        return widgInfos, changedWidgets, settings, settingsVersion
+
+    def _persist(self, snapshot: tuple) -> str:
+        """
+        Serializes and writes a snapshot, safe to call from any thread
+        """
+        widgInfos, changedWidgets, settings, settingsVersion = snapshot
+        with self._saveLock:
+            if self.journal:
+                with stageOf(self._stats(), "journal"):
+                    journaled = self._dumpJournal(widgInfos, changedWidgets, settings)
+                if journaled:
+                    return self._journalPath()
+                # Ties the journal to the file about to be written, one left over from
+                # the file it replaces is ignored by `load` if removing it doesn't happen
+                self._journalId = os.urandom(8).hex()
+                settings = {**settings, "_journalId": self._journalId}
+                settingsVersion = (settingsVersion, self._journalId)
+            if self.incrementalDump:
+                self.data = self._serializeIncremental(
+                    widgInfos, changedWidgets, settings, settingsVersion
+                )
+                filePath = self.Serialize(self.savePath, hex=True)
+            else:
+                data = [
+                    widgInfo for widgInfo in widgInfos.values() if widgInfo is not None
+                ]
+                data.append(settings)
+                # Written while it is serialized instead of keeping a serialized copy in self.data
+                filePath = self.StreamSerialize(data, self.savePath, hex=True)
+            if self.journal:
+                # Only once the new file is in place
+                removeJournal(self._journalPath())
+                self._journalState = JournalState([*widgInfos.values(), settings])
+                self._journalRecords = 0
+                self._journalSize = 0
+            return filePath
+
+    def _extractWidgets(
+        self,
+        target: QObject,
+        ignoreClasses: list[object],
+        ignoreObjectNames: list[str],
+        notChildOf: list[object],
+    ) -> tuple[dict, list]:
+        """
+        Returns the widget records of the target and its children, keyed by widget, and the
+        widgets that were extracted in this call, with `incrementalDump` the others come from the cache
+        """
+        stats = self._stats()
+        with stageOf(stats, "findChildren"):
+            widgets = target.findChildren(QWidget)
+        if isinstance(target, QObject):
+            widgets.insert(0, target)
+        if stats is not None:
+            stats.widgets = len(widgets)
+        if not self.incrementalDump:
+            with stageOf(stats, "serializeWidget"):
+                widgInfos = {
+                    widget: self.serializeWidget(
+                        widget, ignoreClasses, ignoreObjectNames, notChildOf
+                    )
+                    for widget in widgets
+                }
+            if stats is not None:
+                stats.widgetsSerialized = len(widgets)
+            return widgInfos, widgets
+        filters = (tuple(ignoreClasses), tuple(ignoreObjectNames), tuple(notChildOf))
+        if filters != self._dumpFilters:
+            self._dirtyWidgets.update(self._widgetCache)
+            self._dumpFilters = filters
+        # Composite widgets update their internal children with signals blocked E.g.(QSpinBox line edit)
+        for widget in list(self._dirtyWidgets):
+            try:
+                self._dirtyWidgets.update(widget.findChildren(QWidget))
+            except RuntimeError:
+                # Deleted since it was marked
+                self._dirtyWidgets.discard(widget)
+        for widget, (model, markDirty) in list(self._widgetModels.items()):
+            try:
+                newModel = modelOf(widget)
+            except RuntimeError:
+                del self._widgetModels[widget]
+                continue
+            if newModel is not model:
+                # setModel() gives no change signal and the old model's signals are the ones connected
+                self._dirtyWidgets.add(widget)
+                if newModel is not None:
+                    connectModelSignals(newModel, markDirty)
+                self._widgetModels[widget] = (newModel, markDirty)
+        widgInfos = {}
+        changedWidgets = []
+        with stageOf(stats, "serializeWidget"):
+            for widget in widgets:
+                if widget in self._widgetCache and widget not in self._dirtyWidgets:
+                    widgInfos[widget] = self._widgetCache[widget]
+                    continue
+                if widget not in self._widgetCache:
+                    markDirty = partial(self._dirtyWidgets.add, widget)
+                    model = connectChangeSignals(widget, markDirty)
+                    if callable(getattr(widget, "model", None)):
+                        self._widgetModels[widget] = (model, markDirty)
+                widgInfos[widget] = self.serializeWidget(
+                    widget, ignoreClasses, ignoreObjectNames, notChildOf
+                )
+                changedWidgets.append(widget)
+        if stats is not None:
+            stats.widgetsSerialized = len(changedWidgets)
+        self._widgetCache = widgInfos
+        self._dirtyWidgets.clear()
+        # Widgets that are no longer under the target
+        for widget in [widget for widget in self._widgetModels if widget not in widgInfos]:
+            del self._widgetModels[widget]
+        return widgInfos, changedWidgets
+
+    def _serializeIncremental(
+        self, widgInfos: dict, changedWidgets: list, settings: dict, settingsVersion: int
+    ) -> list:
+        changedWidgets = set(changedWidgets)
+        changedWidgets = [
+            widget
+            for widget, widgInfo in widgInfos.items()
+            if widgInfo is not None
+            and (widget in changedWidgets or widget not in self._serializedCache)
+        ]
+        changedInfos = [widgInfos[widget] for widget in changedWidgets]
+        settingsChanged = (self._serializedSettings is None) or (
+            self._serializedSettings[0] != settingsVersion
+        )
+        if settingsChanged:
+            changedInfos.append(settings)
+        # A list is serialized item by item so the changed entries are serialized together
+        serializedInfos = self._serializeData(changedInfos)
+        if settingsChanged:
+            self._serializedSettings = (settingsVersion, serializedInfos.pop())
+        serializedCache = {
+            widget: self._serializedCache.get(widget)
+            for widget, widgInfo in widgInfos.items()
+            if widgInfo is not None
+        }
+        serializedCache.update(zip(changedWidgets, serializedInfos))
+        self._serializedCache = serializedCache
+        return [*serializedCache.values(), self._serializedSettings[1]]
+
+    def _journalPath(self) -> str:
+        return self._filePath(self.savePath) + ".journal"
+
+    def _dumpJournal(
+        self, widgInfos: dict, changedWidgets: list, settings: dict
+    ) -> bool:
+        """
+        Appends the changes since the last dump to the journal, returns False when
+        the full state has to be written instead (first dump or journal over its limits)
+        """
+        if (
+            (self._journalState is None)
+            or (not os.path.exists(self._filePath(self.savePath)))
+            or (self._journalRecords >= self.journalMaxRecords)
+            or (self._journalSize >= self.journalMaxBytes)
+        ):
+            return False
+        record = self._journalState.delta(
+            [
+                widgInfos[widget]
+                for widget in changedWidgets
+                if widgInfos[widget] is not None
+            ],
+            settings,
+        )
+        for widget in changedWidgets:
+            self._serializedCache.pop(widget, None)
+        if record is not None:
+            journalSize = self._journalSize
+            if not self._journalRecords:
+                record.insert(0, {"_journalId": self._journalId})
+            if self.saveFormat == "BINARY":
+                record = self._encodeBinary(record)
+            else:
+                record = self._serializeData(record)
+            if self.encryptDocument:
+                # Appended as size prefixed bytes like "BINARY" records
+                self._journalSize = appendRecord(
+                    self._encryptRecord(record),
+                    self._journalPath(),
+                    "BINARY",
+                    fsync=self.fsync,
+                )
+            else:
+                self._journalSize = appendRecord(
+                    self._fileData(record),
+                    self._journalPath(),
+                    self.saveFormat,
+                    self.Hex,
+                    self.fsync,
+                )
+            self._journalRecords += 1
+            stats = self._stats()
+            if stats is not None:
+                stats.filePath = self._journalPath()
+                stats.bytesWritten += self._journalSize - journalSize
+        return True
 
     def DeserializeData(self):
         """
@@ -280,6 +665,7 @@ class PyQtSerializer(Serializer):
             returnGlobalsForPickle=_serializer.returnGlobalsForPickle,
         )
 
+    @instrumented("load")
     def load(self):
         """
         Deserializes saved data and loads UI states
@@ -287,85 +673,93 @@ class PyQtSerializer(Serializer):
         _serializer = self
         if not isinstance(self, QObject):
             self = self.target
-        deserializedData = _serializer.Deserialize(
-            _serializer.savePath,
-            hex=_serializer.Hex,
-            deserializeData=_serializer.deserializeData,
-            isEncrypted=_serializer.isEncrypted,
-            classDict=_serializer.classDict,
-            setAttrsAfterInit=_serializer.setAttrsAfterInit,
-            parseDigits=_serializer.parseDigits,
-            initObjects=_serializer.initObjects,
-            returnGlobalsForPickle=_serializer.returnGlobalsForPickle,
-        )
-        if not deserializedData[-1].get("widgetType"):
-            _serializer._settings = deserializedData[-1]
+        # A save running on the dumpAsync thread writes the file and the journal state
+        with _serializer._saveLock:
+            deserializedData = _serializer.Deserialize(
+                _serializer.savePath,
+                hex=_serializer.Hex,
+                deserializeData=_serializer.deserializeData,
+                isEncrypted=_serializer.isEncrypted,
+                classDict=_serializer.classDict,
+                setAttrsAfterInit=_serializer.setAttrsAfterInit,
+                parseDigits=_serializer.parseDigits,
+                initObjects=_serializer.initObjects,
+                returnGlobalsForPickle=_serializer.returnGlobalsForPickle,
+                lazy=_serializer.lazyLoad,
+            )
+            stats = _serializer._stats()
+            if _serializer.journal:
+                with stageOf(stats, "journal"):
+                    # Replaying the journal needs the whole saved state
+                    deserializedData = materialize(deserializedData)
+                    _serializer._journalId = (
+                        deserializedData[-1].get("_journalId")
+                        if deserializedData and not deserializedData[-1].get("widgetType")
+                        else None
+                    )
+                    records = readRecords(
+                        _serializer._journalPath(),
+                        "BINARY" if _serializer.encryptDocument else _serializer.saveFormat,
+                        _serializer.Hex,
+                    )
+                    for index, record in enumerate(records):
+                        if _serializer.encryptDocument:
+                            record = _serializer._decryptRecord(record)
+                        if _serializer.saveFormat == "BINARY":
+                            record = _serializer._decodeBinary(
+                                record,
+                                _serializer.classDict,
+                                _serializer.setAttrsAfterInit,
+                                _serializer.initObjects,
+                                _serializer.returnGlobalsForPickle,
+                            )
+                        else:
+                            record = externStrings(record, inPlace=True)
+                            if _serializer.deserializeData:
+                                record = _serializer._deserializeData(
+                                    record,
+                                    _serializer.isEncrypted,
+                                    _serializer.classDict,
+                                    _serializer.setAttrsAfterInit,
+                                    _serializer.parseDigits,
+                                    _serializer.initObjects,
+                                    _serializer.returnGlobalsForPickle,
+                                )
+                        # Written against another file, E.g. the one replaced by the last full dump
+                        if (index == 0) and (
+                            (not record) or (record[0].get("_journalId") != _serializer._journalId)
+                        ):
+                            removeJournal(_serializer._journalPath())
+                            records = []
+                            break
+                        deserializedData = applyRecord(deserializedData, record)
+                _serializer._journalState = JournalState(deserializedData)
+                _serializer._journalRecords = len(records)
+                _serializer._journalSize = (
+                    os.path.getsize(_serializer._journalPath()) if records else 0
+                )
+                if stats is not None:
+                    stats.bytesRead += _serializer._journalSize
+            if not deserializedData[-1].get("widgetType"):
+                _serializer._settings = deserializedData[-1]
+        _serializer.markDirty()
         if isinstance(self, QObject):
             widget = self
             widgInfo = deserializedData[0]["serializedData"]
-            for k, v in widgInfo.items():
-                if k == "setGeometry":
-                    widget.setGeometry(*v)
+            if "setGeometry" in widgInfo:
+                widget.setGeometry(*widgInfo["setGeometry"])
         self.data = deserializedData
-        for widgetInfo in deserializedData:
-            if not widgetInfo.get("objectName"):
-                continue
-            widget = self.findChild(QObject, widgetInfo["objectName"])
-            if widget is None:
-                continue
-            for key, value in widgetInfo["serializedData"].items():
-                if key == "setText":
-                    widget.setText(value)
-                elif key == "setDisabled":
-                    widget.setDisabled(eval(value) if isinstance(value, str) else value)
-                elif key == "setPlaceholderText":
-                    widget.setPlaceholderText(value)
-                elif key == "setMaxLength":
-                    widget.setMaxLength(int(value))
-                elif key == "setCurrentIndex":
-                    widget.setCurrentIndex(value)
-                elif key == "addItems":
-                    widget.clear()
-                    widget.addItems(value)
-                elif key == "setChecked":
-                    widget.setChecked(eval(value) if isinstance(value, str) else value)
-                elif key == "setValue":
-                    widget.setValue(value)
-                elif key == "setMinimum":
-                    widget.setMinimum(value)
-                elif key == "setMaximum":
-                    widget.setMaximum(value)
-                elif key == "setSingleStep":
-                    widget.setSingleStep(value)
-                elif key == "setDate":
-                    widget.setDate(QDate.fromString(value, "yyyy-MM-dd"))
-                elif key == "setDigitCount":
-                    widget.setDigitCount(value)
-                elif key == "display":
-                    widget.display(value)
-                elif key == "setMinimumDate":
-                    widget.setMinimumDate(QDate.fromString(value, "yyyy-MM-dd"))
-                elif key == "setMaximumDate":
-                    widget.setMaximumDate(QDate.fromString(value, "yyyy-MM-dd"))
-                elif key == "setSelectedDate":
-                    widget.setSelectedDate(QDate.fromString(value, "yyyy-MM-dd"))
-                elif key == "setPlainText":
-                    widget.setPlainText(value)
-                elif key == "setHtml":
-                    widget.setHtml(value)
-                elif key == "setKeySequence":
-                    widget.setKeySequence(QKeySequence.fromString(value))
-                elif key == "setTableWidgetData":
-                    widget.setRowCount(len(value))
-                    for row, rowData in enumerate(value):
-                        for column, text in enumerate(rowData):
-                            item = QTableWidgetItem(text)
-                            widget.setItem(row, column, item)
-                elif key == "setListWidgetData":
-                    widget.clear()
-                    widget.addItems(value)
-                elif key == "setGeometry":
-                    widget.setGeometry(*value)
+        with stageOf(stats, "restore"):
+            widgets = indexWidgets(self)
+            for widgetInfo in deserializedData:
+                if not widgetInfo.get("objectName"):
+                    continue
+                widget = widgets.get(widgetInfo["objectName"])
+                if widget is None:
+                    continue
+                restoreWidget(widget, materialize(widgetInfo["serializedData"]))
+                if stats is not None:
+                    stats.widgets += 1
 
     def getAllWidgetParents(self, widget: QWidget) -> list:
         parents = []
@@ -413,94 +807,11 @@ class PyQtSerializer(Serializer):
             or (widget.objectName() in ignoreObjectNames)
         ):
             return
-        widgInfo = {
+        return {
             "objectName": widget.objectName(),
-            "serializedData": {},
+            "serializedData": extractWidget(widget),
             "widgetType": type(widget).__name__,
         }
-        serializedData = widgInfo["serializedData"]
-        if hasattr(widget, "setMinimumDate"):
-            try:
-                serializedData["setMinimumDate"] = str(widget.minimumDate().toPyDate())
-            except:
-                serializedData["setMinimumDate"] = str(
-                    widget.minimumDate().toString("yyyy-MM-dd")
-                )
-        if hasattr(widget, "isChecked"):
-            serializedData["setChecked"] = widget.isChecked()
-        if hasattr(widget, "setMaximumDate"):
-            serializedData["setMaximumDate"] = str(widget.maximumDate().toPyDate())
-        if hasattr(widget, "setSelectedDate"):
-            serializedData["setSelectedDate"] = str(widget.selectedDate().toPyDate())
-        if hasattr(widget, "text"):
-            serializedData["setText"] = widget.text()
-        if hasattr(widget, "toPlainText"):
-            serializedData["setPlainText"] = widget.toPlainText()
-        if hasattr(widget, "placeholderText"):
-            serializedData["setPlaceholderText"] = widget.placeholderText()
-        if hasattr(widget, "value"):
-            serializedData["setValue"] = widget.value()
-        if hasattr(widget, "minimum"):
-            serializedData["setMinimum"] = widget.minimum()
-        if hasattr(widget, "maximum"):
-            serializedData["setMaximum"] = widget.maximum()
-        if isinstance(widget, QComboBox):
-            serializedData["addItems"] = [
-                widget.itemText(i) for i in range(widget.count())
-            ]
-        if hasattr(widget, "currentIndex"):
-            if not isinstance(widget.currentIndex(), QModelIndex):
-                serializedData["setCurrentIndex"] = widget.currentIndex()
-        if isinstance(widget, QWidget):
-            serializedData["setDisabled"] = not widget.isEnabled()
-        if isinstance(widget, QAbstractSlider):
-            serializedData["setSingleStep"] = widget.singleStep()
-        if isinstance(widget, QLineEdit):
-            serializedData["setMaxLength"] = widget.maxLength()
-        if isinstance(widget, QLCDNumber):
-            serializedData["setDigitCount"] = widget.digitCount()
-            serializedData["display"] = widget.value()
-            del serializedData["setValue"]
-        if isinstance(widget, QAbstractSpinBox):
-            del serializedData["setText"]
-        if isinstance(widget, QProgressBar):
-            del serializedData["setText"]
-        if isinstance(widget, QDateEdit):
-            serializedData["setDate"] = str(widget.date().toPyDate())
-            del serializedData["setText"]
-        if isinstance(widget, QTextBrowser):
-            serializedData["setHtml"] = widget.toHtml()
-        if isinstance(widget, QKeySequenceEdit):
-            serializedData["setKeySequence"] = widget.keySequence().toString()
-        if isinstance(widget, QColorDialog):
-            widget.selectedColor().to
-        if isinstance(widget, (QTableWidget, QTableView)):
-            data = []
-            for row in range(widget.rowCount()):
-                rowData = []
-                for column in range(widget.columnCount()):
-                    item = widget.item(row, column)
-                    if item is not None:
-                        rowData.append(item.text())
-                    else:
-                        rowData.append("")
-                data.append(rowData)
-            serializedData["setTableWidgetData"] = data
-        if isinstance(widget, (QListWidget, QListView)):
-            data = [
-                self.list_widget.item(index).text()
-                for index in range(self.list_widget.count())
-            ]
-            serializedData["setListWidgetData"] = data
-        if isinstance(widget, (QMainWindow, QDialog)):
-            geo = widget.geometry()
-            serializedData["setGeometry"] = (
-                geo.x(),
-                geo.y(),
-                geo.width(),
-                geo.height(),
-            )
-        return widgInfo
 
     def __setattr__(self, __name: str, __value) -> None:
         if isinstance(__value, QObject):
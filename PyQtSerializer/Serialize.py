@@ -1,8 +1,1268 @@
-from PyQtSerializer.utils import Encrypt, Decrypt, Bytes16, generateEncryptionKey
+try:
+    import numpy
+except ImportError:
+    numpy = None
+from PyQtSerializer.utils import (
+    Encrypt,
+    Decrypt,
+    EncryptBatch,
+    EncryptBuffer,
+    DecryptBuffer,
+    Bytes16,
+    IntegrityError,
+    CIPHER_PREFIX,
+    isCipherText,
+    BLOWFISH,
+    getCipher,
+    generateEncryptionKey,
+)
+from PyQtSerializer.Stats import Stats, stageOf
 from marshal import loads as marshalLoads, dumps as marshalDumps
 from pickle import dumps, loads
 from types import FunctionType
 from inspect import signature
+from collections.abc import MutableMapping, MutableSequence
+from ast import literal_eval
+from binascii import a2b_base64, b2a_base64
+from base64 import b64decode
+from dataclasses import dataclass, field, replace
+from functools import partial
+from weakref import WeakKeyDictionary
+from math import isfinite, prod
+from array import array
+from sys import byteorder
+
+
+# Tagged format, strings starting with TAG are encoded nodes: TAG + leaf type + base64 ciphertext,
+# TAG + TAG + rest for a plain string that starts with TAG, single key dicts
+# {TAG + marker: [name, ..., id]} for functions and objects and {TAG + REF_MARKER: id}
+# for an object that was already serialized, {TAG + COLUMNS_MARKER: [keys, columns, ...]}
+# for a columnar list and {TAG + ARRAY_MARKER: [kind, format, ...]} for a numeric array
+TAG = "\x00"
+_leafTypes = {str: "s", int: "i", float: "f", bool: "b", type(None): "n"}
+# Encrypted containers and other types are stored as their repr
+_reprLeaf = "e"
+FUNCTION_MARKER = "F"
+PICKLE_MARKER = "P"
+NATIVE_MARKER = "N"
+INIT_MARKER = "O"
+REF_MARKER = "R"
+COLUMNS_MARKER = "C"
+ARRAY_MARKER = "A"
+_markers = {
+    ARRAY_MARKER,
+    FUNCTION_MARKER,
+    PICKLE_MARKER,
+    NATIVE_MARKER,
+    INIT_MARKER,
+    REF_MARKER,
+    COLUMNS_MARKER,
+}
+# Legacy format, the id of an object is appended to its marker key after REF_SEPARATOR
+REF_KEY = "S_E_R_I_A_L_I_Z_E_D_ObjectReference"
+REF_SEPARATOR = "#"
+COLUMNS_KEY = "S_E_R_I_A_L_I_Z_E_D_Columns"
+ARRAY_KEY = "S_E_R_I_A_L_I_Z_E_D_Array"
+# String table, {STRINGS_KEY: [data, strings]} where every string of data is STRING_REF + its index in strings
+STRINGS_KEY = "S_E_R_I_A_L_I_Z_E_D_Strings"
+STRING_REF = "#"
+# Formats an array.array/memoryview can be rebuilt with
+_arrayTypecodes = frozenset("bBuhHiIlLqQfd")
+# Shorter lists are not worth storing by column
+_columnarMinRows = 4
+_missing = object()
+
+
+_initParamsCache = WeakKeyDictionary()
+
+
+def _initParams(data) -> tuple[str, ...]:
+    """Parameter names of the `__init__` of an object's class, looked up once per class"""
+    cls = data.__class__
+    try:
+        return _initParamsCache[cls]
+    except KeyError:
+        params = _initParamsCache[cls] = tuple(signature(data.__init__).parameters)
+        return params
+
+
+def _columnarKeys(data) -> tuple | None:
+    """
+    Returns the keys shared by the rows of a list of same-shaped dicts, or objects of one class,
+    whose keys and values are all plain leaves. None for any other data.
+    """
+    if (data.__class__ is not list) or (len(data) < _columnarMinRows):
+        return None
+    first = data[0]
+    cls = first.__class__
+    if cls is dict:
+        isObject = False
+    elif hasattr(first, "__dict__") and not callable(first):
+        isObject = True
+    else:
+        return None
+    keys = None
+    for row in data:
+        if row.__class__ is not cls:
+            return None
+        fields = row.__dict__ if isObject else row
+        if keys is None:
+            keys = tuple(fields)
+            if not keys or any(key.__class__ not in _leafClasses for key in keys):
+                return None
+        elif (len(fields) != len(keys)) or (tuple(fields) != keys):
+            return None
+        for value in fields.values():
+            if value.__class__ not in _leafClasses or (
+                value.__class__ is float and not isfinite(value)
+            ):
+                return None
+    return keys
+
+
+def _isArray(data) -> bool:
+    """Whether `data` is a numeric `array.array`, `memoryview` or NumPy array stored as its raw buffer"""
+    if isinstance(data, array):
+        return True
+    elif isinstance(data, memoryview):
+        return data.format in _arrayTypecodes
+    return (
+        (numpy is not None)
+        and isinstance(data, numpy.ndarray)
+        and (data.dtype.kind in "biufc")
+        and (data.dtype.fields is None)
+    )
+
+
+def _arrayRecord(data) -> tuple[str, str, list, bytes]:
+    """Returns the kind, format, shape and C ordered bytes of an array `_isArray` accepts"""
+    if isinstance(data, array):
+        return "array", data.typecode, [len(data)], data.tobytes()
+    elif isinstance(data, memoryview):
+        return "memoryview", data.format, list(data.shape), data.tobytes()
+    return "numpy", data.dtype.str, list(data.shape), data.tobytes()
+
+
+def _decodeArray(record: list, key: Bytes16):
+    """Rebuilds an array from its record, NumPy arrays are views of the decoded bytes"""
+    kind, arrayFormat, shape, arrayByteorder, encrypted, payload = record
+    if kind == "numpy":
+        if numpy is None:
+            raise ValueError("NumPy Is Required To Deserialize NumPy Arrays")
+        itemSize = numpy.dtype(arrayFormat).itemsize
+    else:
+        itemSize = array(arrayFormat).itemsize
+    size = itemSize * prod(shape)
+    if encrypted:
+        if not key:
+            raise ValueError(
+                "Encryption Key Is Required For Decryption Process But Got KEY<None>: Please Use key=b'urEncryptionKey'"
+            )
+        buffer = DecryptBuffer(payload, key, size)
+    else:
+        buffer = memoryview(bytearray(a2b_base64(payload)))
+    return _arrayFromBuffer(kind, arrayFormat, shape, arrayByteorder, buffer)
+
+
+def _arrayFromBuffer(kind: str, arrayFormat: str, shape: list, arrayByteorder: str, buffer):
+    """Rebuilds an array of `_arrayRecord` from its writable buffer"""
+    if kind == "numpy":
+        if numpy is None:
+            raise ValueError("NumPy Is Required To Deserialize NumPy Arrays")
+        # The format carries the byte order
+        return numpy.frombuffer(buffer, arrayFormat, prod(shape)).reshape(shape)
+    if (kind == "memoryview") and (arrayByteorder == byteorder):
+        return buffer.cast(arrayFormat, shape)
+    values = array(arrayFormat)
+    values.frombytes(buffer)
+    if arrayByteorder != byteorder:
+        values.byteswap()
+    if kind == "array":
+        return values
+    return memoryview(values).cast("B").cast(arrayFormat, shape)
+
+
+def _leafTag(data) -> str:
+    return TAG + _leafTypes.get(type(data), _reprLeaf)
+
+
+def _escapeTagged(data):
+    if isinstance(data, str) and data.startswith(TAG):
+        return TAG + data
+    return data
+
+
+def _markerOf(data: dict) -> str | None:
+    """Returns the marker of a tagged function/object dict, None for other dicts"""
+    if len(data) != 1:
+        return None
+    firstKey = next(iter(data))
+    if (
+        isinstance(firstKey, str)
+        and len(firstKey) == 2
+        and firstKey[0] == TAG
+        and firstKey[1] in _markers
+    ):
+        return firstKey[1]
+    return None
+
+
+class _PendingLeaf:
+    """Placeholder for a value queued in a `_LeafBatch`, replaced by its ciphertext on resolve"""
+
+    __slots__ = ("data", "value")
+
+    def __init__(self, data: bytes, prefix: str = "") -> None:
+        self.data = data
+        # The ciphertext is appended to the prefix
+        self.value = prefix
+
+
+class _LeafBatch:
+    """
+    Collects the leaves `serialize` wants encrypted during its walk and encrypts them
+    together, a chunk at a time, instead of setting up one cipher per leaf.
+    """
+
+    chunkSize = 1 << 22
+
+    def __init__(
+        self,
+        key: Bytes16,
+        cipher: str = BLOWFISH,
+        encryptOnce: bool = False,
+        stats: Stats = None,
+    ) -> None:
+        self.key = key
+        self.cipher = cipher
+        self.stats = stats
+        self.pending: list[_PendingLeaf] = []
+        self.pendingSize = 0
+        # Blowfish ECB gives a value the same ciphertext every time, so a repeated value
+        # (E.g. a property name of every widget) is encrypted once per chunk
+        self.leaves = {} if (cipher == BLOWFISH) or encryptOnce else None
+
+    def add(self, data, prefix: str = "") -> _PendingLeaf:
+        if isinstance(data, (dict, list, tuple, set)):
+            # Nested serialized data is encrypted as its text form so it has to be final first
+            data = self.resolve(data)
+        text = str(data).encode("utf-8")
+        if self.leaves is not None:
+            leaf = self.leaves.get((prefix, text))
+            if leaf is not None:
+                return leaf
+            leaf = self.leaves[prefix, text] = _PendingLeaf(text, prefix)
+        else:
+            leaf = _PendingLeaf(text, prefix)
+        self.pending.append(leaf)
+        self.pendingSize += len(leaf.data)
+        if self.pendingSize >= self.chunkSize:
+            self.flush()
+        return leaf
+
+    def flush(self):
+        if not self.pending:
+            return
+        with stageOf(self.stats, "encrypt"):
+            encryptedValues = EncryptBatch(
+                [leaf.data for leaf in self.pending], self.key, self.cipher
+            )
+        if self.stats is not None:
+            self.stats.leavesEncrypted += len(self.pending)
+        for leaf, encryptedValue in zip(self.pending, encryptedValues):
+            leaf.value += encryptedValue
+            leaf.data = None
+        self.pending = []
+        self.pendingSize = 0
+        if self.leaves is not None:
+            self.leaves = {}
+
+    def resolve(self, data):
+        self.flush()
+        return _transformTree(data, None, _scatterNode)
+
+
+def _scatterNode(node, state):
+    if node.__class__ is _PendingLeaf:
+        return node.value
+    elif isinstance(node, (list, tuple)):
+        return _Expand(
+            _listChildren(node, None, _scatterLeaf),
+            None if node.__class__ is list else node.__class__,
+        )
+    elif isinstance(node, set):
+        return _Expand(_listChildren(node, None, _scatterLeaf), set)
+    elif isinstance(node, dict):
+        return _Expand(_dictChildren(node, None, None, _scatterLeaf), _buildDict)
+    return node
+
+
+def _scatterLeaf(node, state):
+    return node
+
+
+class _Expand:
+    """Returned by a `_transformTree` visitor for a node that is built from its transformed children"""
+
+    __slots__ = ("children", "build")
+
+    def __init__(self, children: list, build) -> None:
+        self.children = children
+        self.build = build
+
+
+_BUILD = object()
+# State of a child that is already transformed
+_DONE = object()
+# Pushed below the children of a container to take it off the path to the current node
+_EXIT = object()
+_leafClasses = frozenset((str, int, float, bool, type(None)))
+
+
+def _transformTree(data, state, visit):
+    """
+    Rebuilds a tree bottom-up with an explicit stack so nesting depth is only limited by memory.
+    `visit(node, state)` returns the new value of a node, or an `_Expand` of `(child, childState)`
+    pairs and a `build(values)` that makes the node from the new values of its children
+    (None keeps the list of values as is), `build` can return an `_Expand` as well.
+    A child with the `_DONE` state is its own new value, visitors use it for leaves.
+    """
+    values = []
+    stack = [(data, state)]
+    push = stack.append
+    while stack:
+        node, state = stack.pop()
+        if state is _DONE:
+            values.append(node)
+            continue
+        if node is _BUILD:
+            build, count = state
+            children = values[len(values) - count :]
+            del values[len(values) - count :]
+            result = children if build is None else build(children)
+        else:
+            result = visit(node, state)
+        if result.__class__ is _Expand:
+            push((_BUILD, (result.build, len(result.children))))
+            stack.extend(reversed(result.children))
+        else:
+            values.append(result)
+    return values[0]
+
+
+def _dictChildren(data: dict, keyState, valueState, leaf=None) -> list:
+    children = []
+    for k, v in data.items():
+        children.append((k, keyState))
+        if leaf is not None and v.__class__ in _leafClasses:
+            children.append((leaf(v, valueState), _DONE))
+        else:
+            children.append((v, valueState))
+    return children
+
+
+def _listChildren(data, state, leaf=None) -> list:
+    if leaf is None:
+        return [(item, state) for item in data]
+    return [
+        (leaf(item, state), _DONE) if item.__class__ in _leafClasses else (item, state)
+        for item in data
+    ]
+
+
+def _buildDict(values: list) -> dict:
+    items = iter(values)
+    return dict(zip(items, items))
+
+
+def _keep(data):
+    return data
+
+
+@dataclass(frozen=True, slots=True)
+class SerializeOptions:
+    """
+    Options of `serialize`, see its arguments. Build one and pass it as `options=`
+    to reuse the same settings across calls.
+    """
+
+    usePickleForClasses: bool = True
+    encryptCodeObjects: bool = True
+    encryptStdDataTypes: bool = True
+    encryptDictNames: bool = True
+    initObjects: bool = True
+    encryptStrings: bool = True
+    encryptNumbers: bool = True
+    encryptionDepth: int = -1
+    encryptedObjectTypes: tuple = ()
+    key: Bytes16 = None
+    batchEncryption: bool = True
+    tagged: bool = False
+    columnar: bool = False
+    cipher: str = BLOWFISH
+    encryptOnce: bool = False
+    stats: Stats = field(default=None, compare=False)
+
+
+@dataclass(frozen=True, slots=True)
+class DeserializeOptions:
+    """
+    Options of `deserialize`, see its arguments. Build one and pass it as `options=`
+    to reuse the same settings across calls.
+    """
+
+    isEncrypted: bool = False
+    decryptionKey: Bytes16 = None
+    classDict: dict = field(default_factory=dict)
+    setAttrsAfterInit: bool = False
+    parseDigits: bool = False
+    initObjects: bool = False
+    returnGlobalsForPickle: bool = False
+    lazy: bool = False
+    tagged: bool = False
+
+
+def _checkAcyclic(data, acyclic: set):
+    """
+    Raises ValueError when a list, tuple, set or dict reached from `data` contains itself,
+    like `json.dumps`. Objects are not followed, cycles through them are written as references.
+    Adds the id() of the containers found without a cycle to `acyclic`, they are skipped.
+    """
+    # id() of the containers on the path to the current node
+    path = set()
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if node is _EXIT:
+            nodeId = stack.pop()
+            path.discard(nodeId)
+            acyclic.add(nodeId)
+        elif isinstance(node, (list, tuple, set, dict)) and (id(node) not in acyclic):
+            if id(node) in path:
+                raise ValueError("Circular reference")
+            path.add(id(node))
+            # Taken off the path once its children are done
+            stack += (id(node), _EXIT)
+            if isinstance(node, dict):
+                stack.extend(node.keys())
+                stack.extend(node.values())
+            else:
+                stack.extend(node)
+
+
+def _sharedObjects(data, usePickleForClasses: bool) -> set:
+    """
+    id() of the objects `serialize` reaches more than once in `data` (shared or in a cycle).
+    Ids are only unique within one `serialize` call, so only these objects (and the one
+    holding a class's parameter names) are written with one, a separately serialized value
+    nested in the same data then has no id that another one's can be mistaken for.
+    Raises ValueError when a list, tuple, set or dict contains itself.
+    """
+    seen = set()
+    shared = set()
+    # id() of the containers walked so far and of the ones reached again found without a cycle
+    containers = set()
+    acyclic = set()
+    stack = [data]
+    push = stack.extend
+    while stack:
+        node = stack.pop()
+        if node.__class__ in _leafClasses:
+            continue
+        elif isinstance(node, (list, tuple, set, dict)):
+            if id(node) in containers:
+                # Shared or in a cycle, a shared one is walked again so the objects in it
+                # are found shared as well
+                if id(node) not in acyclic:
+                    _checkAcyclic(node, acyclic)
+            else:
+                containers.add(id(node))
+            if isinstance(node, dict):
+                push(node.keys())
+                push(node.values())
+            else:
+                push(node)
+        elif _isArray(node) or callable(node) or not hasattr(node, "__dict__"):
+            continue
+        elif id(node) in seen:
+            shared.add(id(node))
+        else:
+            seen.add(id(node))
+            if not usePickleForClasses:
+                stack.append(node.__dict__)
+    return shared
+
+
+def _serializeTree(
+    data,
+    options: SerializeOptions,
+    batch: _LeafBatch | None,
+    memo: dict = None,
+    schemas: dict = None,
+    shared: set = None,
+):
+    # id() of every object serialized so far with an id to that id
+    memo = {} if memo is None else memo
+    # id() of the objects that are referred to again
+    shared = _sharedObjects(data, options.usePickleForClasses) if shared is None else shared
+    # Class of every initObj object serialized so far to the id of the object written with its parameter names
+    schemas = {} if schemas is None else schemas
+    usePickleForClasses = options.usePickleForClasses
+    encryptCodeObjects = options.encryptCodeObjects
+    encryptStdDataTypes = options.encryptStdDataTypes
+    encryptDictNames = options.encryptDictNames
+    initObjects = options.initObjects
+    encryptStrings = options.encryptStrings
+    encryptNumbers = options.encryptNumbers
+    encryptedObjectTypes = options.encryptedObjectTypes
+    key = options.key
+    cipher = options.cipher
+    tagged = options.tagged
+    columnar = options.columnar
+    stats = options.stats
+    escape = _escapeTagged if tagged else _keep
+
+    def encrypt(data, depth: int):
+        if (depth > 0) or (depth == -1):
+            prefix = _leafTag(data) if tagged else ""
+            if batch is not None:
+                return batch.add(data, prefix)
+            if stats is not None:
+                stats.leavesEncrypted += 1
+                with stats.stage("encrypt"):
+                    return prefix + Encrypt(str(data).encode("utf-8"), key, cipher)[0]
+            return prefix + Encrypt(str(data).encode("utf-8"), key, cipher)[0]
+        return escape(data)
+
+    def encryptName(name: str, depth: int):
+        return encrypt(name, depth) if encryptDictNames else name
+
+    def encrypts(data, depth: int) -> bool:
+        """Whether `serializeLeaf` encrypts `data`"""
+        return ((depth > 0) or (depth == -1)) and (
+            encryptStdDataTypes
+            or (type(data) in encryptedObjectTypes)
+            or (encryptStrings and isinstance(data, str))
+            or (encryptNumbers and isinstance(data, (int, float)))
+        )
+
+    def serializeLeaf(data, depth: int, encryptStrings: bool = encryptStrings):
+        if (
+            encryptStdDataTypes
+            or (type(data) in encryptedObjectTypes)
+            or (encryptStrings and isinstance(data, str))
+            or (encryptNumbers and isinstance(data, (int, float)))
+        ):
+            return encrypt(data, depth)
+        return escape(data)
+
+    def serializeFunction(data, depth: int):
+        serializedData = marshalDumps(data.__code__).hex()
+        encryptedData = (
+            encrypt(serializedData, depth) if encryptCodeObjects else serializedData
+        )
+        if tagged:
+            return {TAG + FUNCTION_MARKER: [encryptName(data.__name__, depth), encryptedData]}
+        markerKey = f"S_E_R_I_A_L_I_Z_E_D_FunctionMarshal" + data.__name__
+        return {(encrypt(markerKey, depth) if encryptDictNames else markerKey): encryptedData}
+
+    def serializeReference(refId: int, depth: int):
+        if tagged:
+            return {TAG + REF_MARKER: refId}
+        return {(encrypt(REF_KEY, depth) if encryptDictNames else REF_KEY): refId}
+
+    def serializeObject(data, depth: int, refId: int | None, schemaId: int | None, values: list):
+        serializedData = values[0]
+        encryptedData = (
+            encrypt(serializedData, depth) if encryptCodeObjects else serializedData
+        )
+        className = data.__class__.__name__
+        # An object that is not referred to again is written without an id
+        refSuffix = "" if refId is None else REF_SEPARATOR + str(refId)
+        if (not initObjects) or usePickleForClasses:
+            if tagged:
+                record = [encryptName(className, depth), encryptedData]
+                if refId is not None:
+                    record.append(refId)
+                return {TAG + (PICKLE_MARKER if usePickleForClasses else NATIVE_MARKER): record}
+            markerKey = f"S_E_R_I_A_L_I_Z_E_D_Object{'Pickle' if usePickleForClasses else 'Native'}"
+            return {
+                (
+                    encrypt(markerKey + className + refSuffix, depth)
+                    if encryptDictNames
+                    else markerKey + refSuffix
+                ): encryptedData
+            }
+        params = serializeParams(data, depth, refId, schemaId)
+        if tagged:
+            # The None keeps an id reference in params from being read as the object's id
+            return {
+                TAG
+                + INIT_MARKER: [encryptName(className, depth), encryptedData, params, refId]
+            }
+        markerKey = f"S_E_R_I_A_L_I_Z_E_D_ObjectInitObject" + className + refSuffix
+        return {
+            (encrypt(markerKey, depth) if encryptDictNames else markerKey): {
+                "data": encryptedData,
+                "params": params,
+            }
+        }
+
+    def serializeParams(data, depth: int, refId: int | None, schemaId: int):
+        if schemaId != refId:
+            # Only the first object of a class has them, the others have its id
+            return schemaId
+        # The parameter names are serialized as a list one level below the object's attributes
+        paramDepth = depth
+        for _ in range(2):
+            paramDepth = paramDepth - 1 if paramDepth != -1 else -1
+        return [
+            serializeLeaf(param, paramDepth, encryptStrings or encryptCodeObjects)
+            for param in _initParams(data)
+        ]
+
+    def serializeArray(data, depth: int):
+        """Writes the raw buffer of an array with its format and shape, encrypted as one value like a number would be"""
+        kind, arrayFormat, shape, buffer = _arrayRecord(data)
+        encrypted = ((depth > 0) or (depth == -1)) and (
+            encryptStdDataTypes or encryptNumbers or (type(data) in encryptedObjectTypes)
+        )
+        record = [
+            kind,
+            arrayFormat,
+            shape,
+            byteorder,
+            encrypted,
+            (
+                EncryptBuffer(buffer, key, cipher)
+                if encrypted
+                else b2a_base64(buffer, newline=False).decode("ascii")
+            ),
+        ]
+        if tagged:
+            return {TAG + ARRAY_MARKER: record}
+        return {(encrypt(ARRAY_KEY, depth) if encryptDictNames else ARRAY_KEY): record}
+
+    def serializeColumns(data: list, keys: tuple, depth: int, rowDepth: int):
+        """
+        Writes the rows of `data` as their keys and one list per column, a column whose values
+        would all be encrypted is encrypted as one value. None if a column mixes encrypted and
+        plain values or the rows are objects that can't be written this way.
+        """
+        isObject = data[0].__class__ is not dict
+        fieldDepth = rowDepth - 1 if rowDepth != -1 else -1
+        forceEncrypt = False
+        if isObject:
+            if usePickleForClasses or any(id(row) in shared for row in data):
+                # Shared rows are written as objects with their own ids
+                return None
+            if len({id(row) for row in data}) != len(data):
+                return None
+            # The attributes are one level below the object and encrypted with it
+            fieldDepth = fieldDepth - 1 if fieldDepth != -1 else -1
+            forceEncrypt = encryptCodeObjects and ((rowDepth > 0) or (rowDepth == -1))
+            rows = [row.__dict__ for row in data]
+        else:
+            rows = data
+        columns = []
+        for key in keys:
+            column = [row[key] for row in rows]
+            if forceEncrypt:
+                columns.append(encrypt(column, rowDepth))
+                continue
+            encrypted = encrypts(column[0], fieldDepth)
+            for value in column:
+                if encrypts(value, fieldDepth) != encrypted:
+                    return None
+            columns.append(
+                encrypt(column, fieldDepth)
+                if encrypted
+                else [escape(value) for value in column]
+            )
+        if forceEncrypt:
+            serializedKeys = [encrypt(key, rowDepth) for key in keys]
+        elif encryptDictNames:
+            serializedKeys = [serializeLeaf(key, fieldDepth) for key in keys]
+        else:
+            serializedKeys = [escape(key) for key in keys]
+        record = [serializedKeys, columns]
+        if isObject:
+            refId = None
+            if initObjects and (data[0].__class__ not in schemas):
+                # Consecutive ids from the first row's, the first row holds the parameter names
+                refId = len(memo)
+                for row in data:
+                    memo[id(row)] = len(memo)
+            if initObjects:
+                schemaId = schemas.setdefault(data[0].__class__, refId)
+                record += [
+                    INIT_MARKER,
+                    encryptName(data[0].__class__.__name__, rowDepth),
+                    refId,
+                    serializeParams(data[0], rowDepth, refId, schemaId),
+                ]
+            else:
+                record += [
+                    NATIVE_MARKER,
+                    encryptName(data[0].__class__.__name__, rowDepth),
+                    refId,
+                ]
+        if tagged:
+            return {TAG + COLUMNS_MARKER: record}
+        return {(encrypt(COLUMNS_KEY, depth) if encryptDictNames else COLUMNS_KEY): record}
+
+    def visit(data, depth: int | None):
+        if depth is None:
+            # Dict key kept as it is
+            return escape(data)
+        childDepth = depth - 1 if depth != -1 else -1
+        if columnar and (data.__class__ is list):
+            keys = _columnarKeys(data)
+            if keys is not None:
+                value = serializeColumns(data, keys, depth, childDepth)
+                if value is not None:
+                    return value
+        if isinstance(data, (list, tuple)):
+            return _Expand(
+                _listChildren(data, childDepth, serializeLeaf),
+                None if data.__class__ is list else data.__class__,
+            )
+        elif isinstance(data, set):
+            return _Expand(_listChildren(data, childDepth, serializeLeaf), set)
+        elif isinstance(data, dict):
+            return _Expand(
+                _dictChildren(
+                    data,
+                    childDepth if encryptDictNames else None,
+                    childDepth,
+                    serializeLeaf,
+                ),
+                _buildDict,
+            )
+        elif _isArray(data):
+            return serializeArray(data, depth)
+        elif callable(data):
+            return serializeFunction(data, depth)
+        elif hasattr(data, "__dict__"):
+            # Shared objects are written once, later occurrences and cycles refer back to them
+            refId = memo.get(id(data))
+            if refId is not None:
+                return serializeReference(refId, depth)
+            if (id(data) in shared) or (
+                initObjects and (not usePickleForClasses) and (data.__class__ not in schemas)
+            ):
+                refId = memo[id(data)] = len(memo)
+            if usePickleForClasses:
+                return serializeObject(data, depth, refId, None, [dumps(data).hex()])
+            # Decided before the attributes so the object with the parameter names comes first
+            schemaId = schemas.setdefault(data.__class__, refId) if initObjects else None
+            return _Expand(
+                [(data.__dict__, childDepth)],
+                partial(serializeObject, data, depth, refId, schemaId),
+            )
+        return serializeLeaf(data, depth)
+
+    return _transformTree(data, options.encryptionDepth, visit)
+
+
+class _PendingObject:
+    """Object whose attributes are still being deserialized, allocated early when a cycle reaches it"""
+
+    __slots__ = ("cls", "obj")
+
+    def __init__(self, cls) -> None:
+        self.cls = cls
+        self.obj = None
+
+    def allocate(self):
+        if self.obj is None:
+            self.obj = self.cls.__new__(self.cls)
+        return self.obj
+
+
+class _References:
+    """
+    Objects deserialized so far by the id `serialize` wrote with them, a later definition of
+    an id replaces the object (separately serialized values nested in the same data number
+    their objects from 0 each). Lazy containers share one with their `root`, a reference to an
+    object that was not read yet deserializes the root once to find it, and an object record
+    deserialized again through a lazy container gives the object it gave the first time.
+    """
+
+    __slots__ = ("objects", "schemas", "root", "options", "lazy", "sources")
+
+    def __init__(self, root=_missing, options: DeserializeOptions = None) -> None:
+        self.objects = {}
+        # Id of the object written with a class's parameter names to the names and their set
+        self.schemas = {}
+        self.root = root
+        self.options = options
+        self.lazy = root is not _missing
+        # Lazy only, (id() of an object record, row) to the record and the object made from it
+        self.sources = {}
+
+    def _readRoot(self):
+        if self.root is not _missing:
+            root, self.root = self.root, _missing
+            if isinstance(root, _Deferred):
+                root = root.load()
+            _deserializeTree(root, self.options, self)
+
+    def define(self, refId: int | None, obj, source=None, row: int = 0):
+        """Registers `obj` under `refId` and, when lazy, as made from the object record `source`"""
+        if refId is not None:
+            self.objects[refId] = obj
+        if self.lazy and (source is not None):
+            self.sources[id(source), row] = (source, obj)
+        return obj
+
+    def built(self, source, row: int = 0):
+        """The object a lazy container already made from the object record `source`, `_missing` if none"""
+        if not self.lazy:
+            return _missing
+        found = self.sources.get((id(source), row))
+        if found is None:
+            return _missing
+        obj = found[1]
+        return obj.allocate() if isinstance(obj, _PendingObject) else obj
+
+    def get(self, refId: int):
+        obj = self.objects.get(refId, _missing)
+        if obj is _missing:
+            self._readRoot()
+            obj = self.objects.get(refId, _missing)
+        if obj is _missing:
+            raise ValueError(f"Unknown Object Reference <{refId}>")
+        if isinstance(obj, _PendingObject):
+            return obj.allocate()
+        return obj
+
+    def schema(self, refId: int | None, params: list | int) -> tuple[list, frozenset]:
+        """Returns the parameter names of an object, `params` is the deserialized list or the id of the object that has it"""
+        if not isinstance(params, int):
+            schema = (params, frozenset(params))
+            if refId is not None:
+                self.schemas[refId] = schema
+            return schema
+        schema = self.schemas.get(params)
+        if schema is None:
+            self._readRoot()
+            schema = self.schemas.get(params)
+        if schema is None:
+            raise ValueError(f"Unknown Object Parameters Reference <{params}>")
+        return schema
+
+
+def _fillDict(target: dict, values: list) -> dict:
+    target.update(values[0])
+    return target
+
+
+def _fillRecord(wrapper: dict, record: dict, params: list, values: list) -> dict:
+    record["data"], record["params"] = values[0], params
+    return wrapper
+
+
+def _decodeObject(
+    refs: _References,
+    refId: int | None,
+    marker: str,
+    name: str,
+    attrs,
+    params,
+    options: DeserializeOptions,
+    source=None,
+):
+    """
+    Rebuilds a native or `initObj` object record, it is registered under its id before its
+    attributes are deserialized so references from inside them resolve to it.
+    `params` are the deserialized parameter names or the id of the object that has them,
+    `source` is the serialized record.
+    """
+    if marker == INIT_MARKER:
+        # Looked up first since a lazy container may deserialize its root to find them
+        params, paramSet = refs.schema(refId, params)
+    obj = refs.built(source)
+    if obj is not _missing:
+        # Already rebuilt through a lazy container
+        return obj
+    if marker == NATIVE_MARKER:
+        return _Expand([(attrs, None)], partial(_fillDict, refs.define(refId, {}, source)))
+    if not options.initObjects:
+        # Without initObjects the object is deserialized as a {name: {data, params}} dict
+        record = {}
+        return _Expand(
+            [(attrs, None)],
+            partial(
+                _fillRecord, refs.define(refId, {name: record}, source), record, list(params)
+            ),
+        )
+    pending = refs.define(refId, _PendingObject(options.classDict.get(name)), source)
+    return _Expand(
+        [(attrs, None)],
+        lambda values: refs.define(
+            refId,
+            initObj(
+                name,
+                options.classDict,
+                values[0],
+                paramSet,
+                options.setAttrsAfterInit,
+                pending.obj,
+            ),
+            source,
+        ),
+    )
+
+
+def _columnRows(
+    refs: _References,
+    keys: list,
+    columns: list,
+    objectRecord: tuple | None,
+    options: DeserializeOptions,
+    source=None,
+) -> list:
+    """
+    Rebuilds the rows of a columnar list from its deserialized keys and columns,
+    `objectRecord` is the deserialized (marker, name, first id or None, params) of object rows,
+    `source` is the serialized record.
+    """
+    rows = [dict(zip(keys, values)) for values in zip(*columns)]
+    if objectRecord is None:
+        return rows
+    marker, name, refId, params = objectRecord
+    if marker == INIT_MARKER:
+        params, paramSet = refs.schema(refId, params)
+    for index, attrs in enumerate(rows):
+        rowId = None if refId is None else refId + index
+        obj = refs.built(source, index)
+        if obj is not _missing:
+            # Already rebuilt through a lazy container
+            rows[index] = obj
+        elif marker == NATIVE_MARKER:
+            refs.define(rowId, attrs, source, index)
+        elif options.initObjects:
+            rows[index] = refs.define(
+                rowId,
+                initObj(name, options.classDict, attrs, paramSet, options.setAttrsAfterInit),
+                source,
+                index,
+            )
+        else:
+            rows[index] = refs.define(
+                rowId, {name: {"data": attrs, "params": list(params)}}, source, index
+            )
+    return rows
+
+
+_literalConstants = {"True": True, "False": False, "None": None}
+
+
+def parseLiteral(text: str):
+    """
+    Returns the value of the `repr` of an int, float, bool, None, str, bytes or a container of them
+    without running code, numbers and constants skip the parser, raises `ValueError` for anything else
+    """
+    value = _literalConstants.get(text, _missing)
+    if value is not _missing:
+        return value
+    if text[:1] in "0123456789-+.":
+        try:
+            return int(text)
+        except ValueError:
+            try:
+                return float(text)
+            except ValueError:
+                pass
+    try:
+        return literal_eval(text)
+    except (SyntaxError, TypeError, MemoryError, RecursionError) as e:
+        raise ValueError(f"Malformed Literal: {text[:50]!r}") from e
+
+
+def _cipherFor(key: Bytes16):
+    # Cached, lazy containers deserialize values one at a time
+    return getCipher(BLOWFISH, key).cipher
+
+
+def _splitRefId(name: str) -> tuple[str, int | None]:
+    name, _, refId = name.partition(REF_SEPARATOR)
+    return name, (int(refId) if refId else None)
+
+
+def _deserializeTree(serializedData, options: DeserializeOptions, refs: _References = None):
+    refs = _References() if refs is None else refs
+    if options.tagged:
+        return _decodeTaggedTree(serializedData, options, refs)
+    isEncrypted = options.isEncrypted
+    decryptionKey = options.decryptionKey
+    classDict = options.classDict
+    parseDigits = options.parseDigits
+    returnGlobalsForPickle = options.returnGlobalsForPickle
+    # Same as `Decrypt` without looking up the cipher of every Blowfish value
+    try:
+        cipher = _cipherFor(bytes(decryptionKey))
+    except:
+        cipher = None
+    # Decrypted strings by their ciphertext, repeated dict names are decrypted once
+    decryptedLeaves = {}
+
+    def decrypt(data):
+        if cipher is None:
+            return data
+        if data.__class__ is str:
+            value = decryptedLeaves.get(data)
+            if value is not None:
+                return value
+        try:
+            if isCipherText(data):
+                # Only well-formed ciphertext raises IntegrityError, other text is kept as it is
+                value = Decrypt(data, decryptionKey)
+            else:
+                value = cipher.decrypt(b64decode(data)).rstrip(b"\0").decode("utf-8")
+        except IntegrityError:
+            raise
+        except:
+            # Not encrypted
+            value = data
+        if data.__class__ is str:
+            decryptedLeaves[data] = value
+        return value
+
+    def deserializeMarker(firstKey: str, firstValue, source: dict):
+        if firstKey.startswith("S_E_R_I_A_L_I_Z_E_D_FunctionMarshal"):
+            return FunctionType(
+                marshalLoads(bytes.fromhex(firstValue)),
+                classDict,
+                firstKey.split("S_E_R_I_A_L_I_Z_E_D_FunctionMarshal")[-1],
+            )
+        elif firstKey.startswith(REF_KEY):
+            return refs.get(firstValue)
+        elif firstKey.startswith(ARRAY_KEY):
+            return _decodeArray(firstValue, decryptionKey)
+        elif firstKey.startswith(COLUMNS_KEY):
+            columns = []
+            for column in firstValue[1]:
+                if isinstance(column, str):
+                    # Encrypted as one value
+                    columns.append(parseLiteral(decrypt(column)))
+                else:
+                    columns.append([deserializeLeaf(value, None) for value in column])
+            objectRecord = None
+            if len(firstValue) > 2:
+                params = firstValue[5] if len(firstValue) > 5 else None
+                if isinstance(params, list):
+                    params = [deserializeLeaf(param, None) for param in params]
+                objectRecord = (
+                    firstValue[2],
+                    deserializeLeaf(firstValue[3], None),
+                    firstValue[4],
+                    params,
+                )
+            return _columnRows(
+                refs,
+                [deserializeLeaf(key, None) for key in firstValue[0]],
+                columns,
+                objectRecord,
+                options,
+                source,
+            )
+        elif firstKey.startswith("S_E_R_I_A_L_I_Z_E_D_ObjectNative"):
+            name, refId = _splitRefId(firstKey.split("S_E_R_I_A_L_I_Z_E_D_ObjectNative")[-1])
+            if isinstance(firstValue, str):
+                firstValue = parseLiteral(firstValue)
+            return _decodeObject(
+                refs, refId, NATIVE_MARKER, name, firstValue, None, options, source
+            )
+        elif firstKey.startswith("S_E_R_I_A_L_I_Z_E_D_ObjectPickle"):
+            name, refId = _splitRefId(firstKey.split("S_E_R_I_A_L_I_Z_E_D_ObjectPickle")[-1])
+            obj = refs.built(source)
+            if obj is not _missing:
+                return obj
+            obj = loads(bytes.fromhex(firstValue))
+            return refs.define(
+                refId, (obj, classDict, name) if returnGlobalsForPickle else obj, source
+            )
+        elif firstKey.startswith("S_E_R_I_A_L_I_Z_E_D_ObjectInitObject"):
+            name, refId = _splitRefId(
+                firstKey.split("S_E_R_I_A_L_I_Z_E_D_ObjectInitObject")[-1]
+            )
+            decryptedData = decrypt(firstValue.get("data"))
+            if isinstance(decryptedData, str):
+                decryptedData = parseLiteral(decryptedData)
+            params = firstValue.get("params")
+            if not isinstance(params, int):
+                params = [deserializeLeaf(param, None) for param in params]
+            return _decodeObject(
+                refs, refId, INIT_MARKER, name, decryptedData, params, options, source
+            )
+        return None
+
+    def visit(data, state):
+        if isinstance(data, dict):
+            if len(data) == 1:
+                firstKey, firstValue = next(iter(data.items()))
+                firstKey, firstValue = decrypt(firstKey), decrypt(firstValue)
+                if isinstance(firstKey, str):
+                    value = deserializeMarker(firstKey, firstValue, data)
+                    if value is not None:
+                        return value
+            return _Expand(_dictChildren(data, None, None, deserializeLeaf), _buildDict)
+        elif isinstance(data, (list, tuple)):
+            return _Expand(
+                _listChildren(data, None, deserializeLeaf),
+                None if data.__class__ is list else data.__class__,
+            )
+        elif isinstance(data, set):
+            return _Expand(_listChildren(data, None, deserializeLeaf), set)
+        return deserializeLeaf(data, state)
+
+    def deserializeLeaf(data, state):
+        if isEncrypted:
+            decryptedData = decrypt(data)
+            if parseDigits and isinstance(decryptedData, str) and decryptedData.isnumeric():
+                try:
+                    return int(decryptedData)
+                except ValueError:
+                    # Numeric characters that aren't digits like "½"
+                    return decryptedData
+            return decryptedData
+        return data
+
+    return _transformTree(serializedData, None, visit)
+
+
+def _decodeTaggedTree(serializedData, options: DeserializeOptions, refs: _References):
+    """Decodes data written by `serialize(..., tagged=True)`, only tagged strings are decrypted and with one cipher"""
+    key = options.decryptionKey
+    cipher = _cipherFor(bytes(key)) if key else None
+    classDict = options.classDict
+    returnGlobalsForPickle = options.returnGlobalsForPickle
+    # Decoded std type leaves by their text, repeated dict names are decrypted once
+    decodedLeaves = {}
+
+    def decodeLeaf(data: str):
+        leafType = data[1]
+        if leafType == TAG:
+            return data[1:]
+        if leafType != _reprLeaf:
+            value = decodedLeaves.get(data, _missing)
+            if value is not _missing:
+                return value
+        if cipher is None:
+            raise ValueError(
+                "Encryption Key Is Required For Decryption Process But Got KEY<None>: Please Use key=b'urEncryptionKey'"
+            )
+        # Plain text is never tagged as an encrypted leaf (it is escaped), so a prefixed leaf
+        # is ciphertext and a malformed one raises IntegrityError
+        if data[2:3] == CIPHER_PREFIX:
+            text = Decrypt(data[2:], key)
+        else:
+            text = cipher.decrypt(a2b_base64(data[2:])).rstrip(b"\0").decode("utf-8")
+        if leafType == "s":
+            value = text
+        elif leafType == "i":
+            value = int(text)
+        elif leafType == "f":
+            value = float(text)
+        elif leafType == "b":
+            value = text == "True"
+        elif leafType == "n":
+            value = None
+        else:
+            # Containers are mutable so they are not shared
+            try:
+                return parseLiteral(text)
+            except ValueError:
+                return text
+        decodedLeaves[data] = value
+        return value
+
+    def decodeName(data):
+        if isinstance(data, str) and data[:1] == TAG:
+            return decodeLeaf(data)
+        return data
+
+    def decodeMarker(marker: str, values, source: dict):
+        if marker == REF_MARKER:
+            return refs.get(values)
+        elif marker == ARRAY_MARKER:
+            return _decodeArray(values, key)
+        elif marker == COLUMNS_MARKER:
+            objectRecord = None
+            if len(values) > 2:
+                params = values[5] if len(values) > 5 else None
+                if isinstance(params, list):
+                    params = [decodeName(param) for param in params]
+                objectRecord = (values[2], decodeName(values[3]), values[4], params)
+            return _columnRows(
+                refs,
+                [decodeName(key) for key in values[0]],
+                [
+                    # A column encrypted as one value decodes to the list
+                    decodeName(column)
+                    if isinstance(column, str)
+                    else [decodeName(value) for value in column]
+                    for column in values[1]
+                ],
+                objectRecord,
+                options,
+                source,
+            )
+        name = decodeName(values[0])
+        if marker == FUNCTION_MARKER:
+            return FunctionType(
+                marshalLoads(bytes.fromhex(decodeName(values[1]))), classDict, name
+            )
+        # Records written before object ids were added have no id
+        refId = values[-1] if isinstance(values[-1], int) else None
+        if marker == PICKLE_MARKER:
+            obj = refs.built(source)
+            if obj is not _missing:
+                return obj
+            obj = loads(bytes.fromhex(decodeName(values[1])))
+            return refs.define(
+                refId, (obj, classDict, name) if returnGlobalsForPickle else obj, source
+            )
+        params = None
+        if marker == INIT_MARKER:
+            params = values[2]
+            if not isinstance(params, int):
+                params = [decodeName(param) for param in params]
+        # Encrypted attributes decrypt to their serialized form
+        return _decodeObject(
+            refs, refId, marker, name, decodeName(values[1]), params, options, source
+        )
+
+    def visit(data, state):
+        if isinstance(data, str):
+            if data[:1] == TAG:
+                return decodeLeaf(data)
+            return data
+        elif isinstance(data, dict):
+            marker = _markerOf(data)
+            if marker is not None:
+                return decodeMarker(marker, next(iter(data.values())), data)
+            return _Expand(_dictChildren(data, None, None, decodeValue), _buildDict)
+        elif isinstance(data, (list, tuple)):
+            return _Expand(
+                _listChildren(data, None, decodeValue),
+                None if data.__class__ is list else data.__class__,
+            )
+        elif isinstance(data, set):
+            return _Expand(_listChildren(data, None, decodeValue), set)
+        return data
+
+    def decodeValue(data, state):
+        if data.__class__ is str and data[:1] == TAG:
+            return decodeLeaf(data)
+        return data
+
+    return _transformTree(serializedData, None, visit)
+
+
+
 def serialize(
     data: object,
     usePickleForClasses: bool = True,
@@ -15,9 +1275,17 @@ def serialize(
     encryptionDepth: int = -1,
     encryptedObjectTypes:list[object]=[],
     key: Bytes16 = None,
+    batchEncryption: bool = True,
+    tagged: bool = False,
+    columnar: bool = False,
+    cipher: str = BLOWFISH,
+    encryptOnce: bool = False,
+    stats: Stats = None,
+    options: SerializeOptions = None,
 ) -> object | tuple[object, (Bytes16 | bytes)]:
     """
 ### Serialize input data into a format suitable for secure-storage/transmission or supporting non-default supported objects.
+Numeric `array.array`s, `memoryview`s and NumPy arrays are stored as their raw bytes with their format and shape, encrypted as one value when numbers are, and come back as the same kind of array.
 -----
 ### Args:
     - `data` (`object`): The data to be serialized.
@@ -32,6 +1300,13 @@ def serialize(
     - `encryptNumbers` (`bool`, `optional`): Whether to encrypt numeric data. Defaults to `True`.
     - `encryptionDepth` (`int`, `optional`): Depth of encryption. Defaults to -1 (unlimited).
     - `key` (`Bytes`, `optional`): Encryption key (16 Bytes). If not provided, a random key will be generated and returned.
+    - `batchEncryption` (`bool`, `optional`): Whether to collect every value to be encrypted and encrypt them together instead of one cipher per value, the output is the same. Defaults to `True`.
+    - `tagged` (`bool`, `optional`): Whether to write the tagged format, encrypted values are prefixed with their type and functions/objects get a short marker key so `deserialize(..., tagged=True)` decodes every node without guessing and restores encrypted values with their type. Defaults to `False`.
+    - `columnar` (`bool`, `optional`): Whether to write lists of same-shaped dicts, or objects of one class, with plain values as their keys once and one list per column, a column that gets encrypted is encrypted as one value. `deserialize` reads them back as lists without an option. Defaults to `False`.
+    - `cipher` (`str`, `optional`): Cipher of the encrypted values, `"BLOWFISH"` (ECB, the same value always gives the same ciphertext), `"AES-GCM"` or `"CHACHA20-POLY1305"` (a random nonce per value and a tag so `deserialize` raises `IntegrityError` for modified values). The cipher is stored with each value so `deserialize` needs no option. Defaults to `"BLOWFISH"`.
+    - `encryptOnce` (`bool`, `optional`): Whether a value repeated in the data is encrypted once with `batchEncryption` and every occurrence gets its ciphertext, so `internStrings` can save it once. Always the case with Blowfish, with the authenticated ciphers it shows which encrypted values are equal. Defaults to `False`.
+    - `stats` (`Stats`, `optional`): Counts the encrypted values and the time spent encrypting them (stage "encrypt") into it. Defaults to `None`.
+    - `options` (`SerializeOptions`, `optional`): All of the above in one reusable object, the other arguments are ignored when it is given. Defaults to `None`.
 -----
 ### Returns:
     ```py
@@ -40,6 +1315,8 @@ if key is None -> Generates Random Key
     return (Object,Key)
         Key -> bytes(16 Bytes len)
     ```
+### Raises:
+    - `ValueError`: A list, tuple, set or dict contains itself, objects in a cycle are written as references instead.
 #### Example Usage:
         ```py
 from utils import generateEncryptionKey
@@ -95,195 +1372,8 @@ deserializedData.get("myFunc")()
     ```
     """
 
-    def encrypt(data, key, depth: int = 0):
-        if (depth > 0) or (depth == -1):
-            return Encrypt(str(data).encode("utf-8"), key)[0]
-        else:
-            return data
-
-    isNonKey = False
-    if not key:
-        key = generateEncryptionKey()
-        isNonKey = True
-
-    def Serialize(
-        data,
-        usePickleForClasses,
-        encryptCodeObjects,
-        encryptStdDataTypes,
-        encryptDictNames,
-        initObjects,
-        encryptStrings,
-        encryptNumbers,
-        encryptionDepth,
-        encryptedObjectTypes,
-        key,
-    ):
-        if isinstance(data, (list, tuple)):
-            return type(data)(
-                Serialize(
-                    item,
-                    usePickleForClasses,
-                    encryptCodeObjects,
-                    encryptStdDataTypes,
-                    encryptDictNames,
-                    initObjects,
-                    encryptStrings,
-                    encryptNumbers,
-                    encryptionDepth - 1 if encryptionDepth != -1 else -1,
-                    encryptedObjectTypes,
-                    key,
-                )
-                for item in data
-            )
-        elif isinstance(data, set):
-            return {
-                Serialize(
-                    item,
-                    usePickleForClasses,
-                    encryptCodeObjects,
-                    encryptStdDataTypes,
-                    encryptDictNames,
-                    initObjects,
-                    encryptStrings,
-                    encryptNumbers,
-                    encryptionDepth - 1 if encryptionDepth != -1 else -1,
-                    encryptedObjectTypes,
-                    key,
-                )
-                for item in data
-            }
-        elif isinstance(data, dict):
-            return {
-                (
-                    Serialize(
-                        k,
-                        usePickleForClasses,
-                        encryptCodeObjects,
-                        encryptStdDataTypes,
-                        encryptDictNames,
-                        initObjects,
-                        encryptStrings,
-                        encryptNumbers,
-                        encryptionDepth - 1 if encryptionDepth != -1 else -1,
-                        encryptedObjectTypes,
-                        key,
-                    )
-                    if encryptDictNames
-                    else k
-                ): Serialize(
-                    v,
-                    usePickleForClasses,
-                    encryptCodeObjects,
-                    encryptStdDataTypes,
-                    encryptDictNames,
-                    initObjects,
-                    encryptStrings,
-                    encryptNumbers,
-                    encryptionDepth - 1 if encryptionDepth != -1 else -1,
-                    encryptedObjectTypes,
-                    key,
-                )
-                for k, v in data.items()
-            }
-        elif callable(data):
-            serializedData = marshalDumps(data.__code__).hex()
-            encryptedData = (
-                encrypt(serializedData, key, encryptionDepth)
-                if encryptCodeObjects
-                else serializedData
-            )
-            return {
-                (
-                    encrypt(
-                        f"S_E_R_I_A_L_I_Z_E_D_FunctionMarshal" + data.__name__,
-                        key,
-                        encryptionDepth,
-                    )
-                    if encryptDictNames
-                    else f"S_E_R_I_A_L_I_Z_E_D_FunctionMarshal" + data.__name__
-                ): encryptedData
-            }
-        elif hasattr(data, "__dict__"):
-            serializedData = (
-                dumps(data)
-                if usePickleForClasses
-                else Serialize(
-                    data.__dict__,
-                    usePickleForClasses,
-                    encryptCodeObjects,
-                    encryptStdDataTypes,
-                    encryptDictNames,
-                    initObjects,
-                    encryptStrings,
-                    encryptNumbers,
-                    encryptionDepth - 1 if encryptionDepth != -1 else -1,
-                    encryptedObjectTypes,
-                    key,
-                )
-            )
-            if usePickleForClasses:
-                serializedData = serializedData.hex()
-            encryptedData = (
-                encrypt(serializedData, key, encryptionDepth)
-                if encryptCodeObjects
-                else serializedData
-            )
-            if (not initObjects) or usePickleForClasses:
-                return {
-                    (
-                        encrypt(
-                            f"S_E_R_I_A_L_I_Z_E_D_Object{'Pickle' if usePickleForClasses else 'Native'}"
-                            + data.__class__.__name__,
-                            key,
-                            encryptionDepth,
-                        )
-                        if encryptDictNames
-                        else f"S_E_R_I_A_L_I_Z_E_D_Object{'Pickle' if usePickleForClasses else 'Native'}"
-                    ): encryptedData
-                }
-            else:
-                return {
-                    (
-                        encrypt(
-                            f"S_E_R_I_A_L_I_Z_E_D_ObjectInitObject"
-                            + data.__class__.__name__,
-                            key,
-                            encryptionDepth,
-                        )
-                        if encryptDictNames
-                        else f"S_E_R_I_A_L_I_Z_E_D_ObjectInitObject"
-                        + data.__class__.__name__
-                    ): {
-                        "data": encryptedData,
-                        "params": Serialize(
-                            list(signature(data.__init__).parameters.keys()),
-                            usePickleForClasses,
-                            encryptCodeObjects,
-                            encryptStdDataTypes,
-                            encryptDictNames,
-                            initObjects,
-                            encryptStrings if not encryptCodeObjects else True,
-                            encryptNumbers,
-                            encryptionDepth - 1 if encryptionDepth != -1 else -1,
-                            encryptedObjectTypes,
-                            key,
-                        ),
-                    }
-                }
-        else:
-            if encryptStdDataTypes or (type(data) in encryptedObjectTypes):
-                return encrypt(data, key, encryptionDepth)
-            else:
-                if encryptStrings and isinstance(data, str):
-                    data = encrypt(data, key, encryptionDepth)
-                if encryptNumbers and isinstance(data, (int, float)):
-                    data = encrypt(data, key, encryptionDepth)
-                return data
-
-    return (
-        Serialize(
-            data,
+    if options is None:
+        options = SerializeOptions(
             usePickleForClasses,
             encryptCodeObjects,
             encryptStdDataTypes,
@@ -292,33 +1382,46 @@ deserializedData.get("myFunc")()
             encryptStrings,
             encryptNumbers,
             encryptionDepth,
-            encryptedObjectTypes,
-            key,
-        )
-        if not isNonKey
-        else (
-            Serialize(
-                data,
-                usePickleForClasses,
-                encryptCodeObjects,
-                encryptStdDataTypes,
-                encryptDictNames,
-                initObjects,
-                encryptStrings,
-                encryptNumbers,
-                encryptionDepth,
-                encryptedObjectTypes,
-                key,
-            ),
+            tuple(encryptedObjectTypes),
             key,
+            batchEncryption,
+            tagged,
+            columnar,
+            cipher,
+            encryptOnce,
+            stats,
         )
+    isNonKey = False
+    if not options.key:
+        options = replace(options, key=generateEncryptionKey())
+        isNonKey = True
+    batch = (
+        _LeafBatch(options.key, options.cipher, options.encryptOnce, options.stats)
+        if options.batchEncryption
+        else None
     )
+    serializedData = _serializeTree(data, options, batch)
+    if batch is not None:
+        serializedData = batch.resolve(serializedData)
+    return serializedData if not isNonKey else (serializedData, options.key)
 
 
 def initObj(
-    objName: str, classDict: dict, data, params: list, setAttrsAfterInit: bool = True
+    objName: str,
+    classDict: dict,
+    data,
+    params: list,
+    setAttrsAfterInit: bool = True,
+    obj: object = None,
 ):
-    obj = classDict.get(objName)(*[val for key, val in data.items() if key in params])
+    if not isinstance(params, (set, frozenset)):
+        params = set(params)
+    args = [val for key, val in data.items() if key in params]
+    if obj is None:
+        obj = classDict.get(objName)(*args)
+    else:
+        # Allocated before its attributes were deserialized since they refer back to it
+        obj.__init__(*args)
     if setAttrsAfterInit:
         [obj.__setattr__(key, val) for key, val in data.items() if key not in params]
     return obj
@@ -333,6 +1436,9 @@ def deserialize(
     parseDigits: bool = False,
     initObjects: bool = False,
     returnGlobalsForPickle: bool = False,
+    lazy: bool = False,
+    tagged: bool = False,
+    options: DeserializeOptions = None,
 ):
     """
     ### Deserialize input serialized data back into its original form.
@@ -346,6 +1452,9 @@ def deserialize(
         `parseDigits` (`bool`, `optional`): Whether to parse string data that represents numeric values into actual numeric types. Defaults to `False`.
         `initObjects` (`bool`, `optional`): Whether to initialize objects during deserialization. Defaults to `False`.
         `returnGlobalsForPickle` (`bool`, `optional`): Whether to return global scope for pickle deserialization. Defaults to `False`.
+        `lazy` (`bool`, `optional`): Whether to return `LazyDict`/`LazyList` proxies that deserialize a value the first time it is read, use `materialize` to get plain containers. Defaults to `False`.
+        `tagged` (`bool`, `optional`): Whether the data was serialized with `tagged=True`, nodes are then decoded from their tags so `isEncrypted` and `parseDigits` are not needed and encrypted values come back with their type. Defaults to `False`.
+        `options` (`DeserializeOptions`, `optional`): All of the above in one reusable object, the other arguments are ignored when it is given. Defaults to `None`.
     -----
     ### Returns:
         `object`: The deserialized data.
@@ -403,178 +1512,395 @@ def deserialize(
     deserializedData.get("myFunc")()
         ```
     """
-    if isEncrypted and not decryptionKey:
+    if options is None:
+        options = DeserializeOptions(
+            isEncrypted,
+            decryptionKey,
+            classDict,
+            setAttrsAfterInit,
+            parseDigits,
+            initObjects,
+            returnGlobalsForPickle,
+            lazy,
+            tagged,
+        )
+    if options.isEncrypted and not options.decryptionKey:
         raise ValueError(
-            f"Encryption Key Is Required For Decryption Process But Got KEY<{decryptionKey}>: Please Use key=b'urEncryptionKey'"
+            f"Encryption Key Is Required For Decryption Process But Got KEY<{options.decryptionKey}>: Please Use key=b'urEncryptionKey'"
         )
+    serializedData = externStrings(serializedData)
+    if options.lazy:
+        return _lazyValue(serializedData, options, _References(serializedData, options))
+    if isinstance(serializedData, _Deferred):
+        serializedData = serializedData.load()
+    return _deserializeTree(serializedData, options)
+
+
+def _mapStrings(data, replace):
+    """
+    Copies serialized data with every string, dict names included, replaced by `replace(string)`.
+    Containers are filled in place while walking with an explicit stack, tuples and sets are
+    built from their items once the walk is done.
+    """
+    if data.__class__ is str:
+        return replace(data)
+    elif not isinstance(data, (dict, list, tuple, set)):
+        return data
+    root = {} if isinstance(data, dict) else []
+    stack = [(root, data)]
+    # (container, key, items, class) of every tuple/set, children come after their parents
+    frozen = []
+    containers = (dict, list, tuple, set)
+    while stack:
+        target, node = stack.pop()
+        if isinstance(node, dict):
+            for k, v in node.items():
+                if k.__class__ is str:
+                    k = replace(k)
+                if v.__class__ is str:
+                    v = replace(v)
+                elif isinstance(v, containers):
+                    child = {} if isinstance(v, dict) else []
+                    stack.append((child, v))
+                    if not isinstance(v, (dict, list)):
+                        frozen.append((target, k, child, v.__class__))
+                    v = child
+                target[k] = v
+            continue
+        append = target.append
+        for v in node:
+            if v.__class__ is str:
+                v = replace(v)
+            elif isinstance(v, containers):
+                child = {} if isinstance(v, dict) else []
+                stack.append((child, v))
+                if not isinstance(v, (dict, list)):
+                    frozen.append((target, len(target), child, v.__class__))
+                v = child
+            append(v)
+    for target, k, items, cls in reversed(frozen):
+        target[k] = cls(items)
+    if isinstance(data, (tuple, set)):
+        return data.__class__(root)
+    return root
+
+
+def _replaceStrings(data, replace):
+    """
+    Same as `_mapStrings` but rewrites the dicts and lists of `data` in place instead of copying
+    them, for data nothing else refers to (E.g. just loaded from a file). Returns the new data.
+    """
+    if not (data.__class__ is dict or data.__class__ is list):
+        return _mapStrings(data, replace)
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if node.__class__ is dict:
+            items = list(node.items())
+            node.clear()
+            for k, v in items:
+                cls = v.__class__
+                if cls is str:
+                    v = replace(v)
+                elif cls is dict or cls is list:
+                    stack.append(v)
+                elif cls is tuple or cls is set:
+                    v = _mapStrings(v, replace)
+                node[replace(k) if k.__class__ is str else k] = v
+            continue
+        for index, v in enumerate(node):
+            cls = v.__class__
+            if cls is str:
+                node[index] = replace(v)
+            elif cls is dict or cls is list:
+                stack.append(v)
+            elif cls is tuple or cls is set:
+                node[index] = _mapStrings(v, replace)
+    return data
 
-    def decrypt(DATA, key):
-        try:
-            return Decrypt(DATA, key)
-        except:
-            return DATA
 
+class _StringTable(dict):
+    """
+    References of the strings added to a string table, a string gets the next index the first
+    time it is looked up so data is interned in the same walk that writes it.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.strings = []
+
+    def __missing__(self, string: str) -> str:
+        reference = self[string] = STRING_REF + str(len(self.strings))
+        self.strings.append(string)
+        return reference
+
+
+def internStrings(serializedData):
+    """
+    Replaces every string of serialized data, dict names included, with a reference to a table
+    of them so a string repeated across records (E.g. the property names of every widget) is
+    saved once. The data is copied once while the table is filled. Encrypted strings are only
+    repeated when they were encrypted once (Blowfish or `encryptOnce`). `deserialize` and
+    `externStrings` read it back.
+    Args:
+        serializedData (object): Serialized data
+    Returns:
+        dict: {STRINGS_KEY: [data with references, strings]}
+    """
+    table = _StringTable()
+    data = _mapStrings(serializedData, table.__getitem__)
+    return {STRINGS_KEY: [data, table.strings]}
+
+
+def externStrings(serializedData, inPlace: bool = False):
+    """
+    Returns data written by `internStrings` with its strings back in place, other data as it is.
+    Args:
+        serializedData (object): Serialized data
+        inPlace (bool, optional): Whether the dicts and lists of the data are rewritten instead of copied. Defaults to False.
+    Returns:
+        object: Serialized data
+    """
+    if not (
+        serializedData.__class__ is dict
+        and len(serializedData) == 1
+        and STRINGS_KEY in serializedData
+    ):
+        return serializedData
+    data, strings = serializedData[STRINGS_KEY]
+    references = {STRING_REF + str(index): string for index, string in enumerate(strings)}
+    if inPlace:
+        return _replaceStrings(data, references.__getitem__)
+    return _mapStrings(data, references.__getitem__)
+
+
+class _Serialized:
+    """Value of a lazy container that has not been deserialized yet"""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data) -> None:
+        self.data = data
+
+
+class _Deferred:
+    """
+    Serialized value stored outside of the serialized data (E.g. a record of an indexed file),
+    `load` reads the whole value and `lazy` what lazy containers are built from, the value itself by default.
+    """
+
+    __slots__ = ()
+
+    def load(self):
+        raise NotImplementedError
+
+    def lazy(self):
+        return self.load()
+
+
+def _isMarkerRecord(serializedData: dict, decryptionKey: Bytes16, tagged: bool) -> bool:
+    """Whether a serialized dict is a function/object record rather than a dict"""
+    if tagged:
+        return _markerOf(serializedData) is not None
+    if len(serializedData) != 1:
+        return False
+    # Serialized functions and objects are stored as a dict with a single marker key
+    firstKey = next(iter(serializedData))
+    try:
+        firstKey = Decrypt(firstKey, decryptionKey)
+    except:
+        pass
+    return isinstance(firstKey, str) and firstKey.startswith("S_E_R_I_A_L_I_Z_E_D_")
+
+
+def _lazyValue(serializedData, options: DeserializeOptions, refs: _References):
+    if isinstance(serializedData, _Deferred):
+        serializedData = serializedData.lazy()
     if isinstance(serializedData, dict):
-        if len(serializedData) == 1:
-            try:
-                firstKey, firstValue = list(serializedData.items())[0]
-            except:
-                print(list(serializedData.items())[0])
-                firstKey, firstValue = list(list(serializedData.items())[0])[0]
-            firstKey, firstValue = decrypt(firstKey, decryptionKey), decrypt(
-                firstValue, decryptionKey
-            )
-            if isinstance(firstKey, str) and isinstance(firstKey, str):
-                if firstKey.startswith("S_E_R_I_A_L_I_Z_E_D_FunctionMarshal"):
-                    return FunctionType(
-                        marshalLoads(bytes.fromhex(firstValue)),
-                        classDict,
-                        firstKey.split("S_E_R_I_A_L_I_Z_E_D_FunctionMarshal")[-1],
-                    )
-                elif firstKey.startswith("S_E_R_I_A_L_I_Z_E_D_ObjectNative"):
-                    if isinstance(firstValue, str):
-                        firstValue = eval(firstValue)
-                    return deserialize(
-                        firstValue,
-                        isEncrypted,
-                        decryptionKey,
-                        classDict,
-                        setAttrsAfterInit,
-                        parseDigits,
-                        initObjects,
-                        returnGlobalsForPickle,
-                    )
-                elif firstKey.startswith("S_E_R_I_A_L_I_Z_E_D_ObjectPickle"):
-                    return (
-                        (
-                            loads(bytes.fromhex(firstValue)),
-                            classDict,
-                            firstKey.split("S_E_R_I_A_L_I_Z_E_D_ObjectPickle")[-1],
-                        )
-                        if returnGlobalsForPickle
-                        else (
-                            loads(bytes.fromhex(firstValue)),
-                            classDict,
-                            firstKey.split("S_E_R_I_A_L_I_Z_E_D_ObjectPickle")[-1],
-                        )[0]
-                    )
-                elif firstKey.startswith("S_E_R_I_A_L_I_Z_E_D_ObjectInitObject"):
-                    params = deserialize(
-                        firstValue.get("params"),
-                        isEncrypted,
-                        decryptionKey,
-                        classDict,
-                        setAttrsAfterInit,
-                        parseDigits,
-                        initObjects,
-                        returnGlobalsForPickle,
-                    )
-                    decryptedData = decrypt(firstValue.get("data"), decryptionKey)
-                    if isinstance(decryptedData, str):
-                        decryptedData = eval(
-                            decrypt(firstValue.get("data"), decryptionKey)
-                        )
-                    return (
-                        initObj(
-                            firstKey.split("S_E_R_I_A_L_I_Z_E_D_ObjectInitObject")[-1],
-                            classDict,
-                            deserialize(
-                                decryptedData,
-                                isEncrypted,
-                                decryptionKey,
-                                classDict,
-                                setAttrsAfterInit,
-                                parseDigits,
-                                initObjects,
-                                returnGlobalsForPickle,
-                            ),
-                            params,
-                            setAttrsAfterInit,
-                        )
-                        if initObjects
-                        else deserialize(
-                            {
-                                firstKey.split("S_E_R_I_A_L_I_Z_E_D_ObjectInitObject")[
-                                    -1
-                                ]: {"data": decryptedData, "params": params}
-                            },
-                            isEncrypted,
-                            decryptionKey,
-                            classDict,
-                            setAttrsAfterInit,
-                            parseDigits,
-                            initObjects,
-                            returnGlobalsForPickle,
-                        )
-                    )
-        return dict(
-            [
-                (
-                    deserialize(
-                        k,
-                        isEncrypted,
-                        decryptionKey,
-                        classDict,
-                        setAttrsAfterInit,
-                        parseDigits,
-                        initObjects,
-                        returnGlobalsForPickle,
-                    ),
-                    deserialize(
-                        v,
-                        isEncrypted,
-                        decryptionKey,
-                        classDict,
-                        setAttrsAfterInit,
-                        parseDigits,
-                        initObjects,
-                        returnGlobalsForPickle,
-                    ),
-                )
-                for k, v in serializedData.items()
-            ]
-        )
+        if _isMarkerRecord(serializedData, options.decryptionKey, options.tagged):
+            return _deserializeTree(serializedData, options, refs)
+        return LazyDict(serializedData, options, refs)
     elif isinstance(serializedData, (list, tuple)):
-        return type(serializedData)(
-            deserialize(
-                item,
-                isEncrypted,
-                decryptionKey,
-                classDict,
-                setAttrsAfterInit,
-                parseDigits,
-                initObjects,
-                returnGlobalsForPickle,
-            )
-            for item in serializedData
+        return LazyList(serializedData, options, refs)
+    return _deserializeTree(serializedData, options, refs)
+
+
+class LazyDict(MutableMapping):
+    """
+    Dict returned by `deserialize(..., lazy=True)`, a value is deserialized the first time it is read.
+    String lookups are matched against the serialized keys directly, the keys are only all
+    deserialized when the dict is iterated, changed or the lookup misses.
+    """
+
+    def __init__(
+        self, serializedData: dict, options: DeserializeOptions, refs: _References = None
+    ) -> None:
+        self._serializedData = serializedData
+        self._options = options
+        self._refs = _References(serializedData, options) if refs is None else refs
+        self._data: dict | None = None
+        self._found: dict = {}
+
+    def _index(self) -> dict:
+        if self._data is None:
+            self._data = {}
+            for k, v in self._serializedData.items():
+                k = _deserializeTree(k, self._options)
+                self._data[k] = self._found.get(k, _Serialized(v))
+            self._serializedData = self._found = None
+        return self._data
+
+    def _lookup(self, key):
+        """Returns the serialized value of `key` without deserializing the other keys"""
+        isEncrypted, decryptionKey, parseDigits, tagged = (
+            self._options.isEncrypted,
+            self._options.decryptionKey,
+            self._options.parseDigits,
+            self._options.tagged,
         )
-    elif isinstance(serializedData, set):
-        return {
-            deserialize(
-                item,
-                isEncrypted,
-                decryptionKey,
-                classDict,
-                setAttrsAfterInit,
-                parseDigits,
-                initObjects,
-                returnGlobalsForPickle,
-            )
-            for item in serializedData
-        }
-    else:
-        if isEncrypted:
-            if not parseDigits:
-                return decrypt(serializedData, decryptionKey)
-            else:
-                decryptedData = decrypt(serializedData, decryptionKey)
-                if isinstance(decryptedData, str):
-                    if decryptedData.isnumeric():
-                        return eval(decryptedData)
-                    else:
-                        return decryptedData
-                else:
-                    return decryptedData
+        if not isinstance(key, str) or (parseDigits and key.isnumeric() and not tagged):
+            return _missing
+        if (isEncrypted or tagged) and decryptionKey:
+            # Blowfish ECB gives the same ciphertext for the same key, authenticated ciphers
+            # use a random nonce so their keys are only found by the full index
+            encryptedKey = (_leafTag(key) if tagged else "") + Encrypt(
+                key.encode("utf-8"), decryptionKey
+            )[0]
+            if encryptedKey in self._serializedData:
+                return self._serializedData[encryptedKey]
+        plainKey = _escapeTagged(key) if tagged else key
+        if plainKey in self._serializedData:
+            value = _deserializeTree(plainKey, self._options)
+            if value == key:
+                return self._serializedData[plainKey]
+        return _missing
+
+    def __getitem__(self, key):
+        if self._data is None:
+            if key in self._found:
+                return self._found[key]
+            value = self._lookup(key)
+            if value is not _missing:
+                value = self._found[key] = _lazyValue(value, self._options, self._refs)
+                return value
+        data = self._index()
+        value = data[key]
+        if isinstance(value, _Serialized):
+            value = data[key] = _lazyValue(value.data, self._options, self._refs)
+        return value
+
+    def __setitem__(self, key, value):
+        self._index()[key] = value
+
+    def __delitem__(self, key):
+        del self._index()[key]
+
+    def __iter__(self):
+        return iter(self._index())
+
+    def __len__(self) -> int:
+        if self._data is None:
+            return len(self._serializedData)
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return repr(materialize(self))
+
+
+class LazyList(MutableSequence):
+    """
+    List (or tuple) returned by `deserialize(..., lazy=True)`, an item is deserialized the first time it is read.
+    """
+
+    def __init__(
+        self,
+        serializedData: list | tuple,
+        options: DeserializeOptions,
+        refs: _References = None,
+    ) -> None:
+        self._type = type(serializedData)
+        self._data = [_Serialized(item) for item in serializedData]
+        self._options = options
+        self._refs = _References(serializedData, options) if refs is None else refs
+
+    def _value(self, index: int):
+        value = self._data[index]
+        if isinstance(value, _Serialized):
+            value = self._data[index] = _lazyValue(value.data, self._options, self._refs)
+        return value
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._value(i) for i in range(*index.indices(len(self._data)))]
+        return self._value(index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+        self._data[index] = value
+
+    def __delitem__(self, index):
+        del self._data[index]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def insert(self, index: int, value):
+        self._data.insert(index, value)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (list, tuple, LazyList)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(materialize(self))
+
+
+def materialize(data):
+    """
+    Returns `data` with every `LazyDict`/`LazyList` in it deserialized into a plain dict/list/tuple,
+    plain dicts and lists in it are updated in place so shared and cyclic ones stay so.
+    """
+    built = {}
+
+    def visit(node, state):
+        if id(node) in built:
+            return built[id(node)]
+        if isinstance(node, LazyDict):
+            children, build = _dictChildren(node, None, None), _buildDict
+        elif isinstance(node, LazyList):
+            children = [(item, None) for item in node]
+            build = None if node._type is list else node._type
+        elif isinstance(node, dict):
+            children = [(value, None) for value in node.values()]
+            build = partial(_updateValues, node)
+        elif isinstance(node, list):
+            children = [(item, None) for item in node]
+            build = partial(_updateItems, node)
+        elif isinstance(node, tuple):
+            children = [(item, None) for item in node]
+            build = node.__class__
         else:
+            return node
+        # A cycle back to a container that is still being built gets the container itself
+        built[id(node)] = node
+        return _Expand(children, partial(_remember, built, id(node), build))
+
+    return _transformTree(data, None, visit)
+
+
+def _remember(built: dict, key: int, build, values: list):
+    built[key] = result = values if build is None else build(values)
+    return result
+
+
+def _updateValues(data: dict, values: list) -> dict:
+    for key, value in zip(list(data), values):
+        data[key] = value
+    return data
+
 
-            return serializedData
+def _updateItems(data: list, values: list) -> list:
+    data[:] = values
+    return data
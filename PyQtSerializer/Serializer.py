@@ -1,8 +1,24 @@
-from PyQtSerializer.Serialize import serialize, deserialize, generateEncryptionKey
-from PyQtSerializer.utils import Bytes16
-from pickle import loads, dumps
-from typing import Literal
-import yaml
+from PyQtSerializer.Serialize import (
+    serialize,
+    deserialize,
+    generateEncryptionKey,
+    internStrings,
+    externStrings,
+)
+from PyQtSerializer.utils import Bytes16, BLOWFISH
+from PyQtSerializer.Binary import BinaryEncoder, BinaryDecoder
+from PyQtSerializer.Stream import JsonStreamWriter
+from PyQtSerializer.Indexed import IndexedFile, writeIndexed
+from PyQtSerializer.Document import DocumentWriter, decryptDocument
+from PyQtSerializer.Stats import Stats, stageOf, instrumented
+from PyQtSerializer.Yaml import dumpYaml, loadYaml
+from PyQtSerializer.Atomic import atomicWrite, checkFsyncPolicy, FSYNC_ALWAYS
+from pickle import loads, dumps, dump
+from io import BytesIO
+from threading import local
+from weakref import WeakSet
+from typing import Literal, Callable
+import os
 import json
 
 
@@ -13,11 +29,21 @@ class Default:
 default = Default()
 
 
+class _HexWriter:
+    """Text file wrapper that writes the bytes it is given as hex"""
+
+    def __init__(self, fileObj) -> None:
+        self.fileObj = fileObj
+
+    def write(self, data) -> int:
+        return self.fileObj.write(data.hex())
+
+
 class Serializer:
     def __init__(
         self,
         data: object,
-        saveFormat: Literal["JSON", "PICKLE", "YAML"],
+        saveFormat: Literal["JSON", "PICKLE", "YAML", "BINARY"],
         serializeData: bool = False,
         usePickleForClasses: bool = False,
         encryptCodeObjects: bool = False,
@@ -29,17 +55,25 @@ class Serializer:
         encryptionDepth: int = -1,
         encryptedObjectTypes: list[object] = [],
         key: Bytes16 = None,
+        tagged: bool = False,
+        columnar: bool = False,
+        indexed: bool = False,
+        cipher: str = BLOWFISH,
+        encryptDocument: bool = False,
+        internStrings: bool = False,
+        instrument: Callable[[Stats], None] = None,
+        fsync: Literal["ALWAYS", "ON_CLOSE", "NEVER"] = "ALWAYS",
     ) -> None:
         """
         ## Serializer
 
-        ##### `__init__(self, data: object, saveFormat: Literal["JSON", "PICKLE", "YAML"], serializeData: bool = False, usePickleForClasses: bool = False, encryptCodeObjects: bool = False, encryptStdDataTypes: bool = False, encryptDictNames: bool = False, initObjects: bool = False, encryptStrings: bool = False, encryptNumbers: bool = False, encryptionDepth: int = -1, encryptedObjectTypes: list[object] = [], key: Bytes16 = None) -> None`
+        ##### `__init__(self, data: object, saveFormat: Literal["JSON", "PICKLE", "YAML", "BINARY"], serializeData: bool = False, usePickleForClasses: bool = False, encryptCodeObjects: bool = False, encryptStdDataTypes: bool = False, encryptDictNames: bool = False, initObjects: bool = False, encryptStrings: bool = False, encryptNumbers: bool = False, encryptionDepth: int = -1, encryptedObjectTypes: list[object] = [], key: Bytes16 = None, tagged: bool = False, columnar: bool = False, indexed: bool = False, cipher: str = "BLOWFISH", encryptDocument: bool = False, internStrings: bool = False, instrument: Callable[[Stats], None] = None, fsync: str = "ALWAYS") -> None`
 
         Initialize Serializer object.
 
         #### Args:
         - `data` (object): The data to be serialized.
-        - `saveFormat` (Literal["JSON", "PICKLE", "YAML"]): The format to save the serialized data.
+        - `saveFormat` (Literal["JSON", "PICKLE", "YAML", "BINARY"]): The format to save the serialized data. "BINARY" encrypts while writing so the data is kept unserialized in memory.
         - `serializeData` (bool, optional): Whether to serialize the data during initialization. Defaults to False.
         - `usePickleForClasses` (bool, optional): Whether to use pickle serialization for class objects. Defaults to False.
         - `encryptCodeObjects` (bool, optional): Whether to encrypt code objects (e.g., Objects, Functions). Defaults to False.
@@ -51,6 +85,14 @@ class Serializer:
         - `encryptionDepth` (int, optional): Depth of encryption. Defaults to -1 (unlimited).
         - `encryptedObjectTypes` (list[object], optional): List of object types to be encrypted. Defaults to [].
         - `key` (Bytes16, optional): Encryption key (16 Bytes). If not provided, a random key will be generated and used. Defaults to None.
+        - `tagged` (bool, optional): Whether to serialize and deserialize the tagged format (see `serialize`), not used by "BINARY". Defaults to False.
+        - `columnar` (bool, optional): Whether to serialize lists of same-shaped records by column (see `serialize`), not used by "BINARY". Defaults to False.
+        - `indexed` (bool, optional): Whether to save an indexed file: the values below the first 3 levels of dicts and lists are stored as separate records with an index at the end of the file, `Deserialize` maps the file with `mmap` and with `lazy` only reads the records it reaches. Not used by "BINARY", `hex` is ignored. Defaults to False.
+        - `cipher` (str, optional): Cipher of the encrypted values, "BLOWFISH", "AES-GCM" or "CHACHA20-POLY1305" (see `serialize`), stored with each value or in the "BINARY" header so loading needs no option. Defaults to "BLOWFISH".
+        - `encryptDocument` (bool, optional): Whether to save the data without encrypting any value and encrypt the whole file with `cipher` while it is written instead, one nonce for the file and no padding or base64 per value. The per-value flags are ignored, `hex` too, and "AES-GCM"/"CHACHA20-POLY1305" check the whole file when it is loaded. "BLOWFISH" encrypts each file with its own key derived from a random 128 bit nonce so its keystream doesn't repeat across saves. Can't be used with `indexed`. Defaults to False.
+        - `internStrings` (bool, optional): Whether to save every repeated string, dict names included, once in a table that the data refers to by index (see `internStrings`), "JSON" fills the table while it is written. "BINARY" refers back to the first occurrence instead and "PICKLE" is saved as it is since pickle already saves a repeated string once. Loading needs no option. Can't be used with `indexed`. Defaults to False.
+        - `instrument` (Callable[[Stats], None], optional): Called with a `Stats` (time per stage, encrypted values, bytes written/read) after every `Serialize`, `StreamSerialize` and `Deserialize`, also kept as `lastStats`. Nothing is measured without it. Defaults to None.
+        - `fsync` (str, optional): Every file is written next to its path and moved over it once complete, so a crash never leaves a partly written file. "ALWAYS" syncs each save to disk before it replaces the old file and the directory after, "ON_CLOSE" syncs each save before it replaces the old file and the directories in the next `syncFiles()` call (run at exit), "NEVER" leaves it to the OS, a power loss can then leave an empty or partly written file. Defaults to "ALWAYS".
 
         ### `Serialize(self, filePath: str = default, hex: bool = False) -> str`
 
@@ -63,7 +105,19 @@ class Serializer:
         #### Returns:
         - `str`: File path where the serialized data is saved.
 
-        ### `Deserialize(self, filePath: str = default, hex: bool = False, deserializeData: bool = False, isEncrypted: bool = False, classDict: dict = default, setAttrsAfterInit: bool = False, parseDigits: bool = False, initObjects: bool = False, returnGlobalsForPickle: bool = False) -> object`
+        ### `StreamSerialize(self, data: object, filePath: str = default, hex: bool = False) -> str`
+
+        Serialize data and write it in a single pass, "JSON" and "BINARY" never build the serialized data in memory.
+
+        #### Args:
+        - `data` (object): The unserialized data to be written.
+        - `filePath` (str, optional): File path to save the serialized data. Defaults to default (current directory).
+        - `hex` (bool, optional): Whether to use hexadecimal encoding for serialization. Defaults to False.
+
+        #### Returns:
+        - `str`: File path where the serialized data is saved.
+
+        ### `Deserialize(self, filePath: str = default, hex: bool = False, deserializeData: bool = False, isEncrypted: bool = False, classDict: dict = default, setAttrsAfterInit: bool = False, parseDigits: bool = False, initObjects: bool = False, returnGlobalsForPickle: bool = False, lazy: bool = False) -> object`
 
         Deserialize data from the specified format.
 
@@ -77,6 +131,7 @@ class Serializer:
         - `parseDigits` (bool, optional): Whether to parse string data that represents numeric values into actual numeric types. Defaults to False.
         - `initObjects` (bool, optional): Whether to initialize objects during deserialization. Defaults to False.
         - `returnGlobalsForPickle` (bool, optional): Whether to return global scope for pickle deserialization. Defaults to False.
+        - `lazy` (bool, optional): Whether `deserializeData` returns proxies that deserialize values on first access (see `deserialize`), with `indexed` the records of the file are only read when reached. Not used by "BINARY". Defaults to False.
 
         #### Returns:
         - `object`: Deserialized data.
@@ -95,48 +150,151 @@ class Serializer:
         self.encryptionDepth = encryptionDepth
         self.encryptedObjectTypes = encryptedObjectTypes
         self.saveFormat = saveFormat.upper()
+        self.tagged = tagged
+        self.columnar = columnar
+        self.indexed = indexed
+        self.cipher = cipher
+        self.encryptDocument = encryptDocument
+        self.internStrings = internStrings
+        self.instrument = instrument
+        self.lastStats: Stats | None = None
+        self.fsync = checkFsyncPolicy(fsync)
+        # Stats of the operation running on each thread
+        self._activeStats = local()
+        # Indexed files lazily deserialized data still reads from, by their path
+        self._indexedFiles: dict[str, WeakSet] = {}
+        if indexed and encryptDocument:
+            raise ValueError("Indexed Files Can't Be Encrypted As One Document")
+        if indexed and internStrings:
+            raise ValueError("Indexed Files Can't Use A String Table")
         if serializeData:
-            self.data = serialize(
-                self.data,
-                usePickleForClasses,
-                encryptCodeObjects,
-                encryptStdDataTypes,
-                encryptDictNames,
-                initObjects,
-                encryptStrings,
-                encryptNumbers,
-                encryptionDepth,
-                encryptedObjectTypes,
+            self.data = self._serializeData(self.data)
+
+    def _serialize(self):
+        self.data = self._serializeData(self.data)
+
+    def _serializeData(self, data: object) -> object:
+        if self.saveFormat == "BINARY":
+            # Encrypted by the binary encoder while writing
+            return data
+        stats = self._stats()
+        with stageOf(stats, "serialize"):
+            return serialize(
+                data,
+                *self._serializeFlags(),
                 self.encryptionKey,
+                tagged=self.tagged,
+                columnar=self.columnar,
+                cipher=self.cipher,
+                encryptOnce=self.internStrings,
+                stats=stats,
             )
 
-    def _serialize(self):
-        self.data = serialize(
-            self.data,
+    def _stats(self) -> Stats | None:
+        """`Stats` of the operation running on this thread, None when nothing is measured"""
+        return getattr(self._activeStats, "stats", None)
+
+    def _startStats(self, operation: str, stats: Stats = None) -> Stats:
+        """Measures the calls made on this thread into a new `Stats` of `operation` or into `stats`"""
+        if stats is None:
+            stats = Stats(operation)
+        self._activeStats.stats = stats
+        stats._resume()
+        return stats
+
+    def _pauseStats(self, stats: Stats):
+        stats._pause()
+        self._activeStats.stats = None
+
+    def _finishStats(self, stats: Stats):
+        self._pauseStats(stats)
+        self.lastStats = stats
+        self.instrument(stats)
+
+    def _written(self, filePath: str) -> str:
+        """Counts a saved file into the running `Stats`, returns `filePath`"""
+        stats = self._stats()
+        if stats is not None:
+            stats.filePath = filePath
+            stats.bytesWritten += os.path.getsize(filePath)
+        return filePath
+
+    def _serializeFlags(self) -> tuple:
+        """
+        The flags of `serialize` from `usePickleForClasses` to `encryptedObjectTypes`,
+        with `encryptDocument` no value is encrypted on its own
+        """
+        encrypt = not self.encryptDocument
+        return (
             self.usePickleForClasses,
-            self.encryptCodeObjects,
-            self.encryptStdDataTypes,
-            self.encryptDictNames,
+            encrypt and self.encryptCodeObjects,
+            encrypt and self.encryptStdDataTypes,
+            encrypt and self.encryptDictNames,
             self.initObjects,
-            self.encryptStrings,
-            self.encryptNumbers,
+            encrypt and self.encryptStrings,
+            encrypt and self.encryptNumbers,
             self.encryptionDepth,
-            self.encryptedObjectTypes,
-            self.encryptionKey,
+            self.encryptedObjectTypes if encrypt else [],
         )
 
+    @instrumented("save", "write")
     def Serialize(
         self,
         filePath: str = default,
         hex: bool = False,
     ):
-        if self.saveFormat == "JSON":
-            return Serializer._JsonSerialize(self.data, filePath)
+        self._detachIndexedFiles(self._filePath(filePath))
+        if self.indexed and self.saveFormat != "BINARY":
+            filePath = self._IndexedSerialize(self.data, filePath)
+        elif self.encryptDocument:
+            filePath = self._DocumentSerialize(self.data, filePath)
+        elif self.saveFormat == "JSON":
+            filePath = Serializer._JsonSerialize(
+                self._fileData(self.data), filePath, self.fsync
+            )
+        elif self.saveFormat == "YAML":
+            filePath = Serializer._YamlSerialize(
+                self._fileData(self.data), filePath, self.fsync
+            )
+        elif self.saveFormat == "BINARY":
+            filePath = self._BinarySerialize(self.data, filePath)
+        else:
+            filePath = Serializer._PickleSerialize(
+                self._fileData(self.data), filePath, hex, self.fsync
+            )
+        return self._written(filePath)
+
+    @instrumented("save", "write")
+    def StreamSerialize(
+        self,
+        data: object,
+        filePath: str = default,
+        hex: bool = False,
+    ):
+        self._detachIndexedFiles(self._filePath(filePath))
+        if self.indexed and self.saveFormat != "BINARY":
+            filePath = self._IndexedSerialize(self._serializeData(data), filePath)
+        elif self.encryptDocument:
+            filePath = self._DocumentSerialize(data, filePath, stream=True)
+        elif self.saveFormat == "JSON":
+            filePath = self._filePath(filePath)
+            with atomicWrite(
+                filePath, "w", self.fsync, encoding="utf-8", errors="ignore"
+            ) as serializedFile:
+                self._jsonStreamWriter().write(data, serializedFile)
+        elif self.saveFormat == "BINARY":
+            filePath = self._BinarySerialize(data, filePath)
         elif self.saveFormat == "YAML":
-            return Serializer._YamlSerialize(self.data, filePath)
+            filePath = Serializer._YamlSerialize(
+                self._fileData(self._serializeData(data)), filePath, self.fsync
+            )
         else:
-            return Serializer._PickleSerialize(self.data, filePath, hex)
+            filePath = Serializer._PickleSerialize(
+                self._fileData(self._serializeData(data)), filePath, hex, self.fsync
+            )
+        return self._written(filePath)
 
+    @instrumented("load")
     def Deserialize(
         self,
         filePath: str = default,
@@ -148,39 +306,269 @@ class Serializer:
         parseDigits: bool = False,
         initObjects: bool = False,
         returnGlobalsForPickle: bool = False,
+        lazy: bool = False,
     ):
         data = self.data
-        if self.saveFormat == "JSON":
-            data = Serializer._JsonDeserialize(filePath)
+        stats = self._stats()
+        if stats is not None:
+            stats.filePath = self._filePath(filePath)
+            stats.bytesRead += os.path.getsize(stats.filePath)
+        with stageOf(stats, "read"):
+            if self.indexed and self.saveFormat != "BINARY":
+                data = self._IndexedDeserialize(filePath, lazy and deserializeData)
+            elif self.encryptDocument:
+                data = self._DocumentDeserialize(filePath)
+                if self.saveFormat == "BINARY":
+                    with stageOf(stats, "deserialize"):
+                        return self._decodeBinary(
+                            data, classDict, setAttrsAfterInit, initObjects, returnGlobalsForPickle
+                        )
+            elif self.saveFormat == "JSON":
+                data = Serializer._JsonDeserialize(filePath)
+            elif self.saveFormat == "YAML":
+                data = Serializer._YamlDeserialize(filePath)
+            elif self.saveFormat == "BINARY":
+                # Values carry their own encryption tags so they are always decoded
+                return self._BinaryDeserialize(
+                    filePath,
+                    classDict,
+                    setAttrsAfterInit,
+                    initObjects,
+                    returnGlobalsForPickle,
+                )
+            else:
+                data = Serializer._PickleDeserialize(filePath, hex)
+        with stageOf(stats, "deserialize"):
+            data = externStrings(data, inPlace=True)
+            if deserializeData:
+                data = self._deserializeData(
+                    data,
+                    isEncrypted,
+                    classDict,
+                    setAttrsAfterInit,
+                    parseDigits,
+                    initObjects,
+                    returnGlobalsForPickle,
+                    lazy,
+                )
+        return data
+
+    def _fileData(self, data: object) -> object:
+        """
+        Serialized data as it is saved, with `internStrings` its strings are moved to a table
+        ("BINARY" refers back to repeated strings while it is encoded and pickle already saves
+        a repeated string once)
+        """
+        if self.internStrings and self.saveFormat not in ("BINARY", "PICKLE"):
+            with stageOf(self._stats(), "intern"):
+                return internStrings(data)
+        return data
+
+    def _deserializeData(
+        self,
+        data: object,
+        isEncrypted: bool = False,
+        classDict: dict = default,
+        setAttrsAfterInit: bool = False,
+        parseDigits: bool = False,
+        initObjects: bool = False,
+        returnGlobalsForPickle: bool = False,
+        lazy: bool = False,
+    ) -> object:
+        if isinstance(classDict, Default):
+            classDict = globals()
+        return deserialize(
+            data,
+            # Values of an encrypted document are never encrypted on their own
+            isEncrypted and not self.encryptDocument,
+            self.encryptionKey,
+            classDict,
+            setAttrsAfterInit,
+            parseDigits,
+            initObjects,
+            returnGlobalsForPickle,
+            lazy,
+            self.tagged,
+        )
+
+    def _filePath(self, filePath: str = default) -> str:
+        if not isinstance(filePath, Default):
+            return filePath
+        elif self.saveFormat == "JSON":
+            return f"_serializedObj.json"
         elif self.saveFormat == "YAML":
-            data = Serializer._YamlDeserialize(filePath)
-        else:
-            data = Serializer._PickleDeserialize(filePath, hex)
+            return f"_serializedObj.yaml"
+        elif self.saveFormat == "BINARY":
+            return f"_serializedObj.bin"
+        return f"_serializedObj.pkl"
+
+    def _jsonStreamWriter(self) -> JsonStreamWriter:
+        return JsonStreamWriter(
+            self.encryptionKey,
+            *self._serializeFlags(),
+            self.tagged,
+            self.columnar,
+            self.cipher,
+            self.internStrings,
+            self.internStrings,
+            self._stats(),
+        )
+
+    def _binaryEncoder(self) -> BinaryEncoder:
+        return BinaryEncoder(
+            self.encryptionKey,
+            *self._serializeFlags(),
+            self.cipher,
+            self.internStrings,
+            self._stats(),
+        )
+
+    def _encodeBinary(self, data: object) -> bytes:
+        return self._binaryEncoder().encode(data)
+
+    def _decodeBinary(
+        self,
+        data: bytes,
+        classDict: dict = default,
+        setAttrsAfterInit: bool = False,
+        initObjects: bool = False,
+        returnGlobalsForPickle: bool = False,
+    ) -> object:
         if isinstance(classDict, Default):
             classDict = globals()
-        if deserializeData:
-            data = deserialize(
-                data,
-                isEncrypted,
-                self.encryptionKey,
-                classDict,
-                setAttrsAfterInit,
-                parseDigits,
-                initObjects,
-                returnGlobalsForPickle,
+        return BinaryDecoder(
+            self.encryptionKey,
+            classDict,
+            setAttrsAfterInit,
+            initObjects,
+            returnGlobalsForPickle,
+            self._stats(),
+        ).decode(data)
+
+    def _BinarySerialize(self, data: object, filePath: str = default):
+        filePath = self._filePath(filePath)
+        with atomicWrite(filePath, "wb", self.fsync) as serializedFile:
+            self._binaryEncoder().encodeTo(data, serializedFile)
+        return filePath
+
+    def _BinaryDeserialize(
+        self,
+        filePath: str = default,
+        classDict: dict = default,
+        setAttrsAfterInit: bool = False,
+        initObjects: bool = False,
+        returnGlobalsForPickle: bool = False,
+    ):
+        with open(self._filePath(filePath), "rb") as serializedFile:
+            data = serializedFile.read()
+        with stageOf(self._stats(), "deserialize"):
+            return self._decodeBinary(
+                data, classDict, setAttrsAfterInit, initObjects, returnGlobalsForPickle
             )
-        return data
+
+    def _IndexedSerialize(self, data: object, filePath: str = default):
+        return writeIndexed(
+            data,
+            self._filePath(filePath),
+            self.saveFormat,
+            self.encryptionKey,
+            self.tagged,
+            self.fsync,
+        )
+
+    def _IndexedDeserialize(self, filePath: str = default, lazy: bool = False):
+        filePath = self._filePath(filePath)
+        indexedFile = IndexedFile(filePath, self.saveFormat)
+        if lazy:
+            # Records are read from the mapped file when a lazy container reaches them
+            self._indexedFiles.setdefault(os.path.abspath(filePath), WeakSet()).add(
+                indexedFile
+            )
+            return indexedFile
+        with indexedFile:
+            return indexedFile.load()
+
+    def _detachIndexedFiles(self, filePath: str):
+        """Unmaps the indexed files lazy data reads from before `filePath` is saved over"""
+        for indexedFile in self._indexedFiles.pop(os.path.abspath(filePath), ()):
+            indexedFile.detach()
+
+    def _writeDocument(self, data: object, fileObj, stream: bool = False):
+        """
+        Writes the unencrypted file of the save format, `data` is serialized unless `stream`
+        is set ("JSON" and "BINARY" then serialize it while writing) or the format is "BINARY"
+        """
+        if self.saveFormat == "BINARY":
+            self._binaryEncoder().encodeTo(data, fileObj)
+            return
+        elif stream and self.saveFormat == "JSON":
+            self._jsonStreamWriter().write(data, fileObj)
+            return
+        elif stream:
+            data = self._serializeData(data)
+        data = self._fileData(data)
+        if self.saveFormat == "JSON":
+            json.dump(data, fileObj)
+        elif self.saveFormat == "YAML":
+            dumpYaml(data, fileObj)
+        else:
+            dump(data, fileObj)
+
+    def _readDocument(self, data: bytes) -> object:
+        """Reads the unencrypted file of the save format, "BINARY" data is returned still encoded"""
+        if self.saveFormat == "JSON":
+            return json.loads(data)
+        elif self.saveFormat == "YAML":
+            return loadYaml(data.decode("utf-8"))
+        elif self.saveFormat == "BINARY":
+            return data
+        return loads(data)
+
+    def _DocumentSerialize(self, data: object, filePath: str = default, stream: bool = False):
+        filePath = self._filePath(filePath)
+        with atomicWrite(filePath, "wb", self.fsync) as serializedFile:
+            with DocumentWriter(
+                serializedFile, self.saveFormat, self.encryptionKey, self.cipher, self._stats()
+            ) as documentWriter:
+                self._writeDocument(data, documentWriter, stream)
+        return filePath
+
+    def _DocumentDeserialize(self, filePath: str = default) -> object:
+        with open(self._filePath(filePath), "rb") as serializedFile:
+            data = serializedFile.read()
+        with stageOf(self._stats(), "decrypt"):
+            data = decryptDocument(data, self.saveFormat, self.encryptionKey)
+        return self._readDocument(data)
+
+    def _encryptRecord(self, record: object) -> bytes:
+        """Encrypts a journal record as a document, serialized or encoded "BINARY" bytes"""
+        recordFile = BytesIO()
+        with DocumentWriter(
+            recordFile, self.saveFormat, self.encryptionKey, self.cipher, self._stats()
+        ) as documentWriter:
+            if self.saveFormat == "BINARY":
+                documentWriter.write(record)
+            else:
+                self._writeDocument(record, documentWriter)
+        return recordFile.getvalue()
+
+    def _decryptRecord(self, record: bytes) -> object:
+        with stageOf(self._stats(), "decrypt"):
+            record = decryptDocument(record, self.saveFormat, self.encryptionKey)
+        return self._readDocument(record)
 
     @staticmethod
     def _JsonSerialize(
         data: dict[str, object],
         filePath: str = default,
+        fsync: str = FSYNC_ALWAYS,
     ):
         if isinstance(filePath, Default):
             filePath = f"_serializedObj.json"
-        data = json.dumps(data)
-        with open(filePath, "w", encoding="utf-8", errors="ignore") as serializedFile:
-            serializedFile.write(data)
+        with atomicWrite(
+            filePath, "w", fsync, encoding="utf-8", errors="ignore"
+        ) as serializedFile:
+            json.dump(data, serializedFile)
         return filePath
 
     @staticmethod
@@ -192,20 +580,21 @@ class Serializer:
 
     @staticmethod
     def _PickleSerialize(
-        data: dict[str, object], filePath: str = default, hex: bool = False
+        data: dict[str, object],
+        filePath: str = default,
+        hex: bool = False,
+        fsync: str = FSYNC_ALWAYS,
     ):
         if isinstance(filePath, Default):
             filePath = f"_serializedObj.pkl"
-        data = dumps(data)
-        if hex:
-            data = data.hex()
-        with open(
+        with atomicWrite(
             filePath,
             "w" if hex else "wb",
+            fsync,
             encoding=("utf-8" if hex else None),
             errors=("ignore" if hex else None),
         ) as serializedFile:
-            serializedFile.write(data)
+            dump(data, _HexWriter(serializedFile) if hex else serializedFile)
         return filePath
 
     @staticmethod
@@ -225,17 +614,15 @@ class Serializer:
             return loads(data)
 
     @staticmethod
-    def _YamlSerialize(data: dict[str, object], filePath: str = default):
+    def _YamlSerialize(
+        data: dict[str, object], filePath: str = default, fsync: str = FSYNC_ALWAYS
+    ):
         if isinstance(filePath, Default):
             filePath = f"_serializedObj.yaml"
-        data = yaml.dump(data)
-        with open(
-            filePath,
-            "w" if hex else "wb",
-            encoding=("utf-8" if hex else None),
-            errors=("ignore" if hex else None),
+        with atomicWrite(
+            filePath, "w", fsync, encoding="utf-8", errors="ignore"
         ) as serializedFile:
-            serializedFile.write(data)
+            dumpYaml(data, serializedFile)
         return filePath
 
     @staticmethod
@@ -244,4 +631,4 @@ class Serializer:
             filePath = f"_serializedObj.yaml"
         with open(filePath, "r", encoding="utf-8", errors="ignore") as serializedFile:
             data = serializedFile.read()
-        return yaml.full_load(data)
+        return loadYaml(data)
@@ -0,0 +1,144 @@
+from contextlib import nullcontext
+from functools import wraps
+from time import perf_counter
+
+# Returned by `stageOf` when nothing is measured
+_noStage = nullcontext()
+
+
+class Stats:
+    """
+    Counts and stage times of one save or load, given to the `instrument` callback of
+    `Serializer`/`PyQtSerializer` when it is done. A stage's time excludes the stages measured
+    inside it (E.g. "encrypt" inside "serialize"), so the stages add up to the measured time.
+    Stages: "findChildren", "serializeWidget", "serialize", "encrypt", "intern", "write",
+    "journal", "read", "decrypt", "deserialize" and "restore".
+    """
+
+    __slots__ = (
+        "operation",
+        "filePath",
+        "seconds",
+        "stages",
+        "widgets",
+        "widgetsSerialized",
+        "leavesEncrypted",
+        "bytesWritten",
+        "bytesRead",
+        "error",
+        "_running",
+        "_since",
+    )
+
+    def __init__(self, operation: str) -> None:
+        self.operation = operation
+        self.filePath = None
+        self.seconds = 0.0
+        # Stage name to seconds, in the order the stages first ran
+        self.stages = {}
+        self.widgets = 0
+        self.widgetsSerialized = 0
+        self.leavesEncrypted = 0
+        self.bytesWritten = 0
+        self.bytesRead = 0
+        # Name of the exception that ended the operation
+        self.error = None
+        self._running = []
+        self._since = 0.0
+
+    def stage(self, name: str) -> "_Stage":
+        """Context manager that adds the time spent in it to stage `name`"""
+        return _Stage(self, name)
+
+    def _resume(self):
+        """Starts (or continues, E.g. on the thread that writes a background save) timing the operation"""
+        now = perf_counter()
+        self.seconds -= now
+        self._since = now
+
+    def _pause(self):
+        now = perf_counter()
+        self._switch(now)
+        self.seconds += now
+
+    def _switch(self, now: float):
+        """Adds the time since the last switch to the running stage"""
+        if self._running:
+            name = self._running[-1]
+            self.stages[name] = self.stages.get(name, 0.0) + (now - self._since)
+        self._since = now
+
+    def asDict(self) -> dict:
+        return {
+            "operation": self.operation,
+            "filePath": self.filePath,
+            "seconds": self.seconds,
+            "stages": dict(self.stages),
+            "widgets": self.widgets,
+            "widgetsSerialized": self.widgetsSerialized,
+            "leavesEncrypted": self.leavesEncrypted,
+            "bytesWritten": self.bytesWritten,
+            "bytesRead": self.bytesRead,
+            "error": self.error,
+        }
+
+    def __repr__(self) -> str:
+        stages = ", ".join(f"{name}={seconds * 1000:.2f}ms" for name, seconds in self.stages.items())
+        return (
+            f"Stats({self.operation} {self.seconds * 1000:.2f}ms [{stages}] widgets={self.widgets}"
+            f" leavesEncrypted={self.leavesEncrypted} bytesWritten={self.bytesWritten}"
+            f" bytesRead={self.bytesRead})"
+        )
+
+
+class _Stage:
+    __slots__ = ("stats", "name")
+
+    def __init__(self, stats: Stats, name: str) -> None:
+        self.stats = stats
+        self.name = name
+
+    def __enter__(self):
+        self.stats._switch(perf_counter())
+        self.stats._running.append(self.name)
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.stats._switch(perf_counter())
+        self.stats._running.pop()
+
+
+def stageOf(stats: Stats | None, name: str):
+    """`stats.stage(name)`, a context manager that does nothing without `stats`"""
+    return _noStage if stats is None else stats.stage(name)
+
+
+def instrumented(operation: str, stage: str = None):
+    """
+    Decorates a `Serializer` method so a call made while its `instrument` callback is set is
+    measured as one `operation` and reported to it, a call made during an operation adds to it.
+    The time of the call outside of the stages measured in it goes to `stage`.
+    """
+
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.instrument is None:
+                return method(self, *args, **kwargs)
+            stats = self._stats()
+            if stats is not None:
+                with stageOf(stats, stage) if stage else _noStage:
+                    return method(self, *args, **kwargs)
+            stats = self._startStats(operation)
+            try:
+                with stageOf(stats, stage) if stage else _noStage:
+                    return method(self, *args, **kwargs)
+            except BaseException as e:
+                stats.error = type(e).__name__
+                raise
+            finally:
+                self._finishStats(stats)
+
+        return wrapper
+
+    return decorator
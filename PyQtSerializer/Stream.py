@@ -0,0 +1,246 @@
+from PyQtSerializer.utils import Bytes16, BLOWFISH
+from PyQtSerializer.Stats import Stats
+from PyQtSerializer.Serialize import (
+    SerializeOptions,
+    _serializeTree,
+    _sharedObjects,
+    _LeafBatch,
+    _columnarKeys,
+    _isArray,
+    _PendingLeaf,
+    _leafTag,
+    _escapeTagged,
+    _mapStrings,
+    _StringTable,
+    STRINGS_KEY,
+)
+from json.encoder import encode_basestring_ascii
+import json
+
+_encoder = json.JSONEncoder()
+# Returned by `next` when a container has no items left
+_end = object()
+
+
+def _jsonKey(key) -> str:
+    # Same key conversions as json.dumps
+    if isinstance(key, str):
+        return key
+    elif isinstance(key, (bool, int, float)) or key is None:
+        return _encoder.encode(key)
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {key.__class__.__name__}"
+    )
+
+
+class JsonStreamWriter:
+    """
+    Writes the JSON text of `serialize(data)` to a file object while walking `data` once.
+    Encrypted values are queued and encrypted together every `flushSize` characters of
+    output, so only the pending text and the current nesting path are held in memory.
+    The flags have the same meaning as in `serialize`, `stats` counts the encrypted values into a `Stats`.
+    With `internStrings` the strings are moved to a string table as they are written (see
+    `internStrings`), the table is written after the data once it is complete.
+    """
+
+    flushSize = 1 << 16
+
+    def __init__(
+        self,
+        key: Bytes16,
+        usePickleForClasses: bool = True,
+        encryptCodeObjects: bool = True,
+        encryptStdDataTypes: bool = True,
+        encryptDictNames: bool = True,
+        initObjects: bool = True,
+        encryptStrings: bool = True,
+        encryptNumbers: bool = True,
+        encryptionDepth: int = -1,
+        encryptedObjectTypes: list[object] = [],
+        tagged: bool = False,
+        columnar: bool = False,
+        cipher: str = BLOWFISH,
+        encryptOnce: bool = False,
+        internStrings: bool = False,
+        stats: Stats = None,
+    ) -> None:
+        self.key = key
+        self.usePickleForClasses = usePickleForClasses
+        self.encryptCodeObjects = encryptCodeObjects
+        self.encryptStdDataTypes = encryptStdDataTypes
+        self.encryptDictNames = encryptDictNames
+        self.initObjects = initObjects
+        self.encryptStrings = encryptStrings
+        self.encryptNumbers = encryptNumbers
+        self.encryptionDepth = encryptionDepth
+        self.encryptedObjectTypes = encryptedObjectTypes
+        self.tagged = tagged
+        self.columnar = columnar
+        self.cipher = cipher
+        self.encryptOnce = encryptOnce
+        self.internStrings = internStrings
+        self.stats = stats
+        self._fileObj = None
+        self._batch = None
+        self._memo = None
+        self._schemas = None
+        self._shared = None
+        self._strings = None
+        self._fragments = []
+        self._fragmentsSize = 0
+
+    def write(self, data: object, fileObj):
+        self._fileObj = fileObj
+        self._batch = _LeafBatch(self.key, self.cipher, self.encryptOnce, self.stats)
+        # Shared by the objects so references between them match `serialize`
+        self._memo = {}
+        self._schemas = {}
+        # Found over all of the data since the objects are serialized one at a time
+        self._shared = _sharedObjects(data, self.usePickleForClasses)
+        self._strings = _StringTable() if self.internStrings else None
+        try:
+            if self._strings is not None:
+                self._emit("{" + encode_basestring_ascii(STRINGS_KEY) + ": [")
+            self._writeValue(data, self.encryptionDepth)
+            self._flush()
+            if self._strings is not None:
+                fileObj.write(", " + json.dumps(self._strings.strings) + "]}")
+        finally:
+            self._fileObj = None
+            self._batch = None
+            self._memo = None
+            self._schemas = None
+            self._shared = None
+            self._strings = None
+            self._fragments = []
+            self._fragmentsSize = 0
+
+    def _serializeWhole(self, data, depth: int):
+        options = SerializeOptions(
+            self.usePickleForClasses,
+            self.encryptCodeObjects,
+            self.encryptStdDataTypes,
+            self.encryptDictNames,
+            self.initObjects,
+            self.encryptStrings,
+            self.encryptNumbers,
+            depth,
+            tuple(self.encryptedObjectTypes),
+            self.key,
+            tagged=self.tagged,
+            columnar=self.columnar,
+            cipher=self.cipher,
+            encryptOnce=self.encryptOnce,
+            stats=self.stats,
+        )
+        batch = _LeafBatch(self.key, self.cipher, self.encryptOnce, self.stats)
+        data = batch.resolve(
+            _serializeTree(data, options, batch, self._memo, self._schemas, self._shared)
+        )
+        if self._strings is not None:
+            return _mapStrings(data, self._strings.__getitem__)
+        return data
+
+    def _emit(self, text: str):
+        self._fragments.append(text)
+        self._fragmentsSize += len(text)
+        if self._fragmentsSize >= self.flushSize:
+            self._flush()
+
+    def _flush(self):
+        self._batch.flush()
+        intern = self._strings.__getitem__ if self._strings is not None else str
+        self._fileObj.write(
+            "".join(
+                (
+                    encode_basestring_ascii(intern(fragment.value))
+                    if isinstance(fragment, _PendingLeaf)
+                    else fragment
+                )
+                for fragment in self._fragments
+            )
+        )
+        self._fragments = []
+        self._fragmentsSize = 0
+
+    def _serializeLeaf(self, data, depth: int):
+        """Returns the leaf as `serialize` leaves it or a `_PendingLeaf` when it gets encrypted"""
+        if not ((depth > 0) or (depth == -1)):
+            return _escapeTagged(data) if self.tagged else data
+        if (
+            self.encryptStdDataTypes
+            or (type(data) in self.encryptedObjectTypes)
+            or (self.encryptStrings and isinstance(data, str))
+            or (self.encryptNumbers and isinstance(data, (int, float)))
+        ):
+            leaf = self._batch.add(data, _leafTag(data) if self.tagged else "")
+            # Roughly the base64 size of the ciphertext
+            self._fragmentsSize += len(leaf.data) * 4 // 3
+            return leaf
+        return _escapeTagged(data) if self.tagged else data
+
+    def _writeValue(self, data, depth: int):
+        """Writes `data` with an explicit stack so nesting depth is only limited by memory"""
+        # [items, closing bracket, depth of the items, whether they are dict items, whether
+        # one was written] of every container being written
+        stack = []
+        while True:
+            if self.columnar and (_columnarKeys(data) is not None):
+                # Its columns are encrypted as whole values
+                self._emit(json.dumps(self._serializeWhole(data, depth)))
+            elif isinstance(data, (list, tuple)):
+                self._emit("[")
+                stack.append([iter(data), "]", depth - 1 if depth != -1 else -1, False, False])
+            elif isinstance(data, dict):
+                self._emit("{")
+                stack.append(
+                    [iter(data.items()), "}", depth - 1 if depth != -1 else -1, True, False]
+                )
+            elif isinstance(data, set):
+                raise TypeError("Object of type set is not JSON serializable")
+            elif callable(data) or hasattr(data, "__dict__") or _isArray(data):
+                # Serialized as a whole since its encrypted payload is the text of its serialized form
+                self._emit(json.dumps(self._serializeWhole(data, depth)))
+            else:
+                leaf = self._serializeLeaf(data, depth)
+                if isinstance(leaf, _PendingLeaf):
+                    self._fragments.append(leaf)
+                    if self._fragmentsSize >= self.flushSize:
+                        self._flush()
+                elif isinstance(leaf, str) and (self._strings is not None):
+                    self._emit(encode_basestring_ascii(self._strings[leaf]))
+                else:
+                    self._emit(_encoder.encode(leaf))
+            # The next item, closing the containers that have none left
+            while stack:
+                frame = stack[-1]
+                items, closing, depth, isDict, written = frame
+                item = next(items, _end)
+                if item is _end:
+                    self._emit(closing)
+                    stack.pop()
+                    continue
+                if written:
+                    self._emit(", ")
+                frame[4] = True
+                if isDict:
+                    k, data = item
+                    self._writeKey(k, depth)
+                else:
+                    data = item
+                break
+            else:
+                return
+
+    def _writeKey(self, k, depth: int):
+        if self.encryptDictNames:
+            k = self._serializeLeaf(k, depth)
+        elif self.tagged:
+            k = _escapeTagged(k)
+        if isinstance(k, _PendingLeaf):
+            self._fragments.append(k)
+        elif self._strings is not None:
+            self._emit(encode_basestring_ascii(self._strings[_jsonKey(k)]))
+        else:
+            self._emit(encode_basestring_ascii(_jsonKey(k)))
+        self._emit(": ")
@@ -0,0 +1,405 @@
+from qtpy.QtCore import QObject, QDate, QModelIndex, Qt
+from qtpy.QtGui import QKeySequence
+from qtpy.QtWidgets import (
+    QTableWidgetItem,
+    QAbstractSpinBox,
+    QKeySequenceEdit,
+    QAbstractSlider,
+    QTableWidget,
+    QTableView,
+    QTextBrowser,
+    QProgressBar,
+    QMainWindow,
+    QListWidget,
+    QLCDNumber,
+    QComboBox,
+    QDateEdit,
+    QLineEdit,
+    QWidget,
+    QDialog,
+)
+from operator import methodcaller
+from typing import Callable
+
+
+def _toDate(value: str) -> QDate:
+    return QDate.fromString(value, "yyyy-MM-dd")
+
+
+if hasattr(QDate, "toPyDate"):
+
+    def _fromDate(date: QDate) -> str:
+        return str(date.toPyDate())
+
+else:
+
+    def _fromDate(date: QDate) -> str:
+        return date.toString("yyyy-MM-dd")
+
+
+_bools = {"True": True, "False": False}
+
+
+def _toBool(value) -> bool:
+    return _bools.get(value, value) if isinstance(value, str) else value
+
+
+def _replaceItems(widget, value):
+    widget.clear()
+    widget.addItems(value)
+
+
+def _setTableWidgetData(widget, value):
+    widget.setRowCount(len(value))
+    for row, rowData in enumerate(value):
+        for column, text in enumerate(rowData):
+            item = QTableWidgetItem(text)
+            widget.setItem(row, column, item)
+
+
+def _setTableModelData(widget: QTableView, value: dict):
+    model = widget.model()
+    if model is None:
+        return
+    rowCount = value["rowCount"]
+    columns = value["columns"]
+    if isinstance(widget, QTableWidget):
+        widget.clearContents()
+        widget.setRowCount(rowCount)
+        widget.setColumnCount(len(columns))
+    else:
+        # Resized to the saved grid like setRowCount/setColumnCount do
+        if model.rowCount() < rowCount:
+            model.insertRows(model.rowCount(), rowCount - model.rowCount())
+        elif model.rowCount() > rowCount:
+            model.removeRows(rowCount, model.rowCount() - rowCount)
+        if model.columnCount() < len(columns):
+            model.insertColumns(model.columnCount(), len(columns) - model.columnCount())
+        elif model.columnCount() > len(columns):
+            model.removeColumns(len(columns), model.columnCount() - len(columns))
+    if not (rowCount and columns):
+        return
+    sortingEnabled = widget.isSortingEnabled()
+    updatesEnabled = widget.updatesEnabled()
+    widget.setSortingEnabled(False)
+    widget.setUpdatesEnabled(False)
+    signalsBlocked = model.blockSignals(True)
+    try:
+        index = model.index
+        setData = model.setData
+        editRole = Qt.EditRole
+        for column, columnData in enumerate(columns):
+            for row, cellData in enumerate(columnData):
+                if cellData is not None:
+                    setData(index(row, column), cellData, editRole)
+    finally:
+        model.blockSignals(signalsBlocked)
+        widget.setUpdatesEnabled(updatesEnabled)
+    # The view missed every dataChanged while the model signals were blocked
+    model.dataChanged.emit(
+        index(0, 0), index(model.rowCount() - 1, model.columnCount() - 1)
+    )
+    widget.setSortingEnabled(sortingEnabled)
+
+
+restorers: dict[str, Callable[[QObject, object], None]] = {
+    "setText": lambda widget, value: widget.setText(value),
+    "setDisabled": lambda widget, value: widget.setDisabled(_toBool(value)),
+    "setPlaceholderText": lambda widget, value: widget.setPlaceholderText(value),
+    "setMaxLength": lambda widget, value: widget.setMaxLength(int(value)),
+    "setCurrentIndex": lambda widget, value: widget.setCurrentIndex(value),
+    "addItems": _replaceItems,
+    "setChecked": lambda widget, value: widget.setChecked(_toBool(value)),
+    "setValue": lambda widget, value: widget.setValue(value),
+    "setMinimum": lambda widget, value: widget.setMinimum(value),
+    "setMaximum": lambda widget, value: widget.setMaximum(value),
+    "setSingleStep": lambda widget, value: widget.setSingleStep(value),
+    "setDate": lambda widget, value: widget.setDate(_toDate(value)),
+    "setDigitCount": lambda widget, value: widget.setDigitCount(value),
+    "display": lambda widget, value: widget.display(value),
+    "setMinimumDate": lambda widget, value: widget.setMinimumDate(_toDate(value)),
+    "setMaximumDate": lambda widget, value: widget.setMaximumDate(_toDate(value)),
+    "setSelectedDate": lambda widget, value: widget.setSelectedDate(_toDate(value)),
+    "setPlainText": lambda widget, value: widget.setPlainText(value),
+    "setHtml": lambda widget, value: widget.setHtml(value),
+    "setKeySequence": lambda widget, value: widget.setKeySequence(
+        QKeySequence.fromString(value)
+    ),
+    "setTableWidgetData": _setTableWidgetData,
+    "setTableModelData": _setTableModelData,
+    "setListWidgetData": _replaceItems,
+    "setGeometry": lambda widget, value: widget.setGeometry(*value),
+}
+
+
+changeSignals = (
+    "textChanged",
+    "valueChanged",
+    "toggled",
+    "currentIndexChanged",
+    "dateChanged",
+    "dateTimeChanged",
+    "timeChanged",
+    "selectionChanged",
+    "keySequenceChanged",
+    "itemChanged",
+)
+modelChangeSignals = (
+    "dataChanged",
+    "rowsInserted",
+    "rowsRemoved",
+    "columnsInserted",
+    "columnsRemoved",
+    "modelReset",
+)
+
+
+def modelOf(widget: QObject) -> QObject | None:
+    """Returns the model of an item view or combo box, None for other widgets"""
+    model = widget.model() if callable(getattr(widget, "model", None)) else None
+    return model if isinstance(model, QObject) else None
+
+
+def connectModelSignals(model: QObject, callback: Callable[[], None]):
+    """Connects `callback` to every signal in `modelChangeSignals`, E.g. of a model set after `connectChangeSignals`"""
+    notify = lambda *args: callback()
+    for signalName in modelChangeSignals:
+        getattr(model, signalName).connect(notify)
+
+
+def connectChangeSignals(widget: QObject, callback: Callable[[], None]) -> QObject | None:
+    """
+    Connects `callback` to every signal in `changeSignals` the widget has, and to
+    the `modelChangeSignals` of its model for item views and combo boxes.
+    Args:
+        widget (QObject): Widget to watch
+        callback (Callable[[], None]): Called without arguments whenever the widget's saved state may have changed
+    Returns:
+        QObject | None: The model that was connected, `setModel` replaces it without a signal
+    """
+    notify = lambda *args: callback()
+    for signalName in changeSignals:
+        signal = getattr(widget, signalName, None)
+        if signal is not None and hasattr(signal, "connect"):
+            signal.connect(notify)
+    model = modelOf(widget)
+    if model is not None:
+        connectModelSignals(model, callback)
+    return model
+
+
+def indexWidgets(root: QObject) -> dict[str, QObject]:
+    """
+    Maps every objectName under `root` to its widget with a single walk of the tree,
+    when names repeat the name keeps the widget `root.findChild(QObject, name)` returns.
+    Args:
+        root (QObject): Widget whose children are indexed
+    Returns:
+        dict[str, QObject]: objectName -> widget
+    """
+    index = {}
+    parents = [root]
+    while parents:
+        # Like findChild, the direct children of a widget come before their own children
+        # and the subtree of each child before the next child
+        children = parents.pop().children()
+        for child in children:
+            index.setdefault(child.objectName(), child)
+        parents.extend(reversed(children))
+    return index
+
+
+def _getClassRestorers(widgetClass: type) -> dict[str, Callable[[QObject, object], None]]:
+    """Setters registered for `widgetClass` or a base class, the nearest class in the MRO wins"""
+    classRestorers = _restorerCache.get(widgetClass)
+    if classRestorers is None:
+        classRestorers = {}
+        for baseClass in reversed(widgetClass.__mro__):
+            classRestorers.update(_customRestorers.get(baseClass, {}))
+        _restorerCache[widgetClass] = classRestorers
+    return classRestorers
+
+
+def restoreWidget(widget: QObject, serializedData: dict):
+    """
+    Applies a widget's saved properties through the setters registered for its class and
+    the `restorers` table, unknown keys are ignored.
+    Args:
+        widget (QObject): Widget to restore
+        serializedData (dict): Saved property setter names and values
+    """
+    classRestorers = _getClassRestorers(type(widget))
+    for key, value in serializedData.items():
+        restorer = classRestorers.get(key) or restorers.get(key)
+        if restorer is not None:
+            restorer(widget, value)
+
+
+Extractor = tuple[tuple[str, Callable[[QObject], object]], ...]
+_extractorCache: dict[type, Extractor] = {}
+_customExtractors: list[tuple[type, str, Callable[[QObject], object] | None]] = []
+# Setters of `registerExtractor` by the class they were registered for
+_customRestorers: dict[type, dict[str, Callable[[QObject, object], None]]] = {}
+_restorerCache: dict[type, dict[str, Callable[[QObject, object], None]]] = {}
+
+
+def _getComboBoxItems(widget: QComboBox) -> list[str]:
+    return [widget.itemText(i) for i in range(widget.count())]
+
+
+def _getTableModelData(widget: QTableView) -> dict:
+    """Reads the table column by column, empty cells are saved as None"""
+    if isinstance(widget, QTableWidget):
+        # Reading the items directly skips building a QModelIndex per cell
+        item = widget.item
+        rows = range(widget.rowCount())
+        columns = []
+        for column in range(widget.columnCount()):
+            columnData = []
+            for row in rows:
+                cell = item(row, column)
+                columnData.append(None if cell is None else cell.text())
+            columns.append(columnData)
+        return {"rowCount": len(rows), "columns": columns}
+    model = widget.model()
+    if model is None:
+        return {"rowCount": 0, "columns": []}
+    rowCount = model.rowCount()
+    index = model.index
+    data = model.data
+    displayRole = Qt.DisplayRole
+    rows = range(rowCount)
+    return {
+        "rowCount": rowCount,
+        "columns": [
+            [data(index(row, column), displayRole) for row in rows]
+            for column in range(model.columnCount())
+        ],
+    }
+
+
+def _getListWidgetData(widget: QListWidget) -> list[str]:
+    return [widget.item(index).text() for index in range(widget.count())]
+
+
+def _getGeometry(widget: QWidget) -> tuple[int, int, int, int]:
+    geo = widget.geometry()
+    return (geo.x(), geo.y(), geo.width(), geo.height())
+
+
+def _buildExtractor(widget: QObject) -> Extractor:
+    getters = {}
+    if hasattr(widget, "setMinimumDate"):
+        getters["setMinimumDate"] = lambda widget: _fromDate(widget.minimumDate())
+    if hasattr(widget, "isChecked"):
+        getters["setChecked"] = methodcaller("isChecked")
+    if hasattr(widget, "setMaximumDate"):
+        getters["setMaximumDate"] = lambda widget: _fromDate(widget.maximumDate())
+    if hasattr(widget, "setSelectedDate"):
+        getters["setSelectedDate"] = lambda widget: _fromDate(widget.selectedDate())
+    if hasattr(widget, "text"):
+        getters["setText"] = methodcaller("text")
+    if hasattr(widget, "toPlainText"):
+        getters["setPlainText"] = methodcaller("toPlainText")
+    if hasattr(widget, "placeholderText"):
+        getters["setPlaceholderText"] = methodcaller("placeholderText")
+    if hasattr(widget, "value"):
+        getters["setValue"] = methodcaller("value")
+    if hasattr(widget, "minimum"):
+        getters["setMinimum"] = methodcaller("minimum")
+    if hasattr(widget, "maximum"):
+        getters["setMaximum"] = methodcaller("maximum")
+    if isinstance(widget, QComboBox):
+        getters["addItems"] = _getComboBoxItems
+    if hasattr(widget, "currentIndex"):
+        if not isinstance(widget.currentIndex(), QModelIndex):
+            getters["setCurrentIndex"] = methodcaller("currentIndex")
+    if isinstance(widget, QWidget):
+        getters["setDisabled"] = lambda widget: not widget.isEnabled()
+    if isinstance(widget, QAbstractSlider):
+        getters["setSingleStep"] = methodcaller("singleStep")
+    if isinstance(widget, QLineEdit):
+        getters["setMaxLength"] = methodcaller("maxLength")
+    if isinstance(widget, QLCDNumber):
+        getters["setDigitCount"] = methodcaller("digitCount")
+        getters["display"] = methodcaller("value")
+        getters.pop("setValue", None)
+    if isinstance(widget, (QAbstractSpinBox, QProgressBar)):
+        getters.pop("setText", None)
+    if isinstance(widget, QDateEdit):
+        getters["setDate"] = lambda widget: _fromDate(widget.date())
+    if isinstance(widget, QTextBrowser):
+        getters["setHtml"] = methodcaller("toHtml")
+    if isinstance(widget, QKeySequenceEdit):
+        getters["setKeySequence"] = lambda widget: widget.keySequence().toString()
+    if isinstance(widget, QTableView):
+        getters["setTableModelData"] = _getTableModelData
+    if isinstance(widget, QListWidget):
+        getters["setListWidgetData"] = _getListWidgetData
+    if isinstance(widget, (QMainWindow, QDialog)):
+        getters["setGeometry"] = _getGeometry
+    for widgetClass, key, getter in _customExtractors:
+        if isinstance(widget, widgetClass):
+            if getter is None:
+                getters.pop(key, None)
+            else:
+                getters[key] = getter
+    return tuple(getters.items())
+
+
+def getExtractor(widget: QObject) -> Extractor:
+    """
+    Returns the (key, getter) pairs saved for the widget's class, they are worked out
+    on the first widget of each class and cached by type.
+    Args:
+        widget (QObject): Widget to be serialized
+    Returns:
+        Extractor: Property setter names and the getters reading them
+    """
+    widgetClass = type(widget)
+    extractor = _extractorCache.get(widgetClass)
+    if extractor is None:
+        extractor = _extractorCache[widgetClass] = _buildExtractor(widget)
+    return extractor
+
+
+def extractWidget(widget: QObject) -> dict:
+    """
+    Reads the widget's savable properties into a setter name -> value dict.
+    Args:
+        widget (QObject): Widget to be serialized
+    Returns:
+        dict: Property setter names and values
+    """
+    return {key: getter(widget) for key, getter in getExtractor(widget)}
+
+
+def registerExtractor(
+    widgetClass: type,
+    key: str,
+    getter: Callable[[QObject], object] | None,
+    setter: Callable[[QObject, object], None] = None,
+):
+    """
+    Adds a property to be saved for `widgetClass` and its subclasses.
+    Args:
+        widgetClass (type): Widget class the property belongs to
+        key (str): Name the property is saved under, built-in names can be overridden
+        getter (Callable[[QObject], object] | None): Reads the value from a widget, None stops `key` from being saved for `widgetClass`
+        setter (Callable[[QObject, object], None], optional): Applies a saved value on load to widgets of `widgetClass` and its subclasses, other widgets keep the setter they had. Defaults to None (keeps the current setter of `key`).
+
+    Example Usage:
+        ```py
+        registerExtractor(
+            ColorPicker,
+            "setColor",
+            lambda widget: widget.color().name(),
+            lambda widget, value: widget.setColor(QColor(value)),
+        )
+        ```
+    """
+    _customExtractors.append((widgetClass, key, getter))
+    if setter is not None:
+        _customRestorers.setdefault(widgetClass, {})[key] = setter
+        _restorerCache.clear()
+    _extractorCache.clear()
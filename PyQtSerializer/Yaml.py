@@ -0,0 +1,104 @@
+from base64 import encodebytes
+import yaml
+
+# libyaml parses and emits in C, the pure Python classes are used when PyYAML was built without it
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper, CDumper as _FullDumper
+
+    LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper, Dumper as _FullDumper
+
+    LIBYAML = False
+
+TUPLE_TAG = "tag:yaml.org,2002:python/tuple"
+FROZENSET_TAG = "tag:yaml.org,2002:python/frozenset"
+BYTEARRAY_TAG = "tag:yaml.org,2002:python/bytearray"
+COMPLEX_TAG = "tag:yaml.org,2002:python/complex"
+
+
+class YamlDumper(_SafeDumper):
+    """
+    Safe dumper with the Python types serialized data holds besides the YAML ones, tuples and
+    complex numbers keep the tags `yaml.dump` gives them so older files load the same.
+    Sets are the standard `!!set` and bytes `!!binary` of the safe dumper.
+    """
+
+
+class YamlLoader(_SafeLoader):
+    """Safe loader of the tags `YamlDumper` writes"""
+
+
+def _representTuple(dumper: YamlDumper, data: tuple):
+    return dumper.represent_sequence(TUPLE_TAG, data)
+
+
+def _representFrozenset(dumper: YamlDumper, data: frozenset):
+    return dumper.represent_mapping(FROZENSET_TAG, dict.fromkeys(data))
+
+
+def _representBytearray(dumper: YamlDumper, data: bytearray):
+    return dumper.represent_scalar(BYTEARRAY_TAG, encodebytes(data).decode("ascii"), style="|")
+
+
+def _representComplex(dumper: YamlDumper, data: complex):
+    if data.imag == 0.0:
+        text = repr(data.real)
+    elif data.real == 0.0:
+        text = f"{data.imag!r}j"
+    elif data.imag > 0:
+        text = f"{data.real!r}+{data.imag!r}j"
+    else:
+        text = f"{data.real!r}{data.imag!r}j"
+    return dumper.represent_scalar(COMPLEX_TAG, text)
+
+
+YamlDumper.add_representer(tuple, _representTuple)
+YamlDumper.add_representer(set, YamlDumper.represent_set)
+YamlDumper.add_representer(frozenset, _representFrozenset)
+YamlDumper.add_representer(bytearray, _representBytearray)
+YamlDumper.add_representer(complex, _representComplex)
+
+YamlLoader.add_constructor(TUPLE_TAG, lambda loader, node: tuple(loader.construct_sequence(node)))
+YamlLoader.add_constructor(
+    FROZENSET_TAG, lambda loader, node: frozenset(loader.construct_mapping(node))
+)
+YamlLoader.add_constructor(
+    BYTEARRAY_TAG, lambda loader, node: bytearray(loader.construct_yaml_binary(node))
+)
+YamlLoader.add_constructor(COMPLEX_TAG, lambda loader, node: complex(loader.construct_scalar(node)))
+
+
+def dumpYaml(data: object, stream=None, **kwargs):
+    """
+    `yaml.dump` of `data` with `YamlDumper`, keys keep their order. Data of other types (E.g. raw
+    objects given to an unserialized `Serializer`) is dumped with the full dumper like before.
+    Args:
+        data (object): Data to dump
+        stream (optional): Text file to write to, the YAML text is returned without it
+        **kwargs: Other `yaml.dump` arguments (E.g. `explicit_start`)
+    """
+    # Dumped to a string first so a failed attempt leaves nothing in `stream`
+    try:
+        text = yaml.dump(data, Dumper=YamlDumper, sort_keys=False, **kwargs)
+    except yaml.representer.RepresenterError:
+        text = yaml.dump(data, Dumper=_FullDumper, sort_keys=False, **kwargs)
+    if stream is None:
+        return text
+    stream.write(text)
+
+
+def loadYaml(text: str | bytes) -> object:
+    """Loads one document with `YamlLoader`, tags outside of it fall back to `yaml.full_load`"""
+    try:
+        return yaml.load(text, Loader=YamlLoader)
+    except yaml.constructor.ConstructorError:
+        return yaml.full_load(text)
+
+
+def loadYamlAll(text: str | bytes) -> list:
+    """`loadYaml` of every document in `text`"""
+    try:
+        return list(yaml.load_all(text, Loader=YamlLoader))
+    except yaml.constructor.ConstructorError:
+        return list(yaml.full_load_all(text))
@@ -1,12 +1,18 @@
 try:
-    from utils import Encrypt,Decrypt,generateEncryptionKey
-    from Serialize import serialize,deserialize
+    from utils import Encrypt,Decrypt,generateEncryptionKey,IntegrityError
+    from Serialize import serialize,deserialize,materialize,parseLiteral
     from PyQtSerializer import PyQtSerializer
     from Serializer import Serializer
+    from Widgets import registerExtractor
+    from Stats import Stats
+    from Atomic import syncFiles
 except:
-    from PyQtSerializer.utils import Encrypt, Decrypt, generateEncryptionKey
-    from PyQtSerializer.Serialize import serialize, deserialize
+    from PyQtSerializer.utils import Encrypt, Decrypt, generateEncryptionKey, IntegrityError
+    from PyQtSerializer.Serialize import serialize, deserialize, materialize, parseLiteral
     from PyQtSerializer.PyQtSerializer import PyQtSerializer
     from PyQtSerializer.Serializer import Serializer
+    from PyQtSerializer.Widgets import registerExtractor
+    from PyQtSerializer.Stats import Stats
+    from PyQtSerializer.Atomic import syncFiles
 __author__ = "Ahmed Essam (https://github.com/Were-Logan-0110)"
 __version__ = "0.01"
@@ -1,10 +1,26 @@
 try:
-    from Crypto.Cipher import Blowfish
+    from Crypto.Cipher import Blowfish, AES, ChaCha20_Poly1305
+    from Crypto.Protocol.KDF import HKDF
+    from Crypto.Hash import SHA256
     from Crypto import Random
 except:
-    from Cryptodome.Cipher import Blowfish
+    from Cryptodome.Cipher import Blowfish, AES, ChaCha20_Poly1305
+    from Cryptodome.Protocol.KDF import HKDF
+    from Cryptodome.Hash import SHA256
     from Cryptodome import Random
 import base64
+import re
+from binascii import a2b_base64, b2a_base64
+from functools import lru_cache
+
+BLOWFISH = "BLOWFISH"
+AES_GCM = "AES-GCM"
+CHACHA20_POLY1305 = "CHACHA20-POLY1305"
+# Text ciphertext of an authenticated cipher is CIPHER_PREFIX + its id + base64(nonce + ciphertext + tag),
+# Blowfish ciphertext is plain base64 so values written before ciphers were selectable read the same
+CIPHER_PREFIX = "$"
+
+
 def generateEncryptionKey() -> bytes:
     return Random.new().read(16)
 
@@ -13,18 +29,315 @@ class Bytes16(bytes):
     0
 
 
-def Encrypt(data: str, key: Bytes16 = None) -> tuple[str, bytes]:
+class IntegrityError(ValueError):
+    """Raised when authenticated ciphertext was modified or is decrypted with another key"""
+
+
+class Cipher:
+    """
+    Encrypts values with one key. `encrypt`/`decrypt` work on raw bytes and `encryptText`/`decryptText`
+    on the text stored in serialized data, use `getCipher` to get one.
+    """
+
+    name = ""
+    id = 0
+    prefix = ""
+    # Nonce and tag of a whole document, see `newStream`
+    nonceSize = 0
+    tagSize = 0
+
+    def __init__(self, key: Bytes16) -> None:
+        self.key = key
+
+    def encrypt(self, data: bytes) -> bytes:
+        raise NotImplementedError
+
+    def decrypt(self, data: bytes) -> bytes:
+        raise NotImplementedError
+
+    def encryptText(self, data: bytes) -> str:
+        return self.prefix + b2a_base64(self.encrypt(data), newline=False).decode("utf-8")
+
+    def decryptText(self, text: str) -> bytes:
+        return self.decrypt(a2b_base64(text[len(self.prefix) :]))
+
+    def encryptBatch(self, datas: list[bytes]) -> list[str]:
+        return [self.encryptText(data) for data in datas]
+
+    def encryptedSize(self, size: int) -> int:
+        """Size of the raw ciphertext of `size` bytes"""
+        raise NotImplementedError
+
+    def encryptMany(self, datas: list) -> list:
+        """Raw ciphertext of every value like `encrypt`, with as few cipher calls as the cipher allows"""
+        return [self.encrypt(data) for data in datas]
+
+    def decryptMany(self, datas: list) -> list:
+        """Every value of raw ciphertext decrypted like `decrypt`, in as few calls as the cipher allows"""
+        return [self.decrypt(data) for data in datas]
+
+    def newStream(self, nonce: bytes):
+        """Returns a cipher object that encrypts or decrypts one document in as many calls as needed"""
+        raise NotImplementedError
+
+
+def _padding(size: int) -> bytes:
+    # Like `Encrypt` always did, a block aligned value gets a whole block of padding
+    blockSize = Blowfish.block_size
+    return (blockSize - size % blockSize) * b"\0"
+
+
+class BlowfishCipher(Cipher):
+    """
+    Blowfish in ECB mode with null padding, the same value always gives the same ciphertext
+    and text values lose trailing null characters. Every value is padded with 1 to 8 null bytes,
+    so the size of raw values has to be known to read them back.
+    """
+
+    name = BLOWFISH
+    # Documents are encrypted in CTR mode with a key derived from their random nonce and a
+    # 64 bit counter, so the keystream of the key itself is never reused across documents
+    nonceSize = 16
+
+    def __init__(self, key: Bytes16) -> None:
+        super().__init__(key)
+        self.cipher = Blowfish.new(key, Blowfish.MODE_ECB)
+
+    def encrypt(self, data: bytes) -> bytes:
+        return self.cipher.encrypt(bytes(data) + _padding(len(data)))
+
+    def decrypt(self, data: bytes) -> bytearray:
+        decryptedData = bytearray(len(data))
+        self.cipher.decrypt(data, output=decryptedData)
+        return decryptedData
+
+    def encryptedSize(self, size: int) -> int:
+        blockSize = Blowfish.block_size
+        return size + blockSize - size % blockSize
+
+    def encryptMany(self, datas: list) -> list:
+        # Padded values are block aligned so they are encrypted back to back in one call
+        if not datas:
+            return []
+        paddedData = bytearray()
+        for data in datas:
+            paddedData += data
+            paddedData += _padding(len(data))
+        return self._split(
+            self.cipher.encrypt(paddedData), [self.encryptedSize(len(data)) for data in datas]
+        )
+
+    def decryptMany(self, datas: list) -> list:
+        if not datas:
+            return []
+        joinedData = b"".join(datas)
+        decryptedData = bytearray(len(joinedData))
+        self.cipher.decrypt(joinedData, output=decryptedData)
+        return self._split(decryptedData, [len(data) for data in datas])
+
+    def _split(self, data, sizes: list[int]) -> list:
+        data = memoryview(data)
+        values = []
+        start = 0
+        for size in sizes:
+            values.append(data[start : start + size])
+            start += size
+        return values
+
+    def decryptText(self, text: str) -> bytes:
+        return self.cipher.decrypt(base64.b64decode(text)).rstrip(b"\0")
+
+    def newStream(self, nonce: bytes):
+        documentKey = HKDF(
+            self.key, 16, nonce, SHA256, context=b"PyQtSerializer " + self.name.encode()
+        )
+        return Blowfish.new(documentKey, Blowfish.MODE_CTR, nonce=b"")
+
+    def encryptBatch(self, datas: list[bytes]) -> list[str]:
+        # ECB encrypts each block independently so the values are encrypted with a single call
+        return [
+            b2a_base64(encryptedData, newline=False).decode("utf-8")
+            for encryptedData in self.encryptMany(datas)
+        ]
+
+
+class _AeadCipher(Cipher):
+    """Authenticated cipher, every value gets a random nonce and a tag checked when it is decrypted"""
+
+    nonceSize = 12
+    tagSize = 16
+
+    def _new(self, nonce: bytes):
+        raise NotImplementedError
+
+    def newStream(self, nonce: bytes):
+        return self._new(nonce)
+
+    def encryptedSize(self, size: int) -> int:
+        return self.nonceSize + size + self.tagSize
+
+    def encrypt(self, data: bytes) -> bytes:
+        nonce = Random.get_random_bytes(self.nonceSize)
+        encryptedData, tag = self._new(nonce).encrypt_and_digest(data)
+        return nonce + encryptedData + tag
+
+    def decrypt(self, data: bytes) -> bytes:
+        if len(data) < self.nonceSize + self.tagSize:
+            raise IntegrityError(f"Truncated {self.name} Ciphertext")
+        data = memoryview(data)
+        try:
+            return self._new(bytes(data[: self.nonceSize])).decrypt_and_verify(
+                data[self.nonceSize : -self.tagSize], data[-self.tagSize :]
+            )
+        except ValueError as e:
+            raise IntegrityError(
+                f"{self.name} Ciphertext Was Modified Or Encrypted With Another Key"
+            ) from e
+
+
+class AesGcmCipher(_AeadCipher):
+    """AES in GCM mode, uses AES-128/192/256 for 16/24/32 byte keys"""
+
+    name = AES_GCM
+    id = 1
+    prefix = CIPHER_PREFIX + "1"
+
+    def _new(self, nonce: bytes):
+        return AES.new(self.key, AES.MODE_GCM, nonce=nonce)
+
+
+class ChaCha20Poly1305Cipher(_AeadCipher):
+    """ChaCha20-Poly1305, keys that are not 32 bytes are stretched to 32 bytes with HKDF-SHA256"""
+
+    name = CHACHA20_POLY1305
+    id = 2
+    prefix = CIPHER_PREFIX + "2"
+
+    def __init__(self, key: Bytes16) -> None:
+        super().__init__(
+            key
+            if len(key) == 32
+            else HKDF(key, 32, b"", SHA256, context=b"PyQtSerializer " + self.name.encode())
+        )
+
+    def _new(self, nonce: bytes):
+        return ChaCha20_Poly1305.new(key=self.key, nonce=nonce)
+
+
+ciphers = {
+    cipher.name: cipher for cipher in (BlowfishCipher, AesGcmCipher, ChaCha20Poly1305Cipher)
+}
+_cipherIds = {cipher.id: cipher.name for cipher in ciphers.values()}
+_cipherPrefixes = {cipher.prefix: cipher.name for cipher in ciphers.values() if cipher.prefix}
+
+
+@lru_cache(maxsize=32)
+def _getCipher(name: str, key: bytes) -> Cipher:
+    return ciphers[name](key)
+
+
+def getCipher(name: str, key: Bytes16) -> Cipher:
+    """
+    Returns the cipher called `name` for `key`, ciphers are cached so their key setup is done once per key.
+    Args:
+        name (str): One of `ciphers`, "BLOWFISH", "AES-GCM" or "CHACHA20-POLY1305"
+        key (Bytes16): Encryption key
+    Returns:
+        Cipher: The cipher
+    """
+    if name not in ciphers:
+        raise ValueError(f"Unknown Cipher <{name}>, Expected One Of {list(ciphers)}")
+    return _getCipher(name, bytes(key))
+
+
+def cipherById(cipherId: int) -> str:
+    """Returns the name of the cipher with the id stored in binary headers"""
+    if cipherId not in _cipherIds:
+        raise ValueError(f"Unknown Cipher Id <{cipherId}>")
+    return _cipherIds[cipherId]
+
+
+def cipherOf(encryptedData: str) -> str:
+    """Returns the name of the cipher that encrypted a text value"""
+    if encryptedData[:1] == CIPHER_PREFIX:
+        return _cipherPrefixes.get(encryptedData[:2], BLOWFISH)
+    return BLOWFISH
+
+
+# Standard base64 with its padding, what `encryptText` writes after the prefix
+_base64Text = re.compile(r"(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?")
+
+
+def isCipherText(text: str) -> bool:
+    """
+    Whether a text value is well-formed ciphertext of an authenticated cipher: its prefix, then
+    strict base64 of at least a nonce and a tag. Plain text that starts with `CIPHER_PREFIX`
+    (E.g. a bcrypt hash "$2b$12$...") is not, so it isn't mistaken for modified ciphertext.
+    """
+    if text.__class__ is not str:
+        return False
+    name = _cipherPrefixes.get(text[:2])
+    if name is None:
+        return False
+    body = text[2:]
+    cipher = ciphers[name]
+    return (len(body) * 3 // 4 - body.count("=", -2) >= cipher.nonceSize + cipher.tagSize) and (
+        _base64Text.fullmatch(body) is not None
+    )
+
+
+def Encrypt(data: str, key: Bytes16 = None, cipher: str = BLOWFISH) -> tuple[str, bytes]:
     if not key:
         key = generateEncryptionKey()
-    cipher = Blowfish.new(key, Blowfish.MODE_ECB)
-    blockSize = Blowfish.block_size
-    paddedData = data + (blockSize - len(data) % blockSize) * b"\0"
-    encryptedData = cipher.encrypt(paddedData)
-    return base64.b64encode(encryptedData).decode("utf-8"), key
+    return getCipher(cipher, key).encryptText(data), key
 
 
 def Decrypt(encryptedData: str, key: Bytes16) -> str:
-    encryptedData = base64.b64decode(encryptedData)
-    cipher = Blowfish.new(key, Blowfish.MODE_ECB)
-    decryptedData = cipher.decrypt(encryptedData).rstrip(b"\0").decode("utf-8")
-    return decryptedData
+    return getCipher(cipherOf(encryptedData), key).decryptText(encryptedData).decode("utf-8")
+
+
+def EncryptBuffer(data, key: Bytes16, cipher: str = BLOWFISH) -> str:
+    """
+    Encrypts raw bytes (any buffer) as one value. The Blowfish null padding can't be told apart
+    from the data so `DecryptBuffer` is given the size back.
+    Args:
+        data (bytes | memoryview): Bytes to encrypt
+        key (Bytes16): Encryption key
+        cipher (str, optional): Cipher name. Defaults to "BLOWFISH".
+    Returns:
+        str: Text ciphertext
+    """
+    cipher = getCipher(cipher, key)
+    return cipher.prefix + b2a_base64(cipher.encrypt(data), newline=False).decode("utf-8")
+
+
+def DecryptBuffer(encryptedData: str, key: Bytes16, size: int) -> memoryview:
+    """
+    Decrypts a value from `EncryptBuffer` into a new writable buffer.
+    Args:
+        encryptedData (str): Text ciphertext
+        key (Bytes16): Encryption key
+        size (int): Size of the encrypted bytes
+    Returns:
+        memoryview: The first `size` bytes of the decrypted buffer
+    """
+    cipher = getCipher(cipherOf(encryptedData), key)
+    decryptedData = cipher.decrypt(a2b_base64(encryptedData[len(cipher.prefix) :]))
+    if not isinstance(decryptedData, bytearray):
+        decryptedData = bytearray(decryptedData)
+    return memoryview(decryptedData)[:size]
+
+
+def EncryptBatch(datas: list[bytes], key: Bytes16, cipher: str = BLOWFISH) -> list[str]:
+    """
+    Encrypts many values with one cipher setup. Blowfish pads every value exactly like `Encrypt`
+    does and ECB encrypts each block independently, so they are encrypted with a single call and
+    the result is identical to `[Encrypt(d, key)[0] for d in datas]`.
+    Args:
+        datas (list[bytes]): Values to encrypt
+        key (Bytes16): Encryption key
+        cipher (str, optional): Cipher name. Defaults to "BLOWFISH".
+    Returns:
+        list[str]: Text ciphertext of every value, in order
+    """
+    return getCipher(cipher, key).encryptBatch(datas)
@@ -0,0 +1,64 @@
+"""
+Compares the ciphers of `serialize` on a large array (cost per byte) and on a settings
+tree of small values (cost per value).
+
+Usage:
+    python benchmarks/bench_ciphers.py [megabytes] [leaves] [repeat]
+"""
+import os
+import sys
+from array import array
+from timeit import repeat as timeRepeat
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQtSerializer import serialize, deserialize, generateEncryptionKey
+from PyQtSerializer.utils import ciphers
+
+
+def makeSettingsTree(leaves: int) -> dict:
+    groups = max(1, leaves // 100)
+    return {
+        f"group{group}": {
+            f"setting{index}": (f"value {index}" if index % 2 else index * 1.5)
+            for index in range(leaves // groups // 2)
+        }
+        for group in range(groups)
+    }
+
+
+def timeRoundTrip(data, key: bytes, cipher: str, repeat: int) -> tuple[float, float]:
+    serializedData = serialize(data, key=key, tagged=True, cipher=cipher)
+    serializeTime = min(
+        timeRepeat(
+            lambda: serialize(data, key=key, tagged=True, cipher=cipher),
+            number=1,
+            repeat=repeat,
+        )
+    )
+    deserializeTime = min(
+        timeRepeat(
+            lambda: deserialize(serializedData, decryptionKey=key, tagged=True),
+            number=1,
+            repeat=repeat,
+        )
+    )
+    return serializeTime, deserializeTime
+
+
+def main(megabytes: int = 64, leaves: int = 20000, repeat: int = 3):
+    key = generateEncryptionKey()
+    values = array("d", range(megabytes * (1 << 20) // 8))
+    tree = makeSettingsTree(leaves)
+    print(f"{'':>18}  {'array serialize':>16}  {'array deserialize':>17}  {'tree serialize':>14}  {'tree deserialize':>16}")
+    for cipher in ciphers:
+        arraySerialize, arrayDeserialize = timeRoundTrip(values, key, cipher, repeat)
+        treeSerialize, treeDeserialize = timeRoundTrip(tree, key, cipher, repeat)
+        print(
+            f"{cipher:>18}  {megabytes / arraySerialize:11.0f} MB/s  {megabytes / arrayDeserialize:12.0f} MB/s"
+            f"  {treeSerialize * 1000:11.2f} ms  {treeDeserialize * 1000:13.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
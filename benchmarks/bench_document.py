@@ -0,0 +1,76 @@
+"""
+Compares a fully encrypted tagged save (every value encrypted) against `encryptDocument=True`,
+which saves the values unencrypted and encrypts the whole file while it is written.
+
+Usage:
+    python benchmarks/bench_document.py [leaves] [repeat]
+"""
+import os
+import sys
+import tempfile
+from timeit import repeat as timeRepeat
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQtSerializer import Serializer, generateEncryptionKey
+
+
+def makeSettingsTree(leaves: int) -> dict:
+    groups = max(1, leaves // 100)
+    return {
+        f"group{group}": {
+            f"setting{index}": (f"value {index}" if index % 2 else index * 1.5)
+            for index in range(leaves // groups // 2)
+        }
+        for group in range(groups)
+    }
+
+
+def main(leaves: int = 100000, repeat: int = 3):
+    key = generateEncryptionKey()
+    data = makeSettingsTree(leaves)
+    directory = tempfile.mkdtemp()
+    print(f"{'':>16}  {'size':>10}  {'save':>10}  {'load':>10}")
+    for saveFormat in ("JSON", "YAML", "PICKLE", "BINARY"):
+        for encryptDocument in (False, True):
+            serializer = Serializer(
+                None,
+                saveFormat,
+                encryptCodeObjects=True,
+                encryptStdDataTypes=True,
+                encryptDictNames=True,
+                key=key,
+                tagged=True,
+                encryptDocument=encryptDocument,
+            )
+            filePath = os.path.join(directory, f"{saveFormat}{int(encryptDocument)}")
+            saveTime = min(
+                timeRepeat(
+                    lambda: serializer.StreamSerialize(data, filePath),
+                    number=1,
+                    repeat=repeat,
+                )
+            )
+            loadTime = min(
+                timeRepeat(
+                    lambda: serializer.Deserialize(
+                        filePath, deserializeData=True, isEncrypted=True
+                    ),
+                    number=1,
+                    repeat=repeat,
+                )
+            )
+            assert serializer.Deserialize(
+                filePath, deserializeData=True, isEncrypted=True
+            ) == data
+            name = f"{saveFormat} {'document' if encryptDocument else 'values'}"
+            print(
+                f"{name:>16}  {os.path.getsize(filePath) / 1024:7.0f} KB"
+                f"  {saveTime * 1000:7.0f} ms  {loadTime * 1000:7.0f} ms"
+            )
+            os.remove(filePath)
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,47 @@
+"""
+Compares the per-leaf encryption path of `serialize` against batched encryption.
+
+Usage:
+    python benchmarks/bench_encryption.py [leaves] [repeat]
+"""
+import os
+import sys
+from timeit import repeat as timeRepeat
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQtSerializer import serialize, generateEncryptionKey
+
+
+def makeSettingsTree(leaves: int) -> dict:
+    groups = max(1, leaves // 100)
+    return {
+        f"group{group}": {
+            f"setting{index}": (f"value {index}" if index % 2 else index * 1.5)
+            for index in range(leaves // groups // 2)
+        }
+        for group in range(groups)
+    }
+
+
+def main(leaves: int = 20000, repeat: int = 5):
+    key = generateEncryptionKey()
+    data = makeSettingsTree(leaves)
+    assert serialize(data, key=key, batchEncryption=False) == serialize(
+        data, key=key, batchEncryption=True
+    )
+    results = {}
+    for name, batchEncryption in (("perLeaf", False), ("batched", True)):
+        results[name] = min(
+            timeRepeat(
+                lambda: serialize(data, key=key, batchEncryption=batchEncryption),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        print(f"{name:>8}: {results[name] * 1000:9.2f} ms")
+    print(f" speedup: {results['perLeaf'] / results['batched']:9.2f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,62 @@
+"""
+Compares `eval` against `parseLiteral` on the values of a settings file and times
+`deserialize(parseDigits=True)` and the tagged format, which keeps the value types.
+
+Usage:
+    python benchmarks/bench_literals.py [values] [repeat]
+"""
+import os
+import sys
+from timeit import repeat as timeRepeat
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQtSerializer import serialize, deserialize, generateEncryptionKey, parseLiteral
+
+
+def makeSettingsValues(values: int) -> dict:
+    kinds = (
+        lambda index: index,
+        lambda index: index * 1.5,
+        lambda index: bool(index % 4),
+        lambda index: None,
+        lambda index: [index, f"item {index}", (index, -index)],
+    )
+    return {f"setting{index}": kinds[index % len(kinds)](index) for index in range(values)}
+
+
+def main(values: int = 100000, repeat: int = 5):
+    key = generateEncryptionKey()
+    data = makeSettingsValues(values)
+    texts = [repr(value) for value in data.values()]
+    assert [parseLiteral(text) for text in texts] == [eval(text) for text in texts]
+    results = {}
+    for name, parse in (("eval", eval), ("parseLiteral", parseLiteral)):
+        results[name] = min(
+            timeRepeat(
+                lambda: [parse(text) for text in texts], number=1, repeat=repeat
+            )
+        )
+        print(f"{name:>14}: {results[name] * 1000:9.2f} ms")
+    print(f"{'speedup':>14}: {results['eval'] / results['parseLiteral']:9.2f}x")
+
+    for tagged in (False, True):
+        serializedData = serialize(data, key=key, tagged=tagged)
+        elapsed = min(
+            timeRepeat(
+                lambda: deserialize(
+                    serializedData,
+                    decryptionKey=key,
+                    isEncrypted=True,
+                    parseDigits=True,
+                    tagged=tagged,
+                ),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        print(f"{'tagged' if tagged else 'parseDigits':>14}: {elapsed * 1000:9.2f} ms deserialize")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,90 @@
+"""
+Compares saving widget records like `PyQtSerializer.dump` writes them, with their property
+names encrypted, with and without the string table of `internStrings=True`.
+
+Usage:
+    python benchmarks/bench_strings.py [widgets] [repeat]
+"""
+import os
+import sys
+import tempfile
+from timeit import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQtSerializer import Serializer, generateEncryptionKey
+
+_widgetTypes = ("QLineEdit", "QCheckBox", "QSpinBox", "QComboBox", "QPushButton")
+
+
+def makeWidgetRecords(widgets: int) -> list:
+    return [
+        {
+            "objectName": f"widget{index}",
+            "serializedData": {
+                "setDisabled": False,
+                "setVisible": True,
+                "setToolTip": "",
+                "setText": f"text {index % 50}",
+                "setGeometry": [index % 800, index % 600, 120, 30],
+            },
+            "widgetType": _widgetTypes[index % len(_widgetTypes)],
+        }
+        for index in range(widgets)
+    ]
+
+
+def main(widgets: int = 20000, repeat: int = 3):
+    key = generateEncryptionKey()
+    data = makeWidgetRecords(widgets)
+    directory = tempfile.mkdtemp()
+    print(f"{'':>30}  {'size':>10}  {'dump':>10}  {'load':>10}")
+    for saveFormat in ("JSON", "YAML", "PICKLE", "BINARY"):
+        for cipher in ("BLOWFISH", "AES-GCM"):
+            serializers = {
+                internStrings: Serializer(
+                    None,
+                    saveFormat,
+                    encryptDictNames=True,
+                    encryptStrings=True,
+                    key=key,
+                    tagged=True,
+                    cipher=cipher,
+                    internStrings=internStrings,
+                )
+                for internStrings in (False, True)
+            }
+            filePaths = {
+                internStrings: os.path.join(directory, f"{saveFormat}{cipher}{int(internStrings)}")
+                for internStrings in serializers
+            }
+            dumpTimes = {internStrings: [] for internStrings in serializers}
+            loadTimes = {internStrings: [] for internStrings in serializers}
+            # Run in turns so the inline and table saves see the same load of the machine
+            for _ in range(repeat):
+                for internStrings, serializer in serializers.items():
+                    filePath = filePaths[internStrings]
+                    dumpTimes[internStrings].append(
+                        timeit(lambda: serializer.StreamSerialize(data, filePath), number=1)
+                    )
+                    loadTimes[internStrings].append(
+                        timeit(
+                            lambda: serializer.Deserialize(filePath, deserializeData=True),
+                            number=1,
+                        )
+                    )
+            for internStrings, serializer in serializers.items():
+                filePath = filePaths[internStrings]
+                assert serializer.Deserialize(filePath, deserializeData=True) == data
+                name = f"{saveFormat} {cipher} {'table' if internStrings else 'inline'}"
+                print(
+                    f"{name:>30}  {os.path.getsize(filePath) / 1024:7.0f} KB"
+                    f"  {min(dumpTimes[internStrings]) * 1000:7.0f} ms"
+                    f"  {min(loadTimes[internStrings]) * 1000:7.0f} ms"
+                )
+                os.remove(filePath)
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,379 @@
+"""
+Benchmark suite of `serialize`/`deserialize` with the encryption flag combinations, `Serializer`
+file round-trips in every save format and `PyQtSerializer.dump`/`load` of generated widget trees.
+Qt runs on the offscreen platform so the suite runs headless.
+
+The results are written as JSON (`--output`, stdout by default) with the best time of every case
+and the size of the files it saved. With `--baseline` the results are compared with a previous
+run and the suite exits with 1 when a case got slower or bigger than `--threshold` allows. Times
+of another Python, Qt or machine aren't comparable, the suite refuses such a baseline unless
+`--allowEnvironmentMismatch` is given, which only warns.
+
+Usage:
+    python benchmarks/bench_suite.py [--output results.json] [--baseline old.json]
+        [--threshold 0.2] [--repeat 5] [--leaves 5000] [--widgets 100,1000,10000]
+        [--formats JSON,YAML,PICKLE,BINARY] [--filter regex] [--allowEnvironmentMismatch]
+"""
+import os
+import re
+import sys
+import json
+import platform
+import tempfile
+import argparse
+from statistics import median
+from timeit import repeat as timeRepeat
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qtpy
+from qtpy.QtWidgets import (
+    QApplication,
+    QWidget,
+    QLineEdit,
+    QSpinBox,
+    QCheckBox,
+    QComboBox,
+    QSlider,
+)
+import PyQtSerializer as package
+from PyQtSerializer import PyQtSerializer, Serializer, serialize, deserialize
+
+# Bumped when the cases or the data they use change, results of another version are not compared
+SUITE_VERSION = 1
+# Key of every run so encrypted sizes and times are comparable
+KEY = bytes(range(16))
+# Cases faster than this (seconds) only count as slower when they are also this much slower
+_noiseFloor = 0.001
+# Environment entries that have to match the baseline for the times to be comparable
+_comparedEnvironment = ("python", "implementation", "system", "machine", "cpus", "qtApi", "qtVersion")
+
+flagCombinations = {
+    "plain": {},
+    "dictNames": {"encryptDictNames": True},
+    "strings": {"encryptStrings": True},
+    "numbers": {"encryptNumbers": True},
+    "all": {
+        "encryptCodeObjects": True,
+        "encryptStdDataTypes": True,
+        "encryptDictNames": True,
+        "encryptStrings": True,
+        "encryptNumbers": True,
+    },
+}
+_noFlags = dict.fromkeys(flagCombinations["all"], False)
+
+
+def makeSettingsTree(leaves: int) -> dict:
+    """Settings of every kind of value, the same for the same `leaves`"""
+    kinds = (
+        lambda index: f"value {index}",
+        lambda index: index,
+        lambda index: index * 1.5,
+        lambda index: bool(index % 3),
+        lambda index: None,
+        lambda index: [index, f"item {index}", [index * 0.5, -index]],
+    )
+    groups = max(1, leaves // 100)
+    return {
+        f"group{group}": {
+            f"setting{index}": kinds[index % len(kinds)](index)
+            for index in range(leaves // groups)
+        }
+        for group in range(groups)
+    }
+
+
+def makeWidgetTree(widgets: int) -> QWidget:
+    """Root widget with `widgets` input widgets in pages of 50, every one with a unique name and a set value"""
+    root = QWidget()
+    root.setObjectName("root")
+    page = None
+    for index in range(widgets):
+        if index % 50 == 0:
+            page = QWidget(root)
+            page.setObjectName(f"page{index // 50}")
+        kind = index % 5
+        if kind == 0:
+            widget = QLineEdit(page)
+            widget.setText(f"text {index}")
+        elif kind == 1:
+            widget = QSpinBox(page)
+            widget.setMaximum(widgets)
+            widget.setValue(index)
+        elif kind == 2:
+            widget = QCheckBox(page)
+            widget.setChecked(bool(index % 3))
+        elif kind == 3:
+            widget = QComboBox(page)
+            widget.addItems(["first", "second", "third"])
+            widget.setCurrentIndex(index % 3)
+        else:
+            widget = QSlider(page)
+            widget.setValue(index % 100)
+        widget.setObjectName(f"widget{index}")
+    return root
+
+
+class Suite:
+    def __init__(self, repeat: int, caseFilter: str = None) -> None:
+        self.repeat = repeat
+        self.caseFilter = re.compile(caseFilter) if caseFilter else None
+        self.cases = {}
+
+    def wants(self, name: str) -> bool:
+        return (self.caseFilter is None) or bool(self.caseFilter.search(name))
+
+    def time(self, name: str, function, repeat: int = None, filePath: str = None):
+        """Times `function` and records its best and median time, with the size of `filePath` after it ran"""
+        times = timeRepeat(function, number=1, repeat=repeat or self.repeat)
+        case = {"seconds": min(times), "median": median(times)}
+        if filePath is not None:
+            case["bytes"] = os.path.getsize(filePath)
+        self.cases[name] = case
+        print(
+            f"{name:>44}  {case['seconds'] * 1000:10.2f} ms"
+            + (f"  {case['bytes'] / 1024:9.0f} KB" if "bytes" in case else ""),
+            file=sys.stderr,
+        )
+
+
+def runSerialize(suite: Suite, leaves: int):
+    data = makeSettingsTree(leaves)
+    for tagged in (False, True):
+        for combination, flags in flagCombinations.items():
+            name = f"serialize/{'tagged' if tagged else 'legacy'}/{combination}"
+            if not (suite.wants(name) or suite.wants(name.replace("serialize", "deserialize", 1))):
+                continue
+            flags = {**_noFlags, **flags}
+            serializedData = serialize(data, key=KEY, tagged=tagged, **flags)
+            if suite.wants(name):
+                suite.time(name, lambda: serialize(data, key=KEY, tagged=tagged, **flags))
+            name = name.replace("serialize", "deserialize", 1)
+            if suite.wants(name):
+                suite.time(
+                    name,
+                    lambda: deserialize(
+                        serializedData,
+                        isEncrypted=True,
+                        decryptionKey=KEY,
+                        parseDigits=not tagged,
+                        tagged=tagged,
+                    ),
+                )
+
+
+def runSerializer(suite: Suite, leaves: int, formats: list[str], directory: str):
+    data = makeSettingsTree(leaves)
+    for saveFormat in formats:
+        # Only pickle is written differently as hex
+        for hex in (False, True) if saveFormat == "PICKLE" else (False,):
+            name = f"serializer/{saveFormat}{'/hex' if hex else ''}"
+            if not (suite.wants(f"{name}/save") or suite.wants(f"{name}/load")):
+                continue
+            serializer = Serializer(
+                None,
+                saveFormat,
+                encryptDictNames=True,
+                encryptStrings=True,
+                key=KEY,
+                tagged=True,
+            )
+            filePath = os.path.join(directory, f"serializer{saveFormat}{int(hex)}")
+            serializer.StreamSerialize(data, filePath, hex)
+            assert serializer.Deserialize(
+                filePath, hex, deserializeData=True, isEncrypted=True
+            ) == data, name
+            if suite.wants(f"{name}/save"):
+                suite.time(
+                    f"{name}/save",
+                    lambda: serializer.StreamSerialize(data, filePath, hex),
+                    filePath=filePath,
+                )
+            if suite.wants(f"{name}/load"):
+                suite.time(
+                    f"{name}/load",
+                    lambda: serializer.Deserialize(
+                        filePath, hex, deserializeData=True, isEncrypted=True
+                    ),
+                )
+            os.remove(filePath)
+
+
+def runWidgets(suite: Suite, widgetCounts: list[int], formats: list[str], directory: str):
+    app = QApplication.instance() or QApplication([])
+    for widgets in widgetCounts:
+        root = makeWidgetTree(widgets)
+        for saveFormat in formats:
+            name = f"widgets/{widgets}/{saveFormat}"
+            if not (suite.wants(f"{name}/dump") or suite.wants(f"{name}/load")):
+                continue
+            savePath = os.path.join(directory, f"widgets{widgets}.{saveFormat.lower()}")
+            serializer = PyQtSerializer(
+                KEY,
+                target=root,
+                savePath=savePath,
+                saveFormat=saveFormat,
+                encryptDictNames=True,
+                encryptStrings=True,
+                Hex=saveFormat == "PICKLE",
+                deserializeData=True,
+                isEncrypted=True,
+                tagged=True,
+            )
+            # The large trees are timed fewer times so a full run stays short
+            repeat = max(1, suite.repeat // max(1, widgets // 1000))
+            serializer.dump()
+            if suite.wants(f"{name}/dump"):
+                suite.time(f"{name}/dump", serializer.dump, repeat, savePath)
+            if suite.wants(f"{name}/load"):
+                suite.time(f"{name}/load", serializer.load, repeat)
+            os.remove(savePath)
+        root.deleteLater()
+        app.processEvents()
+
+
+def environmentMismatches(results: dict, baseline: dict) -> list[str]:
+    """Returns a line for every compared environment entry that differs from the baseline"""
+    environment, oldEnvironment = results["environment"], baseline.get("environment", {})
+    return [
+        f"{name}: {oldEnvironment.get(name)} -> {environment.get(name)}"
+        for name in _comparedEnvironment
+        if oldEnvironment.get(name) != environment.get(name)
+    ]
+
+
+def compare(
+    results: dict, baseline: dict, threshold: float, allowEnvironmentMismatch: bool = False
+) -> list[str]:
+    """
+    Returns a line for every case that got slower or bigger than `threshold` (E.g. 0.2 = 20%) allows.
+    Raises ValueError when the baseline ran in another environment unless `allowEnvironmentMismatch`
+    """
+    if baseline.get("suiteVersion") != results["suiteVersion"]:
+        raise ValueError(
+            f"Unsupported Baseline Suite Version <{baseline.get('suiteVersion')}>"
+        )
+    mismatches = environmentMismatches(results, baseline)
+    if mismatches and not allowEnvironmentMismatch:
+        raise ValueError(f"Baseline Environment Mismatch <{', '.join(mismatches)}>")
+    regressions = []
+    for name, case in results["cases"].items():
+        old = baseline["cases"].get(name)
+        if old is None:
+            continue
+        seconds, oldSeconds = case["seconds"], old["seconds"]
+        if (seconds > oldSeconds * (1 + threshold)) and (seconds - oldSeconds > _noiseFloor):
+            regressions.append(
+                f"{name}: {oldSeconds * 1000:.2f} ms -> {seconds * 1000:.2f} ms"
+                f" (+{(seconds / oldSeconds - 1) * 100:.0f}%)"
+            )
+        if ("bytes" in case) and ("bytes" in old) and (case["bytes"] > old["bytes"] * (1 + threshold)):
+            regressions.append(f"{name}: {old['bytes']} bytes -> {case['bytes']} bytes")
+    return regressions
+
+
+def main(
+    output: str = None,
+    baseline: str = None,
+    threshold: float = 0.2,
+    repeat: int = 5,
+    leaves: int = 5000,
+    widgets: list[int] = (100, 1000, 10000),
+    formats: list[str] = ("JSON", "YAML", "PICKLE", "BINARY"),
+    caseFilter: str = None,
+    allowEnvironmentMismatch: bool = False,
+) -> int:
+    suite = Suite(repeat, caseFilter)
+    directory = tempfile.mkdtemp()
+    try:
+        runSerialize(suite, leaves)
+        runSerializer(suite, leaves, formats, directory)
+        runWidgets(suite, widgets, formats, directory)
+    finally:
+        for fileName in os.listdir(directory):
+            os.remove(os.path.join(directory, fileName))
+        os.rmdir(directory)
+    results = {
+        "suiteVersion": SUITE_VERSION,
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "system": platform.system(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "qtApi": qtpy.API_NAME,
+            "qtVersion": qtpy.QT_VERSION,
+            "package": package.__version__,
+        },
+        "parameters": {
+            "repeat": repeat,
+            "leaves": leaves,
+            "widgets": list(widgets),
+            "formats": list(formats),
+        },
+        "cases": suite.cases,
+    }
+    text = json.dumps(results, indent=2)
+    if output:
+        with open(output, "w", encoding="utf-8") as outputFile:
+            outputFile.write(text + "\n")
+    else:
+        print(text)
+    if baseline:
+        with open(baseline, "r", encoding="utf-8") as baselineFile:
+            baselineResults = json.load(baselineFile)
+        mismatches = environmentMismatches(results, baselineResults)
+        for mismatch in mismatches:
+            print(f"ENVIRONMENT {mismatch}", file=sys.stderr)
+        if mismatches and not allowEnvironmentMismatch:
+            print(
+                "The baseline ran in another environment, its times aren't comparable."
+                " Pass --allowEnvironmentMismatch to compare anyway",
+                file=sys.stderr,
+            )
+            return 2
+        regressions = compare(results, baselineResults, threshold, allowEnvironmentMismatch)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No case regressed more than {threshold * 100:.0f}%", file=sys.stderr)
+    return 0
+
+
+def _parseArgs(args: list[str]) -> dict:
+    parser = argparse.ArgumentParser(description="PyQtSerializer benchmark suite")
+    parser.add_argument("--output", help="File to write the JSON results to, stdout by default")
+    parser.add_argument("--baseline", help="JSON results of a previous run to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown/growth against the baseline, 0.2 = 20%%",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--leaves", type=int, default=5000)
+    parser.add_argument(
+        "--widgets",
+        type=lambda text: [int(count) for count in text.split(",")],
+        default=[100, 1000, 10000],
+    )
+    parser.add_argument(
+        "--formats",
+        type=lambda text: text.upper().split(","),
+        default=["JSON", "YAML", "PICKLE", "BINARY"],
+    )
+    parser.add_argument("--filter", dest="caseFilter", help="Regex of the case names to run")
+    parser.add_argument(
+        "--allowEnvironmentMismatch",
+        action="store_true",
+        help="Compare with a baseline of another Python, Qt or machine, only warning about it",
+    )
+    return vars(parser.parse_args(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main(**_parseArgs(sys.argv[1:])))
@@ -0,0 +1,59 @@
+"""
+Compares the YAML backend (`PyQtSerializer.Yaml`, libyaml's safe loader/dumper when PyYAML has
+it) with the `yaml.dump`/`yaml.full_load` the YAML save format used before, on serialized data
+with encrypted names and strings like `Serializer` saves it.
+
+Usage:
+    python benchmarks/bench_yaml.py [leaves] [repeat]
+"""
+import os
+import sys
+from timeit import repeat as timeRepeat
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQtSerializer import serialize, generateEncryptionKey
+from PyQtSerializer.Yaml import dumpYaml, loadYaml, LIBYAML
+
+
+def makeSettingsTree(leaves: int) -> dict:
+    groups = max(1, leaves // 100)
+    return {
+        f"group{group}": {
+            f"setting{index}": (
+                f"value {index}",
+                index,
+                index * 1.5,
+                [index, (index, -index)],
+            )[index % 4]
+            for index in range(leaves // groups)
+        }
+        for group in range(groups)
+    }
+
+
+def main(leaves: int = 20000, repeat: int = 3):
+    data = serialize(
+        makeSettingsTree(leaves),
+        key=generateEncryptionKey(),
+        encryptDictNames=True,
+        encryptStrings=True,
+        tagged=True,
+    )
+    print(f"libyaml: {LIBYAML}")
+    print(f"{'':>10}  {'dump':>10}  {'load':>10}")
+    for name, dumpFunction, loadFunction in (
+        ("full", yaml.dump, yaml.full_load),
+        ("backend", dumpYaml, loadYaml),
+    ):
+        text = dumpFunction(data)
+        assert loadFunction(text) == data
+        dumpTime = min(timeRepeat(lambda: dumpFunction(data), number=1, repeat=repeat))
+        loadTime = min(timeRepeat(lambda: loadFunction(text), number=1, repeat=repeat))
+        print(f"{name:>10}  {dumpTime * 1000:7.0f} ms  {loadTime * 1000:7.0f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
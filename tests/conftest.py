@@ -0,0 +1,15 @@
+import os
+
+# The widget tests run headless
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+
+KEY = bytes(range(16))
+
+
+@pytest.fixture(scope="session")
+def app():
+    from qtpy.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,55 @@
+from array import array
+
+import pytest
+
+from PyQtSerializer import Serializer
+from conftest import KEY
+
+FORMATS = ("JSON", "YAML", "PICKLE", "BINARY")
+
+
+def _arrays() -> dict:
+    values = array("d", [0.5, -1.0, 2.25, 3.0, 4.5, -6.0])
+    return {
+        "array": array("i", [1, -2, 3]),
+        "empty": array("q"),
+        "memoryview": memoryview(values).cast("B").cast("d", [2, 3]),
+    }
+
+
+@pytest.mark.parametrize("saveFormat", FORMATS)
+@pytest.mark.parametrize("encrypt", (False, True))
+def test_arrays(tmp_path, saveFormat, encrypt):
+    data = _arrays()
+    filePath = str(tmp_path / f"arrays.{saveFormat.lower()}")
+    flags = dict(key=KEY, encryptNumbers=encrypt, encryptDictNames=encrypt)
+    Serializer(data, saveFormat, serializeData=True, **flags).Serialize(filePath)
+    result = Serializer(None, saveFormat, **flags).Deserialize(
+        filePath, deserializeData=True, isEncrypted=encrypt
+    )
+    assert result["array"] == data["array"]
+    assert result["empty"] == data["empty"]
+    assert isinstance(result["memoryview"], memoryview)
+    assert result["memoryview"].shape == (2, 3)
+    assert result["memoryview"].tolist() == data["memoryview"].tolist()
+
+
+@pytest.mark.parametrize("saveFormat", FORMATS)
+def test_numpyArrays(tmp_path, saveFormat):
+    numpy = pytest.importorskip("numpy")
+    data = {
+        "matrix": numpy.arange(12, dtype=">f4").reshape(3, 4),
+        "complex": numpy.array([1 + 2j, -3j]),
+    }
+    filePath = str(tmp_path / f"arrays.{saveFormat.lower()}")
+    Serializer(data, saveFormat, serializeData=True, key=KEY, encryptNumbers=True).Serialize(
+        filePath
+    )
+    result = Serializer(None, saveFormat, key=KEY, encryptNumbers=True).Deserialize(
+        filePath, deserializeData=True, isEncrypted=True
+    )
+    for name, value in data.items():
+        assert result[name].dtype == value.dtype
+        assert (result[name] == value).all()
+    # Writable like the arrays it was saved from
+    result["matrix"][0, 0] = 1
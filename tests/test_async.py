@@ -0,0 +1,50 @@
+import time
+
+from qtpy.QtWidgets import QWidget
+
+from PyQtSerializer import PyQtSerializer
+from conftest import KEY
+
+
+def _serializer(tmp_path) -> PyQtSerializer:
+    root = QWidget()
+    root.setObjectName("root")
+    return PyQtSerializer(
+        KEY, target=root, savePath=str(tmp_path / "state.json"), saveFormat="JSON"
+    )
+
+
+def _loadedValue(tmp_path, name: str):
+    serializer = _serializer(tmp_path)
+    serializer.load()
+    return serializer.getValue(name)
+
+
+def test_snapshot(app, tmp_path):
+    """A save on the background thread writes the settings as they were when dumpAsync was called"""
+    serializer = _serializer(tmp_path)
+    items = [1, 2]
+    serializer.setValue("items", items)
+    with serializer._saveLock:
+        # The save waits for the lock, after the snapshot was taken
+        future = serializer.dumpAsync()
+        items.append(3)
+    assert future.result(timeout=30) == serializer.savePath
+    assert _loadedValue(tmp_path, "items") == [1, 2]
+
+
+def test_coalescing(app, tmp_path):
+    """Calls made while a save is queued share its future and the last call's state is saved"""
+    serializer = _serializer(tmp_path)
+    with serializer._saveLock:
+        serializer.setValue("value", 1)
+        running = serializer.dumpAsync()
+        while not running.running():
+            time.sleep(0.01)
+        serializer.setValue("value", 2)
+        queued = serializer.dumpAsync()
+        serializer.setValue("value", 3)
+        assert serializer.dumpAsync() is queued
+        assert queued is not running
+    assert running.result(timeout=30) == queued.result(timeout=30)
+    assert _loadedValue(tmp_path, "value") == 3
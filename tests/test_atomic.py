@@ -0,0 +1,62 @@
+import os
+import stat
+from unittest import mock
+
+import pytest
+
+from PyQtSerializer import Atomic
+from PyQtSerializer.Atomic import atomicWrite
+
+
+@pytest.mark.parametrize("fsync, synced", (("ALWAYS", True), ("ON_CLOSE", True), ("NEVER", False)))
+def test_syncedBeforeReplace(tmp_path, fsync, synced):
+    """Only "NEVER" can move a file over the old one before its data is on disk"""
+    filePath = str(tmp_path / "state.json")
+    events = []
+    realFsync, realReplace = os.fsync, os.replace
+    with mock.patch("os.fsync", side_effect=lambda fd: events.append("fsync") or realFsync(fd)):
+        with mock.patch(
+            "os.replace", side_effect=lambda *args: events.append("replace") or realReplace(*args)
+        ):
+            with atomicWrite(filePath, "w", fsync) as saveFile:
+                saveFile.write("{}")
+    assert events[: 2 if synced else 1] == (["fsync", "replace"] if synced else ["replace"])
+    with open(filePath) as saveFile:
+        assert saveFile.read() == "{}"
+
+
+def test_tempFiles(tmp_path):
+    filePath = str(tmp_path / "state.json")
+    with atomicWrite(filePath, "w") as first, atomicWrite(filePath, "w") as second:
+        # Concurrent writers of the same file get their own temp file
+        assert first.name != second.name
+        first.write("first")
+        second.write("second")
+    with open(filePath) as saveFile:
+        assert saveFile.read() == "first"
+    with pytest.raises(RuntimeError):
+        with atomicWrite(filePath, "w") as saveFile:
+            saveFile.write("partial")
+            raise RuntimeError
+    with open(filePath) as saveFile:
+        assert saveFile.read() == "first"
+    assert os.listdir(tmp_path) == ["state.json"]
+
+
+def test_permissions(tmp_path):
+    filePath = str(tmp_path / "state.json")
+    umask = os.umask(0o027)
+    try:
+        # Read without being changed
+        assert Atomic._currentUmask() == 0o027
+        assert Atomic._currentUmask() == 0o027
+        with atomicWrite(filePath, "w") as saveFile:
+            saveFile.write("{}")
+    finally:
+        os.umask(umask)
+    # A new file gets the permissions open() would give it, not mkstemp's private ones
+    assert stat.S_IMODE(os.stat(filePath).st_mode) == 0o640
+    os.chmod(filePath, 0o600)
+    with atomicWrite(filePath, "w") as saveFile:
+        saveFile.write("{}")
+    assert stat.S_IMODE(os.stat(filePath).st_mode) == 0o600
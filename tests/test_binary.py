@@ -0,0 +1,48 @@
+import pytest
+
+from PyQtSerializer.Binary import MAGIC, VERSION, encodeBinary, decodeBinary
+from conftest import KEY
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def _data() -> dict:
+    point = Point(1, "one")
+    return {
+        "name": "widget",
+        "values": [1, -2.5, True, None, b"\x00\x01", ("a", "a"), {3}],
+        "points": [point, point],
+        "nested": {"long": "x" * 300, "count": 1 << 70},
+    }
+
+
+@pytest.mark.parametrize("cipher", ("BLOWFISH", "AES-GCM"))
+@pytest.mark.parametrize("encrypt", (False, True))
+def test_truncated(cipher, encrypt):
+    """Every cut of the data raises ValueError instead of IndexError or returning part of it"""
+    encoded = encodeBinary(
+        _data(),
+        KEY,
+        usePickleForClasses=False,
+        encryptStdDataTypes=encrypt,
+        encryptDictNames=encrypt,
+        encryptStrings=encrypt,
+        encryptNumbers=encrypt,
+        cipher=cipher,
+        internStrings=True,
+    )
+    decodeBinary(encoded, KEY)
+    for end in range(len(encoded)):
+        with pytest.raises(ValueError):
+            decodeBinary(encoded[:end], KEY)
+
+
+def test_version():
+    encoded = encodeBinary([1, 2], KEY)
+    assert encoded[: len(MAGIC) + 1] == MAGIC + bytes((VERSION,))
+    with pytest.raises(ValueError, match="Unsupported Binary Format Version"):
+        decodeBinary(MAGIC + bytes((VERSION + 1,)) + encoded[len(MAGIC) + 1 :], KEY)
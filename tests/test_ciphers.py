@@ -0,0 +1,84 @@
+import io
+
+import pytest
+
+from PyQtSerializer import serialize, deserialize, IntegrityError
+from PyQtSerializer.Document import DocumentWriter, decryptDocument
+from PyQtSerializer.utils import Encrypt, EncryptBatch, getCipher
+from conftest import KEY
+
+PLAIN_TEXTS = {
+    "hash": "$2b$12$R9h/cIPz0gi.URNNX3kh2OPST9/PgBkqquzi.Ss7KIUgO2t0jWMUW",
+    "price": "$1 off",
+    "prefix": "$1",
+}
+
+
+@pytest.mark.parametrize("cipher", ("BLOWFISH", "AES-GCM", "CHACHA20-POLY1305"))
+def test_plainTextWithCipherPrefix(cipher):
+    """Unencrypted values that start like authenticated ciphertext load as they are"""
+    data = serialize({"name": "value"}, key=KEY, cipher=cipher, encryptDictNames=False)
+    data.update(PLAIN_TEXTS)
+    result = deserialize(data, isEncrypted=True, decryptionKey=KEY)
+    assert result == {"name": "value", **PLAIN_TEXTS}
+
+
+@pytest.mark.parametrize("cipher", ("AES-GCM", "CHACHA20-POLY1305"))
+def test_modifiedCipherText(cipher):
+    data = serialize({"name": "value"}, key=KEY, cipher=cipher, encryptDictNames=False)
+    text = data["name"]
+    data["name"] = text[:-3] + ("B" if text[-3] == "A" else "A") + text[-2:]
+    with pytest.raises(IntegrityError):
+        deserialize(data, isEncrypted=True, decryptionKey=KEY)
+
+
+@pytest.mark.parametrize("cipher", ("BLOWFISH", "AES-GCM", "CHACHA20-POLY1305"))
+def test_documentNonces(cipher):
+    """Every document gets its own keystream, E.g. the journal records of one session"""
+    documents = set()
+    for _ in range(64):
+        fileObj = io.BytesIO()
+        with DocumentWriter(fileObj, "JSON", KEY, cipher) as writer:
+            writer.write(b"\0" * 64)
+        document = fileObj.getvalue()
+        assert decryptDocument(document, "JSON", KEY) == b"\0" * 64
+        documents.add(document[-64 - getCipher(cipher, KEY).tagSize :])
+    assert len(documents) == 64
+
+
+class _Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+@pytest.mark.parametrize("usePickleForClasses", (False, True))
+@pytest.mark.parametrize("tagged", (False, True))
+def test_batchEncryption(usePickleForClasses, tagged):
+    """Batched Blowfish leaves are the same ciphertext as leaves encrypted one at a time"""
+    data = {
+        "text": "value",
+        # Block aligned, empty and multi-block values
+        "aligned": ["12345678", "", "1234567812345678", 12345678],
+        "numbers": [1, -2.5, 10**20, True, None],
+        "12345678": {"nested": ("a", "b")},
+        "point": _Point(1, "y"),
+    }
+    options = dict(key=KEY, usePickleForClasses=usePickleForClasses, tagged=tagged)
+    assert serialize(data, batchEncryption=True, **options) == serialize(
+        data, batchEncryption=False, **options
+    )
+
+
+def test_blowfishPadding():
+    """Every Blowfish path pads like `Encrypt`, a block aligned value gets a whole block"""
+    cipher = getCipher("BLOWFISH", KEY)
+    values = [b"", b"1234567", b"12345678", b"123456789", bytes(16)]
+    encrypted = [cipher.encrypt(value) for value in values]
+    assert [len(value) for value in encrypted] == [8, 8, 16, 16, 24]
+    assert [bytes(value) for value in cipher.encryptMany(values)] == encrypted
+    assert [cipher.encryptedSize(len(value)) for value in values] == [8, 8, 16, 16, 24]
+    assert EncryptBatch(values, KEY) == [Encrypt(value, KEY)[0] for value in values]
+    assert [bytes(value) for value in cipher.decryptMany(encrypted)] == [
+        value + (8 - len(value) % 8) * b"\0" for value in values
+    ]
@@ -0,0 +1,84 @@
+import pytest
+
+from PyQtSerializer import serialize, deserialize
+from PyQtSerializer.Serialize import COLUMNS_KEY, TAG, COLUMNS_MARKER
+from conftest import KEY
+
+PLAIN = dict(
+    encryptStdDataTypes=False, encryptDictNames=False, encryptStrings=False, encryptNumbers=False
+)
+
+
+class Row:
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+
+
+def _rows() -> list:
+    return [
+        {
+            "id": index,
+            "name": f"row {index}",
+            "enabled": index % 2 == 0,
+            "size": index / 2,
+            "note": None,
+        }
+        for index in range(6)
+    ]
+
+
+def _isColumnar(serializedData, tagged: bool) -> bool:
+    return isinstance(serializedData, dict) and (
+        next(iter(serializedData)) == (TAG + COLUMNS_MARKER if tagged else COLUMNS_KEY)
+    )
+
+
+@pytest.mark.parametrize("tagged", (False, True))
+@pytest.mark.parametrize("encrypt", (False, True))
+def test_columnarRows(tagged, encrypt):
+    """Same-shaped dicts are written as one list per column and read back as the rows"""
+    flags = {} if encrypt else PLAIN
+    serializedData = serialize(_rows(), key=KEY, columnar=True, tagged=tagged, **flags)
+    if not (encrypt and not tagged):
+        # The marker key is only readable when it isn't encrypted
+        assert _isColumnar(serializedData, tagged)
+    result = deserialize(
+        serializedData, isEncrypted=encrypt, decryptionKey=KEY, parseDigits=True, tagged=tagged
+    )
+    if tagged:
+        assert result == _rows()
+    else:
+        # Without tags encrypted values only come back as numbers when they are digits
+        assert [row["name"] for row in result] == [row["name"] for row in _rows()]
+        assert [int(row["id"]) for row in result] == list(range(6))
+
+
+@pytest.mark.parametrize("tagged", (False, True))
+def test_columnarObjects(tagged):
+    rows = [Row(index, f"row {index}") for index in range(5)]
+    options = dict(
+        key=KEY, usePickleForClasses=False, initObjects=True, columnar=True, tagged=tagged
+    )
+    result = deserialize(
+        serialize(rows, **options),
+        isEncrypted=True,
+        decryptionKey=KEY,
+        classDict={"Row": Row},
+        initObjects=True,
+        parseDigits=True,
+        tagged=tagged,
+    )
+    assert [type(row) for row in result] == [Row] * 5
+    assert [(row.id, row.name) for row in result] == [
+        (index, f"row {index}") for index in range(5)
+    ]
+
+
+def test_notColumnar():
+    """Rows of other shapes, nested values or too few rows are written as they are"""
+    rows = _rows()
+    for data in (rows[:2], rows[:5] + [{"id": 5}], [{**row, "nested": [1]} for row in rows]):
+        serializedData = serialize(data, key=KEY, columnar=True, **PLAIN)
+        assert not _isColumnar(serializedData, False)
+        assert deserialize(serializedData) == data
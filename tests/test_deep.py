@@ -0,0 +1,52 @@
+import io
+import json
+
+from PyQtSerializer.Binary import encodeBinary, decodeBinary
+from PyQtSerializer.Stream import JsonStreamWriter
+from conftest import KEY
+
+DEPTH = 100000
+
+
+def _deepTree() -> list:
+    data = []
+    for _ in range(DEPTH):
+        data = [{"value": data}]
+    return data
+
+
+def _depth(data) -> int:
+    depth = 0
+    while data:
+        data = data[0]["value"]
+        depth += 1
+    return depth
+
+
+def test_deepBinary():
+    """Nesting deeper than the recursion limit is written and read back"""
+    assert _depth(decodeBinary(encodeBinary(_deepTree(), KEY), KEY)) == DEPTH
+
+
+def test_deepJsonStream():
+    fileObj = io.StringIO()
+    JsonStreamWriter(
+        KEY,
+        encryptStdDataTypes=False,
+        encryptDictNames=False,
+        encryptStrings=False,
+        encryptNumbers=False,
+    ).write(_deepTree(), fileObj)
+    text = fileObj.getvalue()
+    assert text.startswith('[{"value": [{"value": ')
+    assert text.endswith("[]" + "}]" * DEPTH)
+    # Same text as json.dumps for a tree it can still handle
+    fileObj = io.StringIO()
+    JsonStreamWriter(
+        KEY,
+        encryptStdDataTypes=False,
+        encryptDictNames=False,
+        encryptStrings=False,
+        encryptNumbers=False,
+    ).write({"a": [1, (2, {"b": None})], "c": {}}, fileObj)
+    assert fileObj.getvalue() == json.dumps({"a": [1, (2, {"b": None})], "c": {}})
@@ -0,0 +1,43 @@
+import mmap
+
+import pytest
+
+from PyQtSerializer import Serializer
+from PyQtSerializer.Indexed import IndexedFile
+from conftest import KEY
+
+
+def _data() -> dict:
+    return {
+        "settings": {f"group{group}": {f"name{index}": index for index in range(5)} for group in range(3)},
+        "recent": [[f"file{index}", index] for index in range(5)],
+    }
+
+
+@pytest.mark.parametrize("saveFormat", ("JSON", "YAML", "PICKLE"))
+def test_savedOverLazyData(tmp_path, saveFormat):
+    """The map of a lazily loaded file is closed before the file is replaced, its values still read"""
+    filePath = str(tmp_path / f"state.{saveFormat.lower()}")
+    serializer = Serializer(_data(), saveFormat, serializeData=True, key=KEY, indexed=True)
+    serializer.Serialize(filePath)
+    lazyData = serializer.Deserialize(filePath, deserializeData=True, lazy=True)
+    indexedFile = next(iter(serializer._indexedFiles[filePath]))
+    assert isinstance(indexedFile._map, mmap.mmap)
+    assert lazyData["settings"]["group0"]["name1"] == 1
+    serializer.data = serializer._serializeData({"saved": "over"})
+    serializer.Serialize(filePath)
+    assert not isinstance(indexedFile._map, mmap.mmap)
+    assert lazyData["settings"]["group2"]["name4"] == 4
+    assert lazyData["recent"][3] == ["file3", 3]
+    assert serializer.Deserialize(filePath, deserializeData=True) == {"saved": "over"}
+
+
+def test_contextManager(tmp_path):
+    filePath = str(tmp_path / "state.json")
+    Serializer(_data(), "JSON", serializeData=True, key=KEY, indexed=True).Serialize(filePath)
+    with IndexedFile(filePath, "JSON") as indexedFile:
+        fileMap = indexedFile._map
+        assert indexedFile.load()["recent"][0] == ["file0", 0]
+    assert fileMap.closed
+    # Closing twice is fine
+    indexedFile.close()
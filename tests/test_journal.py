@@ -0,0 +1,61 @@
+import os
+from pickle import dumps
+
+import pytest
+from qtpy.QtWidgets import QWidget
+
+from PyQtSerializer import PyQtSerializer
+from PyQtSerializer.Journal import appendRecord, readRecords
+from conftest import KEY
+
+FORMATS = (("JSON", False), ("YAML", False), ("PICKLE", False), ("PICKLE", True), ("BINARY", False))
+
+
+@pytest.mark.parametrize("saveFormat, hex", FORMATS)
+def test_tornRecord(tmp_path, saveFormat, hex):
+    """A record cut off by a crash is dropped and the next one is appended after the last whole one"""
+    filePath = str(tmp_path / "state.journal")
+    records = [[{"_settings": {"value": index}}] for index in range(3)]
+    if saveFormat == "BINARY":
+        records = [dumps(record) for record in records]
+    for record in records:
+        size = appendRecord(record, filePath, saveFormat, hex)
+    with open(filePath, "r+b") as journalFile:
+        journalFile.truncate(size - 3)
+    assert readRecords(filePath, saveFormat, hex) == records[:2]
+    appendRecord(records[2], filePath, saveFormat, hex)
+    assert readRecords(filePath, saveFormat, hex) == records
+
+
+@pytest.mark.parametrize("saveFormat", ("JSON", "YAML", "PICKLE", "BINARY"))
+def test_journalOfReplacedFile(app, tmp_path, saveFormat):
+    """A journal left over when the process dies between a full dump and removing it isn't replayed"""
+    root = QWidget()
+    root.setObjectName("root")
+    serializer = PyQtSerializer(
+        KEY,
+        target=root,
+        savePath=str(tmp_path / f"state.{saveFormat.lower()}"),
+        saveFormat=saveFormat,
+        Hex=saveFormat == "PICKLE",
+        deserializeData=True,
+        isEncrypted=True,
+        journal=True,
+        journalMaxRecords=1,
+    )
+    serializer.setValue("value", 1)
+    serializer.dump()
+    serializer.setValue("value", 2)
+    serializer.dump()
+    journalPath = serializer._journalPath()
+    with open(journalPath, "rb") as journalFile:
+        journal = journalFile.read()
+    serializer.setValue("value", 3)
+    # Over journalMaxRecords, the full state is written and the journal removed
+    serializer.dump()
+    assert not os.path.exists(journalPath)
+    with open(journalPath, "wb") as journalFile:
+        journalFile.write(journal)
+    serializer.load()
+    assert serializer.getValue("value") == 3
+    assert not os.path.exists(journalPath)
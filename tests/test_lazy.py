@@ -0,0 +1,56 @@
+import pytest
+
+from PyQtSerializer import serialize, deserialize, materialize, IntegrityError
+from PyQtSerializer.Serialize import LazyDict, LazyList
+from conftest import KEY
+
+DATA = {
+    "name": "value",
+    "numbers": [1, 20, 300],
+    "nested": {"list": [{"a": "b"}, ("c", "d")], "empty": {}},
+    "missing": None,
+}
+
+
+@pytest.mark.parametrize("tagged", (False, True))
+@pytest.mark.parametrize("encryptDictNames", (False, True))
+def test_lazyRoundTrip(tagged, encryptDictNames):
+    """A lazy result reads back the same values as an eager one"""
+    serializedData = serialize(DATA, key=KEY, tagged=tagged, encryptDictNames=encryptDictNames)
+    options = dict(isEncrypted=True, decryptionKey=KEY, parseDigits=True, tagged=tagged)
+    result = deserialize(serializedData, lazy=True, **options)
+    assert isinstance(result, LazyDict)
+    assert isinstance(result["nested"], LazyDict)
+    assert isinstance(result["numbers"], LazyList)
+    assert result["nested"]["list"][0]["a"] == "b"
+    assert result["numbers"][1] == 20
+    assert "missing" in result
+    assert "other" not in result
+    assert materialize(result) == deserialize(serializedData, **options)
+
+
+def test_onDemandDecryption():
+    """Only the values that are read get decrypted, a modified one only fails once it is read"""
+    serializedData = serialize(DATA, key=KEY, cipher="AES-GCM", encryptDictNames=False)
+    text = serializedData["numbers"][0]
+    serializedData["numbers"][0] = text[:-3] + ("B" if text[-3] == "A" else "A") + text[-2:]
+    result = deserialize(serializedData, isEncrypted=True, decryptionKey=KEY, lazy=True)
+    assert result["name"] == "value"
+    assert result["numbers"][2] == "300"
+    with pytest.raises(IntegrityError):
+        result["numbers"][0]
+
+
+def test_lazyChanges():
+    result = deserialize(
+        serialize(DATA, key=KEY), isEncrypted=True, decryptionKey=KEY, parseDigits=True, lazy=True
+    )
+    result["name"] = "changed"
+    del result["missing"]
+    result["numbers"].append(4)
+    result["numbers"][0] = 0
+    assert materialize(result) == {
+        **{k: v for k, v in DATA.items() if k != "missing"},
+        "name": "changed",
+        "numbers": [0, 20, 300, 4],
+    }
@@ -0,0 +1,32 @@
+import pytest
+
+from PyQtSerializer import serialize, deserialize, parseLiteral, Encrypt
+from conftest import KEY
+
+
+@pytest.mark.parametrize(
+    "value",
+    (0, -12, 10**30, 2.5, -1e-300, True, False, None, "text", b"\x00", [1, "a"], (1,), {"a": {2}}),
+)
+def test_parseLiteral(value):
+    assert parseLiteral(repr(value)) == value
+
+
+@pytest.mark.parametrize("text", ("__import__('os').getcwd()", "[1, 2", "1 +", "x", ""))
+def test_malformedLiteral(text):
+    """Anything but a literal raises ValueError, no code is run"""
+    with pytest.raises(ValueError):
+        parseLiteral(text)
+
+
+def test_malformedColumn():
+    """An encrypted column that isn't a literal raises ValueError like the other literals"""
+    rows = [{"id": index} for index in range(4)]
+    serializedData = serialize(rows, key=KEY, columnar=True, encryptDictNames=False)
+    record = next(iter(serializedData.values()))
+    assert deserialize(serializedData, isEncrypted=True, decryptionKey=KEY) == [
+        {"id": index} for index in range(4)
+    ]
+    record[1][0] = Encrypt(b"[0, 1,", KEY)[0]
+    with pytest.raises(ValueError):
+        deserialize(serializedData, isEncrypted=True, decryptionKey=KEY)
@@ -0,0 +1,70 @@
+import pytest
+
+from PyQtSerializer import serialize, deserialize
+from PyQtSerializer.Binary import encodeBinary, decodeBinary
+from conftest import KEY
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class Label:
+    def __init__(self, text):
+        self.text = text
+
+
+def _points() -> list:
+    return [Point(1, 2), Label("a"), Point(3, 4), Label("b"), Point(5, 6)]
+
+
+def _assertPoints(result: list):
+    assert [type(value) for value in result] == [Point, Label, Point, Label, Point]
+    assert [(point.x, point.y) for point in result[::2]] == [(1, 2), (3, 4), (5, 6)]
+    assert [label.text for label in result[1::2]] == ["a", "b"]
+
+
+@pytest.mark.parametrize("tagged", (False, True))
+@pytest.mark.parametrize("lazy", (False, True))
+def test_paramsOncePerClass(tagged, lazy):
+    """The parameter names of a class are written with its first object, the others refer to it"""
+    flags = dict(
+        encryptStdDataTypes=False,
+        encryptDictNames=False,
+        encryptStrings=False,
+        encryptNumbers=False,
+        encryptCodeObjects=False,
+    )
+    serializedData = serialize(
+        _points(), key=KEY, usePickleForClasses=False, initObjects=True, tagged=tagged, **flags
+    )
+    records = [next(iter(record.values())) for record in serializedData]
+    params = [record[2] if tagged else record["params"] for record in records]
+    assert params[:2] == [["x", "y"], ["text"]]
+    assert all(isinstance(param, int) for param in params[2:])
+    result = deserialize(
+        serializedData,
+        classDict={"Point": Point, "Label": Label},
+        initObjects=True,
+        tagged=tagged,
+        lazy=lazy,
+    )
+    _assertPoints(list(result))
+
+
+def test_paramsOncePerClassEncrypted():
+    options = dict(key=KEY, usePickleForClasses=False, initObjects=True)
+    result = deserialize(
+        serialize(_points(), **options),
+        isEncrypted=True,
+        decryptionKey=KEY,
+        classDict={"Point": Point, "Label": Label},
+        initObjects=True,
+        parseDigits=True,
+    )
+    _assertPoints(result)
+    # Same schema references in BINARY
+    data = decodeBinary(encodeBinary(_points(), **options), KEY)
+    assert [next(iter(record)) for record in data] == ["Point", "Label"] * 2 + ["Point"]
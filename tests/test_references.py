@@ -0,0 +1,113 @@
+import pytest
+from qtpy.QtWidgets import QWidget
+
+from PyQtSerializer import PyQtSerializer, serialize, deserialize
+from conftest import KEY
+
+
+class Person:
+    def __init__(self, name):
+        self.name = name
+
+
+def _name(value) -> str:
+    if isinstance(value, Person):
+        return value.name
+    # Native objects are deserialized as their attributes
+    return value["name"] if "name" in value else value["Person"]["data"]["name"]
+
+
+@pytest.mark.parametrize("tagged", (False, True))
+@pytest.mark.parametrize("lazy", (False, True))
+@pytest.mark.parametrize("initObjects", (False, True))
+def test_separatelySerializedObjects(tagged, lazy, initObjects):
+    """Object ids only hold within one serialize call, values serialized apart must not resolve to each other's objects"""
+    alice, bob = Person("alice"), Person("bob")
+    options = dict(
+        usePickleForClasses=False, initObjects=initObjects, key=KEY, tagged=tagged
+    )
+    data = {
+        "a": serialize(alice, **options),
+        "b": serialize(bob, **options),
+        # Both are written with ids since each holds its object twice
+        "sharedA": serialize([alice, alice], **options),
+        "sharedB": serialize([bob, bob], **options),
+    }
+    result = deserialize(
+        data,
+        isEncrypted=True,
+        decryptionKey=KEY,
+        classDict={"Person": Person},
+        initObjects=initObjects,
+        tagged=tagged,
+        lazy=lazy,
+    )
+    for name in ("b", "a", "sharedB", "sharedA"):
+        value = result[name]
+        expected = "bob" if name.endswith(("b", "B")) else "alice"
+        if name.startswith("shared"):
+            assert value[0] is value[1]
+            assert _name(value[0]) == expected
+        else:
+            assert _name(value) == expected
+
+
+@pytest.mark.parametrize("saveFormat", ("JSON", "YAML", "PICKLE"))
+@pytest.mark.parametrize("lazyLoad", (False, True))
+def test_serializedSettings(app, tmp_path, saveFormat, lazyLoad):
+    root = QWidget()
+    root.setObjectName("root")
+    serializer = PyQtSerializer(
+        KEY,
+        target=root,
+        savePath=str(tmp_path / f"state.{saveFormat.lower()}"),
+        saveFormat=saveFormat,
+        Hex=saveFormat == "PICKLE",
+        usePickleForClasses=False,
+        deserializeData=True,
+        isEncrypted=True,
+        lazyLoad=lazyLoad,
+    )
+    serializer.setValue("a", Person("alice"), serializeValue=True)
+    serializer.setValue("b", Person("bob"), serializeValue=True)
+    serializer.dump()
+    serializer.load()
+    assert _name(serializer.getValue("b")) == "bob"
+    assert _name(serializer.getValue("a")) == "alice"
+
+
+@pytest.mark.parametrize("tagged", (False, True))
+@pytest.mark.parametrize("data", ("list", "dict"))
+def test_circularContainers(tagged, data):
+    """Only objects carry ids, a list or dict that contains itself is rejected"""
+    if data == "list":
+        value = [1]
+        value.append(value)
+    else:
+        value = {}
+        value["x"] = value
+    with pytest.raises(ValueError, match="Circular reference"):
+        serialize({"value": value}, usePickleForClasses=False, key=KEY, tagged=tagged)
+
+
+@pytest.mark.parametrize("tagged", (False, True))
+def test_cyclesThroughContainers(tagged):
+    """Lists and dicts on a cycle through an object are kept, the object is referred back to"""
+    alice = Person("alice")
+    alice.friends = [alice, {"self": alice}]
+    bob = [Person("bob")]
+    options = dict(usePickleForClasses=False, initObjects=True, key=KEY, tagged=tagged)
+    result = deserialize(
+        serialize({"alice": alice, "a": bob, "b": bob}, **options),
+        isEncrypted=True,
+        decryptionKey=KEY,
+        classDict={"Person": Person},
+        initObjects=True,
+        setAttrsAfterInit=True,
+        tagged=tagged,
+    )
+    alice = result["alice"]
+    assert alice.friends[0] is alice
+    assert alice.friends[1]["self"] is alice
+    # A shared list is written at each place, the object in it once
+    assert result["a"][0] is result["b"][0]
@@ -0,0 +1,44 @@
+import io
+
+import pytest
+
+from PyQtSerializer import serialize
+from PyQtSerializer.Binary import encodeBinary
+from PyQtSerializer.Stream import JsonStreamWriter
+from conftest import KEY
+
+
+def _cycles() -> list:
+    selfList = [1]
+    selfList.append(selfList)
+    selfDict = {}
+    selfDict["x"] = selfDict
+    nested = {"items": [1, {"back": None}]}
+    nested["items"][1]["back"] = nested["items"]
+    return [selfList, selfDict, nested]
+
+
+@pytest.mark.parametrize("data", _cycles())
+@pytest.mark.parametrize("tagged", (False, True))
+def test_circularContainers(data, tagged):
+    """A container that contains itself is rejected like json.dumps does instead of walked forever"""
+    with pytest.raises(ValueError, match="Circular reference"):
+        serialize(data, key=KEY, tagged=tagged)
+    with pytest.raises(ValueError, match="Circular reference"):
+        encodeBinary(data, KEY)
+    with pytest.raises(ValueError, match="Circular reference"):
+        JsonStreamWriter(KEY).write(data, io.StringIO())
+
+
+def test_sharedContainers():
+    """A container that is only shared, not in a cycle, is written at each place"""
+    shared = [1, 2]
+    result = serialize(
+        {"a": shared, "b": (shared, shared)},
+        encryptStdDataTypes=False,
+        encryptDictNames=False,
+        encryptStrings=False,
+        encryptNumbers=False,
+        key=KEY,
+    )
+    assert result == {"a": [1, 2], "b": ([1, 2], [1, 2])}
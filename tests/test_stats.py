@@ -0,0 +1,63 @@
+import os
+
+import pytest
+from qtpy.QtWidgets import QLineEdit, QWidget
+
+from PyQtSerializer import PyQtSerializer, Serializer, Stats
+from conftest import KEY
+
+ENCRYPT = dict(
+    encryptStdDataTypes=True, encryptDictNames=True, encryptStrings=True, encryptNumbers=True
+)
+
+
+@pytest.mark.parametrize("saveFormat", ("JSON", "YAML", "PICKLE", "BINARY"))
+def test_serializerStats(tmp_path, saveFormat):
+    """Every save and load reports its stages, encrypted values and bytes"""
+    reports = []
+    filePath = str(tmp_path / f"data.{saveFormat.lower()}")
+    data = {"names": ["a", "b", "c"], "value": 1}
+    serializer = Serializer(None, saveFormat, key=KEY, instrument=reports.append, **ENCRYPT)
+    serializer.StreamSerialize(data, filePath)
+    save = reports[-1]
+    assert isinstance(save, Stats) and save is serializer.lastStats
+    assert save.error is None
+    assert save.leavesEncrypted >= 5
+    assert save.bytesWritten == os.path.getsize(filePath)
+    assert {"encrypt", "write"} <= set(save.stages)
+    assert sum(save.stages.values()) <= save.seconds * 1.01 + 1e-3
+    serializer.Deserialize(filePath, deserializeData=True, isEncrypted=True)
+    load = reports[-1]
+    assert load.bytesRead == os.path.getsize(filePath)
+    assert {"read", "deserialize"} <= set(load.stages)
+    assert load.asDict()["operation"] == load.operation
+
+
+def test_failedLoadStats(tmp_path):
+    reports = []
+    serializer = Serializer(None, "JSON", key=KEY, instrument=reports.append)
+    with pytest.raises(OSError):
+        serializer.Deserialize(str(tmp_path / "missing.json"))
+    assert reports[-1].error == "FileNotFoundError"
+
+
+def test_widgetStats(app, tmp_path):
+    reports = []
+    root = QWidget()
+    root.setObjectName("root")
+    for index in range(3):
+        QLineEdit(root).setObjectName(f"edit{index}")
+    serializer = PyQtSerializer(
+        KEY,
+        target=root,
+        savePath=str(tmp_path / "state.json"),
+        saveFormat="JSON",
+        instrument=reports.append,
+    )
+    serializer.dump()
+    assert reports[-1].widgets == 4
+    assert {"findChildren", "serializeWidget", "write"} <= set(reports[-1].stages)
+    serializer.load()
+    # The children, the target itself is only given its geometry
+    assert reports[-1].widgets == 3
+    assert "restore" in reports[-1].stages
@@ -0,0 +1,58 @@
+import json
+import os
+import pickle
+
+import pytest
+
+from PyQtSerializer import Serializer
+from PyQtSerializer.Serialize import STRINGS_KEY, STRING_REF, internStrings, externStrings
+from conftest import KEY
+
+
+def _records() -> list:
+    return [
+        {"objectName": f"widget{index}", "text": f"text {index % 3}", "size": [index, 30]}
+        for index in range(20)
+    ]
+
+
+def test_internStrings():
+    """Every string is saved once in the table and comes back in place"""
+    data = {"a": ["x", "x", ("x", "#0")], "b": {"a": "y"}, "c": 1}
+    interned = internStrings(data)
+    table, strings = interned[STRINGS_KEY]
+    assert sorted(strings) == ["#0", "a", "b", "c", "x", "y"]
+    assert all(name[:1] == STRING_REF for name in table)
+    x = STRING_REF + str(strings.index("x"))
+    assert table[STRING_REF + str(strings.index("a"))][:2] == [x, x]
+    assert externStrings(interned) == data
+    assert externStrings(interned, inPlace=True) == data
+    assert interned[STRINGS_KEY][0] == data
+    # Data without a table is returned as it is
+    assert externStrings(data) is data
+
+
+@pytest.mark.parametrize("saveFormat", ("JSON", "YAML", "PICKLE"))
+@pytest.mark.parametrize("cipher", ("BLOWFISH", "AES-GCM"))
+def test_internStringsFile(tmp_path, saveFormat, cipher):
+    data = _records()
+    flags = dict(encryptDictNames=True, encryptStrings=True, key=KEY, tagged=True, cipher=cipher)
+    filePath = os.path.join(tmp_path, "data")
+    serializer = Serializer(None, saveFormat, internStrings=True, **flags)
+    serializer.StreamSerialize(data, filePath)
+    assert serializer.Deserialize(filePath, deserializeData=True) == data
+    if saveFormat == "JSON":
+        with open(filePath, "r", encoding="utf-8") as file:
+            table, strings = json.load(file)[STRINGS_KEY]
+        # Each encrypted name is saved once, as a reference in every record
+        assert len(strings) == len(set(strings))
+        assert len({len(record) for record in table}) == 1
+        assert len(strings) < 20 * 3
+    elif saveFormat == "PICKLE":
+        with open(filePath, "rb") as file:
+            assert isinstance(pickle.load(file), list)
+    # Same data as the non streamed save
+    Serializer(data, saveFormat, serializeData=True, internStrings=True, **flags).Serialize(
+        filePath
+    )
+    assert serializer.Deserialize(filePath, deserializeData=True) == data
@@ -0,0 +1,63 @@
+import pytest
+
+from PyQtSerializer import serialize, deserialize
+from PyQtSerializer.Serialize import TAG
+from conftest import KEY
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def _double(value):
+    return value * 2
+
+
+DATA = {
+    "text": "value",
+    "digits": "123",
+    "tagged": TAG + "text",
+    "numbers": [1, -2, 2.5, 10**30],
+    "flags": [True, False, None],
+    "bytes": b"\x00\xff",
+    "tuple": (1, "a"),
+    "set": {1, 2},
+    1: "integer key",
+}
+
+
+@pytest.mark.parametrize("cipher", ("BLOWFISH", "AES-GCM"))
+@pytest.mark.parametrize("encrypt", (False, True))
+def test_taggedTypes(cipher, encrypt):
+    """Values come back with their type without parseDigits, strings that look like numbers or tags included"""
+    flags = dict(
+        encryptStdDataTypes=encrypt,
+        encryptDictNames=encrypt,
+        encryptStrings=encrypt,
+        encryptNumbers=encrypt,
+    )
+    serializedData = serialize(DATA, key=KEY, cipher=cipher, tagged=True, **flags)
+    result = deserialize(serializedData, isEncrypted=True, decryptionKey=KEY, tagged=True)
+    assert result == DATA
+    assert type(result["tuple"]) is tuple
+
+
+@pytest.mark.parametrize("usePickleForClasses", (False, True))
+def test_taggedObjects(usePickleForClasses):
+    data = {"point": Point(1, "y"), "function": _double}
+    serializedData = serialize(
+        data, key=KEY, usePickleForClasses=usePickleForClasses, initObjects=True, tagged=True
+    )
+    result = deserialize(
+        serializedData,
+        isEncrypted=True,
+        decryptionKey=KEY,
+        classDict={"Point": Point},
+        initObjects=True,
+        tagged=True,
+    )
+    assert isinstance(result["point"], Point)
+    assert (result["point"].x, result["point"].y) == (1, "y")
+    assert result["function"](4) == 8
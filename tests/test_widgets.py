@@ -0,0 +1,124 @@
+from operator import methodcaller
+
+from qtpy.QtCore import QObject
+from qtpy.QtGui import QStandardItem, QStandardItemModel
+from qtpy.QtWidgets import (
+    QLabel,
+    QLineEdit,
+    QTableView,
+    QTableWidget,
+    QTableWidgetItem,
+    QWidget,
+)
+
+from PyQtSerializer import PyQtSerializer
+from PyQtSerializer.Widgets import (
+    extractWidget,
+    indexWidgets,
+    registerExtractor,
+    restoreWidget,
+)
+from conftest import KEY
+
+
+def _widget(name: str, parent: QWidget = None) -> QWidget:
+    widget = QWidget(parent)
+    widget.setObjectName(name)
+    return widget
+
+
+def test_duplicateNames(app):
+    """A repeated objectName resolves to the same widget as findChild"""
+    root = _widget("root")
+    first = _widget("first", root)
+    _widget("name", _widget("inner", first))
+    _widget("other", first)
+    second = _widget("second", root)
+    _widget("name", second)
+    _widget("other", _widget("inner", second))
+    _widget("name", root)
+    index = indexWidgets(root)
+    for name in ("name", "other", "inner"):
+        assert index[name] is root.findChild(QObject, name)
+    assert index["first"] is first
+    assert index["second"] is second
+
+
+def _tableModel(texts: list) -> QStandardItemModel:
+    model = QStandardItemModel(len(texts), 1)
+    for row, text in enumerate(texts):
+        model.setItem(row, 0, QStandardItem(text))
+    return model
+
+
+def _tableTexts(view: QTableView) -> list:
+    model = view.model()
+    return [model.index(row, 0).data() for row in range(model.rowCount())]
+
+
+def _tableWindow(texts: list) -> QWidget:
+    root = _widget("root")
+    view = QTableView(root)
+    view.setObjectName("table")
+    view.setModel(_tableModel(texts))
+    return root
+
+
+def test_replacedModel(app, tmp_path):
+    """An incremental dump saves the model set with setModel(), not the first one it saw"""
+    savePath = str(tmp_path / "state.json")
+    root = _tableWindow(["m0", "m1", "m2"])
+    serializer = PyQtSerializer(
+        KEY, target=root, savePath=savePath, saveFormat="JSON", incrementalDump=True
+    )
+    serializer.dump()
+    view = root.findChild(QTableView, "table")
+    view.setModel(_tableModel(["n0", "n1"]))
+    serializer.dump()
+    # Edits of the new model mark the view changed
+    view.model().item(0, 0).setText("edited")
+    serializer.dump()
+    restored = _tableWindow(["old", "old", "old"])
+    PyQtSerializer(KEY, target=restored, savePath=savePath, saveFormat="JSON").load()
+    assert _tableTexts(restored.findChild(QTableView, "table")) == ["edited", "n1"]
+
+
+class _UpperLineEdit(QLineEdit):
+    pass
+
+
+class _UpperLineEditChild(_UpperLineEdit):
+    pass
+
+
+def test_classSetter(app):
+    """A setter registered for a class only restores that class and its subclasses"""
+    registerExtractor(
+        _UpperLineEdit,
+        "setText",
+        methodcaller("text"),
+        lambda widget, value: widget.setText(value.upper()),
+    )
+    widgets = [_UpperLineEdit(), _UpperLineEditChild(), QLineEdit(), QLabel()]
+    for widget in widgets:
+        restoreWidget(widget, {"setText": "text"})
+    assert [widget.text() for widget in widgets] == ["TEXT", "TEXT", "text", "text"]
+
+
+def test_tableModelData(app):
+    """Tables are restored to the saved grid, rows and columns beyond it are removed"""
+    table = QTableWidget(2, 2)
+    table.setItem(0, 0, QTableWidgetItem("a"))
+    table.setItem(1, 1, QTableWidgetItem("d"))
+    saved = extractWidget(table)["setTableModelData"]
+    assert saved == {"rowCount": 2, "columns": [["a", None], [None, "d"]]}
+    restoredTable = QTableWidget(3, 3)
+    restoredTable.setItem(2, 2, QTableWidgetItem("stale"))
+    restoreWidget(restoredTable, {"setTableModelData": saved})
+    assert extractWidget(restoredTable)["setTableModelData"] == saved
+    view = QTableView()
+    view.setModel(QStandardItemModel(3, 3))
+    view.model().setItem(2, 0, QStandardItem("m2"))
+    restoreWidget(view, {"setTableModelData": saved})
+    assert (view.model().rowCount(), view.model().columnCount()) == (2, 2)
+    assert extractWidget(view)["setTableModelData"] == saved
@@ -0,0 +1,22 @@
+import io
+
+import yaml
+
+from PyQtSerializer.Yaml import dumpYaml
+
+
+class _Point:
+    def __init__(self, x: int = 0):
+        self.x = x
+
+
+def test_fallbackWritesOnce():
+    """Data the safe dumper can't represent is written once, by the full dumper"""
+    data = {"name": "value", "points": [_Point(1), _Point(2)]}
+    stream = io.StringIO()
+    assert dumpYaml(data, stream) is None
+    text = stream.getvalue()
+    assert text == dumpYaml(data)
+    assert text.count("name: value") == 1
+    result = yaml.unsafe_load(text)
+    assert [point.x for point in result["points"]] == [1, 2]